@@ -32,7 +32,7 @@ os.environ.setdefault("ENVIRONMENT", "production")
 os.environ.setdefault("STORE_BACKEND", "firebase")
 
 from src.fetcher import fetch_fda_recalls, fetch_usda_recalls
-from src.store import init_db, save_if_new, cleanup
+from src.store import init_db, save_many, cleanup
 from src.models import init_models_db, get_all_users, get_pantry, create_alert
 from src.agent import parse_recall, match_pantry, generate_alert
 from src.notifier import notify_users
@@ -88,11 +88,7 @@ def poll_recalls(event, context):
         all_items = fda_items + usda_items
         logger.info("Fetched %d FDA + %d USDA recalls", len(fda_items), len(usda_items))
 
-        new_recalls = []
-        for item in all_items:
-            saved = save_if_new(item)
-            if saved:
-                new_recalls.append((item, saved))
+        new_recalls = save_many(all_items)
 
         if not new_recalls:
             logger.info("No new recalls this cycle.")
@@ -107,7 +103,7 @@ def poll_recalls(event, context):
             return {"status": "ok", "new_recalls": len(new_recalls), "alerted_users": 0}
 
         alert_count = 0
-        for recall_record, saved_obj in new_recalls:
+        for recall_record, _ in new_recalls:
             parsed = parse_recall(recall_record)
             logger.info("Parsed recall: %s", parsed.get("products", [])[:2])
 
@@ -0,0 +1,121 @@
+"""Offline benchmark suite for the recall fetchers.
+
+Record real responses once, then replay them as often as needed:
+
+    python scripts/bench_fetchers.py --record          # live run, saves fixtures
+    python scripts/bench_fetchers.py                   # replay from fixtures
+    python scripts/bench_fetchers.py --full            # include full-history crawls
+
+For every fetch function it reports wall time, HTTP pages/sec, records/sec,
+mean parse time per page and peak Python memory (tracemalloc).  Fixtures
+live in HTTP_FIXTURES_DIR (default fixtures/http).  Requests whose URL
+embeds today's date (incremental and date-sliced openFDA windows) only
+replay on the day they were recorded; they show up as misses.
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Measure the fetchers themselves: no disk cache in between, and parsing on
+# this process so its time can be attributed.
+os.environ["HTTP_CACHE_ENABLED"] = "false"
+os.environ.setdefault("USDA_PARSE_PROCESSES", "0")
+
+from src import fetcher, http_client, parsers  # noqa: E402
+
+_counters = {"pages": 0, "misses": 0, "parse_seconds": 0.0, "parsed_pages": 0}
+
+
+def _count_requests(get):
+    def wrapper(*args, **kwargs):
+        _counters["pages"] += 1
+        try:
+            return get(*args, **kwargs)
+        except Exception:
+            _counters["misses"] += 1
+            raise
+    return wrapper
+
+
+def _time_parse(parse, pages_per_call=1):
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return parse(*args, **kwargs)
+        finally:
+            _counters["parse_seconds"] += time.perf_counter() - started
+            _counters["parsed_pages"] += pages_per_call
+    return wrapper
+
+
+def _instrument() -> None:
+    http_client.get = _count_requests(http_client.get)
+    for name in ("parse_usda_listing", "parse_usda_mirror", "parse_fda_table"):
+        setattr(parsers, name, _time_parse(getattr(parsers, name)))
+    # openFDA pages are JSON; normalizing items is their parse step.
+    fetcher.normalize_enforcement_item = _time_parse(fetcher.normalize_enforcement_item, pages_per_call=0)
+
+
+def _usda_history():
+    return [record for batch in fetcher.iter_usda_recalls_pages() for record in batch]
+
+
+SUITE = [
+    ("fda_enforcement_recent", lambda: fetcher.fetch_fda_recalls(limit=200)),
+    ("fda_web_page", lambda: fetcher._fetch_fda_recalls_from_page(limit=50)),
+    ("usda_recent", lambda: fetcher.fetch_usda_recalls(limit=50)),
+]
+FULL_SUITE = [
+    ("usda_history", _usda_history),
+    ("fda_history", lambda: fetcher.fetch_fda_recalls(limit=None)),
+]
+
+
+def run(suite) -> None:
+    print(f"{'fetch':24s} {'time s':>8s} {'pages':>6s} {'miss':>5s} {'pages/s':>8s} {'records/s':>10s} {'parse ms/pg':>11s} {'peak MB':>8s}")
+    for name, fetch in suite:
+        _counters.update(pages=0, misses=0, parse_seconds=0.0, parsed_pages=0)
+        tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            records = fetch()
+        except Exception as exc:  # keep going with the rest of the suite
+            print(f"{name:24s} failed: {exc}")
+            tracemalloc.stop()
+            continue
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        pages = _counters["pages"]
+        parsed_pages = _counters["parsed_pages"] or pages
+        print(
+            f"{name:24s} {elapsed:8.2f} {pages:6d} {_counters['misses']:5d}"
+            f" {pages / elapsed:8.1f} {len(records) / elapsed:10.1f}"
+            f" {1000 * _counters['parse_seconds'] / max(1, parsed_pages):11.2f}"
+            f" {peak / 1e6:8.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--record", action="store_true", help="fetch live and save fixtures")
+    parser.add_argument("--full", action="store_true", help="include the full-history crawls")
+    parser.add_argument("--fixtures", default=None, help="fixtures directory (default HTTP_FIXTURES_DIR)")
+    args = parser.parse_args()
+
+    http_client.use_fixtures("record" if args.record else "replay", args.fixtures)
+    _instrument()
+    print(f"{'Recording to' if args.record else 'Replaying from'} {http_client.HTTP_FIXTURES_DIR}")
+    run(SUITE + (FULL_SUITE if args.full else []))
+    http_client.close_sessions()
+
+
+if __name__ == "__main__":
+    main()
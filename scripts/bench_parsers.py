@@ -0,0 +1,106 @@
+"""Parse-throughput benchmark for the recall page parser backends.
+
+Runs every backend in src/parsers.py over saved pages and prints pages/sec
+and records/sec per page kind, and whether the backends agree record for
+record.
+
+Pages come from the HTTP cache written by the fetchers (HTTP_CACHE_DIR,
+default .http_cache) or from explicit files: ``*.html`` files are parsed as
+FSIS listing pages, ``*.md`` / ``*.txt`` files as mirror pages.
+
+    python scripts/bench_parsers.py                     # cached pages
+    python scripts/bench_parsers.py pages/*.html -n 5   # saved files, 5 rounds
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src import parsers
+from src.fetcher import FDA_RECALLS_PAGE, USDA_RECALLS_MIRROR, USDA_RECALLS_PAGE
+from src.http_cache import HTTP_CACHE_DIR
+
+
+def _kind_for_url(url: str) -> str | None:
+    if url.startswith(USDA_RECALLS_MIRROR):
+        return "usda_mirror"
+    if url.startswith(USDA_RECALLS_PAGE):
+        return "usda_listing"
+    if url.startswith(FDA_RECALLS_PAGE):
+        return "fda_table"
+    return None
+
+
+def load_cached_pages(cache_dir: Path) -> dict:
+    pages = {"usda_listing": [], "usda_mirror": [], "fda_table": []}
+    for meta_path in cache_dir.glob("*/*.json"):
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = meta_path.with_suffix(".body").read_bytes()
+        except (OSError, ValueError):
+            continue
+        kind = _kind_for_url(meta.get("url") or "")
+        if kind:
+            pages[kind].append(body.decode(meta.get("encoding") or "utf-8", errors="replace"))
+    return pages
+
+
+def load_files(paths: list) -> dict:
+    pages = {"usda_listing": [], "usda_mirror": [], "fda_table": []}
+    for path in map(Path, paths):
+        kind = "usda_listing" if path.suffix.lower() in (".html", ".htm") else "usda_mirror"
+        pages[kind].append(path.read_text(encoding="utf-8", errors="replace"))
+    return pages
+
+
+def _parse(backend: parsers.ParserBackend, kind: str, text: str) -> list:
+    if kind == "usda_listing":
+        return backend.parse_usda_listing(text)
+    if kind == "usda_mirror":
+        return backend.parse_usda_mirror(text)
+    return backend.parse_fda_table(text, FDA_RECALLS_PAGE)
+
+
+def run(pages: dict, rounds: int) -> None:
+    for kind, texts in pages.items():
+        if not texts:
+            continue
+        print(f"\n{kind}: {len(texts)} pages, {sum(map(len, texts)) / 1e6:.1f} MB")
+        outputs = {}
+        for name, backend in parsers.BACKENDS.items():
+            started = time.perf_counter()
+            for _ in range(rounds):
+                records = [_parse(backend, kind, text) for text in texts]
+            elapsed = time.perf_counter() - started
+            outputs[name] = records
+            total_records = sum(map(len, records)) * rounds
+            print(
+                f"  {name:5s} {len(texts) * rounds / elapsed:8.1f} pages/s"
+                f" {total_records / elapsed:10.1f} records/s"
+            )
+        results = list(outputs.values())
+        agree = all(result == results[0] for result in results[1:])
+        print(f"  backends agree: {'yes' if agree else 'NO'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", help="saved pages (default: the HTTP cache)")
+    parser.add_argument("-n", "--rounds", type=int, default=3, help="parse each page this many times")
+    args = parser.parse_args()
+
+    pages = load_files(args.files) if args.files else load_cached_pages(HTTP_CACHE_DIR)
+    if not any(pages.values()):
+        print("No saved pages found; run a crawl first or pass page files.")
+        return
+    if parsers.lxml_html is None:
+        print("lxml is not installed; the lxml backend parses HTML with BeautifulSoup.")
+    run(pages, max(1, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
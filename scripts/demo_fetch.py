@@ -26,7 +26,7 @@ def run_demo(limit: int = 5):
 
     out_file = OUT_DIR / "recalls_demo.json"
     with open(out_file, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2)
+        json.dump(output, f, indent=2, default=dict)
 
     print(f"Saved latest {limit} FDA and USDA recalls to {out_file}")
 
@@ -12,12 +12,12 @@ from __future__ import annotations
 
 import logging
 import os
-import re
 from datetime import datetime, timedelta
 from typing import Optional, List
 
 from fastapi import FastAPI, Depends, HTTPException, status, WebSocket, Query, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, EmailStr, Field
 import jwt
@@ -380,6 +380,7 @@ class RecallsResponse(BaseModel):
     total: int
     recalls: List[RecallResponse]
     updated_at: Optional[str] = None
+    next_cursor: Optional[str] = None
 
 
 @app.get("/recalls", response_model=RecallsResponse)
@@ -390,9 +391,15 @@ async def get_recalls(
     status: Optional[str] = None,
     q: Optional[str] = None,
     sort: str = Query("latest", pattern="^(latest|oldest)$"),
+    cursor: Optional[str] = None,
 ):
-    """Get paginated recalls. ``sort`` accepts ``latest`` (default) or ``oldest``."""
-    from src.store import get_all_recalls, get_recall_count, get_cache_updated_at
+    """Get paginated recalls. ``sort`` accepts ``latest`` (default) or ``oldest``.
+
+    Pass the ``next_cursor`` of a response as ``cursor`` (with the same
+    filters and sort) to get the following page; ``offset`` is ignored then.
+    ``next_cursor`` is null on the last page.
+    """
+    from src.store import get_recalls_page_with_total, get_cache_updated_at
 
     def normalize_status(value: Optional[str]) -> Optional[str]:
         if not value:
@@ -407,38 +414,12 @@ async def get_recalls(
             return upper
         return value.strip()
 
-    def normalize_date(value: Optional[str]) -> Optional[str]:
-        """Normalize any date string to YYYY-MM-DD.  Handles:
-        YYYYMMDD, YYYY-MM-DD (already good), MM/DD/YYYY, M/D/YYYY,
-        Month DD YYYY, Month DD, YYYY."""
-        if not value:
-            return value
-        text = value.strip()
-        # Already ISO: YYYY-MM-DD
-        if re.fullmatch(r"\d{4}-\d{2}-\d{2}", text):
-            return text
-        # Compact: YYYYMMDD
-        m = re.fullmatch(r"(\d{4})(\d{2})(\d{2})", text)
-        if m:
-            return f"{m.group(1)}-{m.group(2)}-{m.group(3)}"
-        # US: MM/DD/YYYY or M/D/YYYY
-        m = re.fullmatch(r"(\d{1,2})/(\d{1,2})/(\d{4})", text)
-        if m:
-            return f"{m.group(3)}-{m.group(1).zfill(2)}-{m.group(2).zfill(2)}"
-        # Month name: "January 22, 2015" or "January 22 2015"
-        try:
-            from datetime import datetime as _dt
-            for fmt in ("%B %d, %Y", "%B %d %Y", "%b %d, %Y", "%b %d %Y"):
-                try:
-                    return _dt.strptime(text, fmt).strftime("%Y-%m-%d")
-                except ValueError:
-                    pass
-        except Exception:
-            pass
-        return text
-
-    recalls = get_all_recalls(skip=offset, limit=limit, source=source, status=status, q=q, sort=sort)
-    total = get_recall_count(source=source, status=status, q=q)
+    try:
+        recalls, next_cursor, total = get_recalls_page_with_total(
+            limit=limit, source=source, status=status, q=q, sort=sort, cursor=cursor, skip=offset
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
 
     def field(x, key):
         if isinstance(x, dict):
@@ -448,6 +429,7 @@ async def get_recalls(
     return {
         "total": total,
         "updated_at": get_cache_updated_at(),
+        "next_cursor": next_cursor,
         "recalls": [
             {
                 "source": field(r, "source"),
@@ -459,8 +441,9 @@ async def get_recalls(
                 "company_name": field(r, "company_name"),
                 "status": normalize_status(field(r, "status")),
                 "affected_area": field(r, "affected_area"),
-                "report_date": normalize_date(field(r, "report_date")),
-                "recall_initiation_date": normalize_date(field(r, "recall_initiation_date")),
+                # Stored as YYYY-MM-DD at ingest (see store._canonical_date).
+                "report_date": field(r, "report_date"),
+                "recall_initiation_date": field(r, "recall_initiation_date"),
                 "url": field(r, "url"),
                 "severity": field(r, "severity"),
                 "brands": field(r, "brands") or [],
@@ -984,6 +967,29 @@ async def health_check():
     return {"status": "ok"}
 
 
+@app.get("/health/sources")
+async def source_health():
+    """Circuit-breaker state, success rate and latency per recall source host."""
+    from src.http_client import host_health
+    return {"sources": host_health()}
+
+
+@app.get("/metrics")
+async def fetch_metrics(format: str = Query("json", pattern="^(json|prometheus)$")):
+    """Fetch metrics: per-host HTTP stats and per-source crawl yield.
+
+    ``hosts`` / ``sources`` are cumulative for this process; ``last_poll``
+    is the summary of the most recent polling cycle (from any process).
+    ``format=prometheus`` returns the counters in the Prometheus text format.
+    """
+    from src import metrics
+    from src.store import get_fetch_state
+
+    if format == "prometheus":
+        return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
+    return {**metrics.snapshot(), "last_poll": get_fetch_state("poll_metrics")}
+
+
 @app.get("/api")
 async def root():
     """Welcome endpoint."""
@@ -1131,8 +1137,14 @@ async def api_get_recalls(
     status: Optional[str] = None,
     q: Optional[str] = None,
     sort: str = Query("latest"),
+    cursor: Optional[str] = None,
 ):
-    return await get_recalls(offset, limit, source, status, q, sort)
+    return await get_recalls(offset, limit, source, status, q, sort, cursor)
+
+
+@app.get("/api/metrics")
+async def api_fetch_metrics(format: str = Query("json", pattern="^(json|prometheus)$")):
+    return await fetch_metrics(format)
 
 
 @app.get("/api/stats", response_model=StatsResponse)
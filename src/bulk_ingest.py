@@ -0,0 +1,167 @@
+"""Seed the recall store from openFDA bulk download archives.
+
+openFDA publishes each enforcement dataset as zipped JSON files
+(https://open.fda.gov/data/downloads/), e.g.
+``food-enforcement-0001-of-0001.json.zip``.  This command streams the
+``results`` array out of each archive one item at a time, normalizes items
+exactly like the API fetcher and writes them with ``save_many`` in batches,
+so a fresh environment can be seeded offline without paging the API.
+
+Usage:
+    python -m src.bulk_ingest food-enforcement-0001-of-0001.json.zip \\
+        drug-enforcement-0001-of-0001.json.zip [--batch-size 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import logging
+import re
+import sys
+import time
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterator, List, TextIO
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.fetcher import FDA_ENFORCEMENT_ENDPOINTS, normalize_enforcement_item  # noqa: E402
+from src.store import init_db, save_many  # noqa: E402
+
+logger = logging.getLogger("recall-bulk-ingest")
+
+_READ_CHUNK = 1 << 16
+# The top-level "results" array; meta.results is an object, so requiring
+# "[" skips it.
+_RESULTS_START = re.compile(r'"results"\s*:\s*\[')
+
+
+def iter_json_array(stream: TextIO, start: re.Pattern = _RESULTS_START) -> Iterator[Dict]:
+    """Yield the items of the JSON array opened by ``start``, one at a time.
+
+    Reads ``stream`` in fixed-size chunks and decodes each item with
+    ``JSONDecoder.raw_decode``, so memory holds one chunk plus one item
+    rather than the whole document.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    eof = False
+
+    def _more() -> bool:
+        nonlocal buf, eof
+        chunk = stream.read(_READ_CHUNK)
+        if not chunk:
+            eof = True
+            return False
+        buf += chunk
+        return True
+
+    while True:
+        m = start.search(buf)
+        if m:
+            buf = buf[m.end():]
+            break
+        # Keep a tail in case the marker straddles two chunks.
+        buf = buf[-64:]
+        if not _more():
+            return
+
+    pos = 0
+    while True:
+        while pos < len(buf) and buf[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(buf):
+            buf, pos = "", 0
+            if not _more():
+                raise ValueError("Unterminated results array")
+            continue
+        if buf[pos] == "]":
+            return
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            # Item continues past the buffer; read more and retry.
+            buf, pos = buf[pos:], 0
+            if eof or not _more():
+                raise
+            continue
+        yield item
+        pos = end
+        if pos > _READ_CHUNK:
+            buf, pos = buf[pos:], 0
+
+
+def _category_for(path: Path) -> str | None:
+    name = path.name.lower()
+    for category in FDA_ENFORCEMENT_ENDPOINTS:
+        if name.startswith(f"{category}-enforcement"):
+            return category
+    return None
+
+
+def _iter_archive_items(path: Path) -> Iterator[Dict]:
+    """Yield raw items from every JSON member of a zip (or a bare .json file)."""
+    if path.suffix.lower() != ".zip":
+        with path.open(encoding="utf-8") as fh:
+            yield from iter_json_array(fh)
+        return
+    with zipfile.ZipFile(path) as archive:
+        for member in archive.namelist():
+            if not member.lower().endswith(".json"):
+                continue
+            with archive.open(member) as raw:
+                yield from iter_json_array(io.TextIOWrapper(raw, encoding="utf-8"))
+
+
+def ingest_file(path: Path, category: str, batch_size: int = 1000) -> tuple[int, int]:
+    """Stream one archive into the store; returns (items read, new records saved)."""
+    read = saved = 0
+    batch: List[Dict] = []
+    for item in _iter_archive_items(path):
+        batch.append(normalize_enforcement_item(item, category))
+        read += 1
+        if len(batch) >= batch_size:
+            saved += len(save_many(batch))
+            batch = []
+            if read % (batch_size * 10) == 0:
+                logger.info("%s: %d items read, %d new", path.name, read, saved)
+    if batch:
+        saved += len(save_many(batch))
+    return read, saved
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Seed the recall store from openFDA enforcement downloads.")
+    parser.add_argument("files", nargs="+", type=Path, help="*-enforcement-*.json.zip files")
+    parser.add_argument(
+        "--category",
+        choices=sorted(FDA_ENFORCEMENT_ENDPOINTS),
+        help="category for every file (default: taken from each file name)",
+    )
+    parser.add_argument("--batch-size", type=int, default=1000, help="records per insert transaction")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(levelname)s: %(message)s")
+    init_db()
+
+    for path in args.files:
+        category = args.category or _category_for(path)
+        if category is None:
+            logger.error("%s: cannot tell the category from the file name; pass --category", path)
+            return 2
+        started = time.monotonic()
+        read, saved = ingest_file(path, category, max(1, args.batch_size))
+        elapsed = time.monotonic() - started
+        logger.info(
+            "%s: %d items read, %d new recalls saved in %.1fs (%.0f items/s)",
+            path.name, read, saved, elapsed, read / elapsed if elapsed else 0,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
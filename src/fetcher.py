@@ -1,11 +1,21 @@
 """Fetch recent recalls from FDA and USDA."""
-from typing import List, Dict
-from urllib.parse import urljoin
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, Callable, Iterator, List, Dict, Tuple
+from urllib.parse import urlparse
+import asyncio
+import hashlib
+import multiprocessing
+import os
 import re
+import threading
 import time
 import requests
 import feedparser
-from bs4 import BeautifulSoup
+
+from src import http_client, metrics, parsers
+from src.http_cache import cached_get
+from src.records import RecallRecord
 
 FDA_ENFORCEMENT_ENDPOINTS = {
     "food": "https://api.fda.gov/food/enforcement.json",
@@ -13,14 +23,61 @@ FDA_ENFORCEMENT_ENDPOINTS = {
     "device": "https://api.fda.gov/device/enforcement.json",
 }
 
+# Record source label per endpoint, for the per-source crawl metrics.
+_ENFORCEMENT_SOURCES = {endpoint: f"FDA-{category}" for category, endpoint in FDA_ENFORCEMENT_ENDPOINTS.items()}
+
 # openFDA allows up to 1 000 results per request and skip up to 25 000.
 _ENFORCEMENT_PAGE_SIZE = 100  # conservative page size to avoid timeouts
 _ENFORCEMENT_MAX_SKIP = 25000  # hard cap imposed by openFDA
+
+# Upper bound on concurrent requests to any single source host when the async
+# fetch engine pages several categories at once.
+FETCH_MAX_IN_FLIGHT_PER_HOST = int(os.getenv("FETCH_MAX_IN_FLIGHT_PER_HOST", "4"))
 FDA_RECALLS_PAGE = "https://www.fda.gov/safety/recalls-market-withdrawals-safety-alerts"
 USDA_RECALLS_RSS = "https://www.fsis.usda.gov/recalls/rss"
 USDA_RECALLS_MIRROR = "https://r.jina.ai/http://www.fsis.usda.gov/recalls"
 USDA_RECALLS_PAGE = "https://www.fsis.usda.gov/recalls"
 
+# Pages fetched in parallel by the full-history USDA crawl planner.
+USDA_CRAWL_WORKERS = int(os.getenv("USDA_CRAWL_WORKERS", "4"))
+# Worker processes that parse downloaded pages during full-history USDA
+# crawls; 0 or 1 parses on the download threads instead.
+USDA_PARSE_PROCESSES = int(os.getenv("USDA_PARSE_PROCESSES", str(min(4, os.cpu_count() or 1))))
+# Limited polls request each USDA page from the direct site and the mirror
+# as hedged requests and keep whichever parses first.
+USDA_HEDGED_FETCH = os.getenv("USDA_HEDGED_FETCH", "true").lower() not in ("0", "false", "no")
+
+# HTTP cache TTL policy (seconds a cached body is reused without even a
+# conditional request).  TTL 0 still revalidates with ETag/Last-Modified.
+# Deep USDA listing pages hold recalls from years ago and almost never change.
+_CACHE_TTL_FDA_PAGE = 15 * 60
+_CACHE_TTL_OPENFDA = 0
+_CACHE_TTL_USDA_RSS = 0
+_CACHE_TTL_USDA_PAGE = 0
+_CACHE_TTL_USDA_DEEP_PAGE = 7 * 24 * 3600
+_USDA_DEEP_PAGE_START = 60
+
+
+# Deep mirror sweep and anchor pages where long-running ACTIVE recalls
+# (e.g., 2014-CURRENT) tend to appear on full historical pulls.
+_USDA_DEEP_SWEEP_START = 60
+_USDA_DEEP_SWEEP_PAGES = 80
+_USDA_ANCHOR_PAGES = (100, 110, 115, 118, 119, 120, 121)
+
+
+def _usda_page_ttl(page: int) -> int:
+    return _CACHE_TTL_USDA_DEEP_PAGE if page >= _USDA_DEEP_PAGE_START else _CACHE_TTL_USDA_PAGE
+
+
+def _openfda_get(endpoint: str, params: Dict, timeout: tuple[float, float] = (5, 20)) -> requests.Response:
+    """GET an openFDA endpoint through the HTTP cache.
+
+    ``skip`` pages and ``search`` windows are one-off URLs (windows end at
+    today's date), so only the first unwindowed page of a query is stored.
+    """
+    store = not params.get("skip") and "search" not in params
+    return cached_get(endpoint, params=params, timeout=timeout, ttl=_CACHE_TTL_OPENFDA, store=store)
+
 
 def _normalize_date(val: str | None) -> str | None:
     """Convert YYYYMMDD → MM/DD/YYYY; leave all other formats unchanged."""
@@ -41,163 +98,142 @@ def _normalize_status(val: str | None) -> str | None:
     return upper if upper in ("ACTIVE", "CLOSED", "TERMINATED") else val.strip()
 
 
-def _extract_affected_area(text: str) -> str | None:
-    """Extract a likely affected area token from card/body text."""
-    if not text:
+# Called after each crawled page with (page number, records new on that page).
+PageCallback = Callable[[int, List[Dict]], None]
+# Returns True when a record is already stored (see store.is_known_recall).
+KnownPredicate = Callable[[Dict], bool]
+
+
+def _page_all_known(records: List[Dict], is_known: KnownPredicate | None) -> bool:
+    """True when a non-empty page holds only records that are already stored."""
+    return is_known is not None and bool(records) and all(is_known(r) for r in records)
+
+
+_USDA_PAGE_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/122.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+def _download_usda_listing_page(page: int, retries: int | None = None) -> str | None:
+    """Download one FSIS listing page; None when the request fails."""
+    try:
+        resp = cached_get(
+            USDA_RECALLS_PAGE,
+            params={"page": page},
+            headers=_USDA_PAGE_HEADERS,
+            timeout=(5, 15),
+            ttl=_usda_page_ttl(page),
+            retries=retries,
+        )
+        resp.raise_for_status()
+    except requests.RequestException:
         return None
+    return resp.text
 
-    # Common labels shown in recalls pages.
-    region_patterns = [
-        r"\bNATIONWIDE\b",
-        r"\bMIDWEST\b",
-        r"\bNORTHEAST\b",
-        r"\bSOUTHEAST\b",
-        r"\bSOUTHWEST\b",
-        r"\bWEST\b",
-        r"\bPUERTO\s+RICO\b",
-    ]
-    for pat in region_patterns:
-        m = re.search(pat, text, flags=re.IGNORECASE)
-        if m:
-            return m.group(0).upper()
 
-    return None
+def _fetch_usda_listing_page(page: int, retries: int | None = None) -> List[Dict] | None:
+    """Fetch and parse one FSIS listing page; None when the request fails."""
+    text = _download_usda_listing_page(page, retries)
+    records = None if text is None else parsers.parse_usda_listing(text)
+    metrics.record_page("USDA-web", records)
+    return records
 
 
-def _extract_usda_recall_number(*texts: str | None) -> str | None:
-    """Extract USDA recall number, typically like '012-2026'."""
-    pattern = r"\b\d{3}-\d{4}\b"
-    for text in texts:
-        if not text:
-            continue
-        m = re.search(pattern, text)
-        if m:
-            return m.group(0)
-    return None
-
-
-def _fetch_usda_recalls_from_page(limit: int | None = 5, max_pages: int = 130) -> List[Dict]:
-    """Fetch USDA recalls directly from paginated USDA recalls pages."""
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/122.0.0.0 Safari/537.36"
-        ),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-    }
+def _download_usda_mirror_page(page: int, retries: int | None = None) -> str | None:
+    """Download one mirror page; None when the request fails."""
+    mirror_url = USDA_RECALLS_MIRROR if page == 0 else f"{USDA_RECALLS_MIRROR}?page={page}"
+    try:
+        resp = cached_get(
+            mirror_url,
+            headers={"User-Agent": "Mozilla/5.0 (RecallAI)"},
+            timeout=(6, 25),
+            ttl=_usda_page_ttl(page),
+            retries=retries,
+        )
+        resp.raise_for_status()
+    except requests.RequestException:
+        return None
+    return resp.text
+
+
+def _fetch_usda_mirror_page(page: int, retries: int | None = None) -> List[Dict] | None:
+    """Fetch and parse one mirror page; None when the request fails."""
+    text = _download_usda_mirror_page(page, retries)
+    records = None if text is None else parsers.parse_usda_mirror(text)
+    metrics.record_page("USDA-mirror", records)
+    return records
+
+
+def _fetch_usda_recalls_from_page(
+    limit: int | None = 5,
+    max_pages: int = 130,
+    start_page: int = 0,
+    on_page: PageCallback | None = None,
+    is_known: KnownPredicate | None = None,
+) -> List[Dict]:
+    """Fetch USDA recalls directly from paginated USDA recalls pages.
+
+    ``max_pages`` is the absolute page bound, so a crawl resumed at
+    ``start_page`` stops at the same place as a fresh one.  With
+    ``is_known``, the crawl stops at the first page whose entries are all
+    already stored (listings are newest-first, so nothing newer follows).
+    """
     results: List[Dict] = []
     seen_links = set()
 
-    for page in range(max_pages):
-        try:
-            resp = requests.get(
-                USDA_RECALLS_PAGE,
-                params={"page": page},
-                headers=headers,
-                timeout=(5, 15),
-            )
-            resp.raise_for_status()
-        except requests.RequestException:
+    for page in range(start_page, max_pages):
+        page_records = _fetch_usda_listing_page(page)
+        if page_records is None:
             # If first page fails, we have no results; otherwise stop pagination.
-            if page == 0:
+            if page == start_page:
                 return []
             break
-
-        soup = BeautifulSoup(resp.text, "html.parser")
-        candidates = soup.select(
-            "article, .views-row, .usa-collection__item, .usa-card, .node--type-recall"
-        )
-        if not candidates:
+        if not page_records:
             # End of pagination.
             break
 
-        page_new = 0
-        for node in candidates:
-            link_tag = node.select_one("h2 a, h3 a, a")
-            if not link_tag:
-                continue
-
-            title = link_tag.get_text(" ", strip=True)
-            if not title:
+        new_records = []
+        for record in page_records:
+            if record["url"] in seen_links:
                 continue
-
-            link = urljoin("https://www.fsis.usda.gov", link_tag.get("href") or "")
-            if not link or link in seen_links:
-                continue
-            seen_links.add(link)
-
-            summary_tag = node.select_one("p")
-            summary = summary_tag.get_text(" ", strip=True) if summary_tag else None
-            node_text = node.get_text(" ", strip=True)
-
-            status_match = re.search(r"\b(ACTIVE|CLOSED|TERMINATED)\b", node_text, flags=re.IGNORECASE)
-            status = status_match.group(1).upper() if status_match else None
-            affected_area = _extract_affected_area(node_text)
-
-            company_name = None
-            company_candidate = node.select_one(".field--name-field-establishment a, .field--name-field-company a")
-            if company_candidate:
-                company_name = company_candidate.get_text(" ", strip=True)
-
-            date_tag = node.select_one("time")
-            report_date = date_tag.get_text(" ", strip=True) if date_tag else None
-            if not report_date:
-                # Fallback: extract first MM/DD/YYYY-like date in card text.
-                m = re.search(r"\b\d{1,2}/\d{1,2}/\d{4}\b", node_text)
-                report_date = m.group(0) if m else None
-
-            recall_number = _extract_usda_recall_number(title, link, node_text)
-
-            results.append(
-                {
-                    "source": "USDA-web",
-                    "recall_number": recall_number,
-                    "brand_name": None,
-                    "product_description": title,
-                    "product_type": "Food",
-                    "reason_for_recall": summary,
-                    "company_name": company_name,
-                    "status": status,
-                    "affected_area": affected_area,
-                    "report_date": report_date,
-                    "recall_initiation_date": report_date,
-                    "url": link,
-                    "raw": {
-                        "title": title,
-                        "summary": summary,
-                        "link": link,
-                        "report_date": report_date,
-                        "status": status,
-                        "affected_area": affected_area,
-                    },
-                }
-            )
-            page_new += 1
+            seen_links.add(record["url"])
+            results.append(record)
+            new_records.append(record)
 
             if limit is not None and len(results) >= limit:
                 return results
 
+        if on_page is not None:
+            on_page(page, new_records)
+
         # If a page had no new links, stop to avoid spinning on repeated pages.
-        if page_new == 0:
+        if not new_records or _page_all_known(new_records, is_known):
             break
 
     return results
 
 
-# _fetch_usda_recalls_from_mirror is defined below
 def _fetch_usda_recalls_from_mirror(
     limit: int | None = 5,
     max_pages: int = 150,
     start_page: int = 0,
     per_page_retries: int = 3,
+    on_page: PageCallback | None = None,
+    is_known: KnownPredicate | None = None,
 ) -> List[Dict]:
     """Fetch USDA recalls from text mirror, including pagination by page query.
 
     Covers all historical pages (USDA site currently has 120+ pages going back
     to 2014).  Stops only after 3 consecutive pages that yield no new entries,
     which guards against transient r.jina.ai failures without cutting off early.
+    With ``is_known``, also stops at the first page whose entries are all
+    already stored.
     """
     results: List[Dict] = []
     seen_links = set()
@@ -205,23 +241,9 @@ def _fetch_usda_recalls_from_mirror(
     consecutive_failures = 0
 
     for page in range(start_page, start_page + max_pages):
-        mirror_url = USDA_RECALLS_MIRROR if page == 0 else f"{USDA_RECALLS_MIRROR}?page={page}"
-        resp = None
-        for attempt in range(max(1, per_page_retries)):
-            try:
-                candidate = requests.get(
-                    mirror_url,
-                    headers={"User-Agent": "Mozilla/5.0 (RecallAI)"},
-                    timeout=(6, 25),
-                )
-                candidate.raise_for_status()
-                resp = candidate
-                break
-            except requests.RequestException:
-                # Small backoff helps avoid transient throttling on deep crawls.
-                time.sleep(0.35 * (attempt + 1))
+        page_records = _fetch_usda_mirror_page(page, retries=max(1, per_page_retries) - 1)
 
-        if resp is None:
+        if page_records is None:
             # r.jina.ai can intermittently fail for some pages; continue until
             # failures are sustained so we don't truncate historical coverage.
             consecutive_failures += 1
@@ -229,184 +251,336 @@ def _fetch_usda_recalls_from_mirror(
                 if page == 0:
                     return []
                 break
+            if on_page is not None:
+                on_page(page, [])
             continue
 
         consecutive_failures = 0
 
-        lines = resp.text.splitlines()
-        page_new = 0
+        new_records = []
+        for record in page_records:
+            if record["url"] in seen_links:
+                continue
+            seen_links.add(record["url"])
+            results.append(record)
+            new_records.append(record)
 
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+            if limit is not None and len(results) >= limit:
+                return results
 
-            # Recall entry title line format:
-            # ### [Title](http://www.fsis.usda.gov/recalls-alerts/...)
-            m_title = re.match(r"^### \[(.+?)\]\((http[^)]+/recalls-alerts/[^)]+)\)", line)
-            if not m_title:
-                i += 1
-                continue
+        if on_page is not None:
+            on_page(page, new_records)
+        if _page_all_known(new_records, is_known):
+            break
 
-            title = m_title.group(1).strip()
-            link = m_title.group(2).strip()
-            if not link or link in seen_links:
-                i += 1
-                continue
-            seen_links.add(link)
-
-            recall_number = _extract_usda_recall_number(title, link)
-
-            company_name = None
-            status = None
-            report_date = None
-            affected_area = None
-            reason = None
-
-            # Parse a small window after title to extract metadata.
-            j = i + 1
-            window_end = min(i + 25, len(lines))
-            while j < window_end:
-                s = lines[j].strip()
-                if not s:
-                    j += 1
-                    continue
+        # Stop only after 3 consecutive pages with no new entries, to tolerate
+        # transient r.jina.ai fetch failures on individual pages.
+        if not new_records:
+            consecutive_empty += 1
+            if consecutive_empty >= 3:
+                break
+        else:
+            consecutive_empty = 0
 
-                if company_name is None:
-                    m_company = re.match(r"^\[(.+?)\]\(http[^)]+/inspection/[^)]+\)", s)
-                    if m_company:
-                        company_name = m_company.group(1).strip()
-                        j += 1
-                        continue
+    return results
 
-                if status is None and re.fullmatch(r"(?i)(active|closed|terminated)", s):
-                    status = s.upper()
-                    j += 1
-                    continue
 
-                if report_date is None:
-                    m_date = re.search(r"\b(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s*\d{2}/\d{2}/\d{4}\b", s)
-                    if m_date:
-                        report_date = m_date.group(0)
-                        j += 1
-                        continue
+# ---------- Hedged USDA page fetches ----------
 
-                if affected_area is None and re.fullmatch(r"(?i)(nationwide|midwest|northeast|southeast|southwest|west|puerto rico|current)\b.*", s):
-                    affected_area = s.upper()
-                    j += 1
-                    continue
+class _LatencyTracker:
+    """Per-source exponentially weighted latency, used to order hedged requests."""
 
-                if reason is None and ("WASHINGTON," in s or "U.S. Department of Agriculture" in s):
-                    reason = s
+    def __init__(self, alpha: float = 0.3):
+        self._alpha = alpha
+        self._ewma: Dict[str, float] = {}
+        self._lock = threading.Lock()
 
-                # Stop at next recall title.
-                if s.startswith("### ["):
-                    break
+    def record(self, source: str, seconds: float) -> None:
+        with self._lock:
+            previous = self._ewma.get(source)
+            self._ewma[source] = seconds if previous is None else previous + self._alpha * (seconds - previous)
 
-                j += 1
-
-            results.append(
-                {
-                    "source": "USDA-mirror",
-                    "recall_number": recall_number,
-                    "brand_name": None,
-                    "product_description": title,
-                    "product_type": "Food",
-                    "reason_for_recall": reason,
-                    "company_name": company_name,
-                    "status": status,
-                    "affected_area": affected_area,
-                    "report_date": report_date,
-                    "recall_initiation_date": report_date,
-                    "url": link,
-                    "raw": {
-                        "title": title,
-                        "link": link,
-                        "company_name": company_name,
-                        "status": status,
-                        "report_date": report_date,
-                        "affected_area": affected_area,
-                        "reason_for_recall": reason,
-                    },
-                }
-            )
-            page_new += 1
+    def estimate(self, source: str) -> float | None:
+        return self._ewma.get(source)
 
-            if limit is not None and len(results) >= limit:
-                return results
+    def ranked(self, sources: List[str]) -> List[str]:
+        """Fastest first; sources without samples rank first so they get measured."""
+        return sorted(sources, key=lambda source: self._ewma.get(source, 0.0))
 
-            i = j + 1
 
-        # Stop only after 3 consecutive pages with no new entries, to tolerate
-        # transient r.jina.ai fetch failures on individual pages.
-        if page_new == 0:
-            consecutive_empty += 1
-            if consecutive_empty >= 3:
+_usda_latency = _LatencyTracker()
+
+_USDA_PAGE_SOURCES: Dict[str, Callable[[int], List[Dict] | None]] = {
+    "direct": lambda page: _fetch_usda_listing_page(page),
+    "mirror": lambda page: _fetch_usda_mirror_page(page, retries=2),
+}
+
+
+_USDA_SOURCE_URLS = {"direct": USDA_RECALLS_PAGE, "mirror": USDA_RECALLS_MIRROR}
+
+
+def _timed_usda_page(source: str, page: int) -> List[Dict] | None:
+    started = time.monotonic()
+    try:
+        return _USDA_PAGE_SOURCES[source](page)
+    finally:
+        # Failures are recorded too: a source that keeps timing out should
+        # stop being the one we wait on first.
+        _usda_latency.record(source, time.monotonic() - started)
+
+
+def _fetch_usda_page_hedged(page: int, pool: ThreadPoolExecutor) -> List[Dict] | None:
+    """Fetch one logical USDA listing page from whichever source answers first.
+
+    The source with the lower tracked latency is asked first; the other one
+    is hedged in once the first has taken longer than its usual latency
+    (immediately while there is no history) or came back empty.  The first
+    non-empty parse wins and the slower request is abandoned.  Sources whose
+    host has an open circuit breaker are left out.  Returns None only when
+    every source fails.
+    """
+    sources = _usda_latency.ranked(
+        [source for source, url in _USDA_SOURCE_URLS.items() if http_client.is_available(url)]
+    )
+    if not sources:
+        return None
+    pending = {pool.submit(_timed_usda_page, sources[0], page)}
+    if len(sources) > 1:
+        done, _ = wait(pending, timeout=_usda_latency.estimate(sources[0]) or 0)
+        if done and next(iter(done)).result():
+            return next(iter(done)).result()
+        pending.add(pool.submit(_timed_usda_page, sources[1], page))
+
+    outcome: List[Dict] | None = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            records = future.result()
+            if records:
+                for other in pending:
+                    other.cancel()
+                return records
+            if records is not None:
+                outcome = records
+    return outcome
+
+
+def _fetch_usda_recalls_hedged(
+    limit: int | None = 5,
+    max_pages: int = 130,
+    is_known: KnownPredicate | None = None,
+) -> List[Dict]:
+    """Paginate USDA listings with each page hedged across site and mirror.
+
+    Poll latency follows the faster source instead of the sum of both
+    crawls.  Stops on the same conditions as the sequential crawlers: a page
+    both sources fail on or that adds no new links, a fully known page, or
+    ``limit``.
+    """
+    results: List[Dict] = []
+    seen_links = set()
+    pool = ThreadPoolExecutor(max_workers=len(_USDA_PAGE_SOURCES) * 2)
+    try:
+        for page in range(max_pages):
+            page_records = _fetch_usda_page_hedged(page, pool)
+            if not page_records:
                 break
-        else:
-            consecutive_empty = 0
 
+            new_records = []
+            for record in page_records:
+                if record["url"] in seen_links:
+                    continue
+                seen_links.add(record["url"])
+                results.append(record)
+                new_records.append(record)
+                if limit is not None and len(results) >= limit:
+                    return results
+
+            if not new_records or _page_all_known(new_records, is_known):
+                break
+    finally:
+        # Don't wait for abandoned slower requests; they finish in the background.
+        pool.shutdown(wait=False, cancel_futures=True)
     return results
 
 
+class _CrawlSegment:
+    """One sequential pass over pages ``[start, end)`` of a paginated source.
+
+    Applies the same stop rules as the sequential crawlers: the pass ends
+    after ``max_failures`` consecutive failed pages or ``max_empty``
+    consecutive pages without a link it has not seen yet.
+    """
+
+    def __init__(self, start: int, end: int, retries: int | None = 2, max_empty: int = 3, max_failures: int = 5):
+        self.next_page = start
+        self.end = end
+        self.retries = retries
+        self.max_empty = max_empty
+        self.max_failures = max_failures
+        self.active = start < end
+        self._seen_links: set = set()
+        self._empty = 0
+        self._failures = 0
+
+    def observe(self, links: frozenset | None) -> None:
+        """Consume the record links of ``next_page`` (None = fetch failed)."""
+        self.next_page += 1
+        if links is None:
+            self._failures += 1
+            if self._failures >= self.max_failures:
+                self.active = False
+        else:
+            self._failures = 0
+            new_links = links - self._seen_links
+            self._seen_links |= new_links
+            self._empty = 0 if new_links else self._empty + 1
+            if self._empty >= self.max_empty:
+                self.active = False
+        if self.next_page >= self.end:
+            self.active = False
+
+
+def _crawl_low_water(segments: List[_CrawlSegment]) -> int:
+    """First page some active segment still needs (past every end when done)."""
+    active = [s.next_page for s in segments if s.active]
+    return min(active) if active else max(s.end for s in segments)
+
+
+def _run_crawl_plan(
+    download_page: Callable[[int, int | None], str | None],
+    parse_page: Callable[[str], List[Dict]],
+    segments: List[_CrawlSegment],
+    workers: int | None = None,
+    parse_pool: Executor | None = None,
+    source: str | None = None,
+) -> Iterator[Tuple[int, List[Dict], int]]:
+    """Drive overlapping ``segments`` of one source, fetching each page once.
+
+    Each page's record links are memoised until every segment has moved past
+    it, so a page covered by several segments (main sweep, deep sweep,
+    anchors) is downloaded and parsed a single time, with the largest retry
+    budget any of them asks for.  Parsed records are only held until the
+    page is yielded.  Up to ``workers``
+    pages are downloaded in parallel, lowest pages first, and each is handed
+    to ``parse_pool`` (e.g. a process pool, so parsing is not serialised
+    behind the GIL) as soon as it arrives; without one, pages are parsed on
+    the download threads.
+
+    Yields ``(page, records, low_water)`` in page order per segment, the
+    first time each page is consumed; every page below ``low_water`` is
+    finished for all segments, which makes it a safe resume point.  Each
+    page fetched is counted in :mod:`src.metrics` under ``source``.
+    """
+    workers = max(1, workers or USDA_CRAWL_WORKERS)
+    memo: Dict[int, frozenset | None] = {}  # page -> record links (None = failed)
+    unyielded: Dict[int, List[Dict] | None] = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parser = parse_pool or pool
+        while True:
+            for segment in segments:
+                while segment.active and segment.next_page in memo:
+                    page = segment.next_page
+                    segment.observe(memo[page])
+                    if page in unyielded:
+                        yield page, unyielded.pop(page) or [], _crawl_low_water(segments)
+
+            # Segments only move forward: pages below the low-water mark are
+            # never looked at again.
+            low_water = _crawl_low_water(segments)
+            for page in [page for page in memo if page < low_water]:
+                del memo[page]
+
+            active = sorted((s for s in segments if s.active), key=lambda s: s.next_page)
+            if not active:
+                return
+
+            batch: Dict[int, int] = {}
+            for segment in active:
+                for page in range(segment.next_page, min(segment.end, segment.next_page + workers)):
+                    if len(batch) >= workers:
+                        break
+                    if page not in memo and page not in batch:
+                        batch[page] = max(
+                            s.retries for s in active if s.next_page <= page < s.end
+                        )
+            if not batch:
+                return
+
+            # Download stage: parse jobs start in completion order...
+            downloads = {pool.submit(download_page, page, retries): page for page, retries in batch.items()}
+            parses = {}
+            for download in as_completed(downloads):
+                text = download.result()
+                parses[downloads[download]] = None if text is None else parser.submit(parse_page, text)
+            # ...parse stage: results are collected back in page order.
+            for page in sorted(parses):
+                records = None if parses[page] is None else parses[page].result()
+                memo[page] = None if records is None else frozenset(r["url"] for r in records)
+                unyielded[page] = records
+                if source:
+                    metrics.record_page(source, records)
+
+
+def _usda_mirror_plan(start_page: int = 0) -> List[_CrawlSegment]:
+    """Segments for the full-history mirror crawl, resumed at ``start_page``.
+
+    Main sweep over pages 0-149, the deep sweep where long-running ACTIVE
+    recalls sit, and single-page anchors with a generous retry budget.
+    """
+    deep_end = _USDA_DEEP_SWEEP_START + _USDA_DEEP_SWEEP_PAGES
+    segments = [
+        _CrawlSegment(start_page, 150),
+        _CrawlSegment(max(_USDA_DEEP_SWEEP_START, start_page), deep_end),
+    ]
+    segments += [
+        _CrawlSegment(page, page + 1, retries=7, max_failures=1)
+        for page in _USDA_ANCHOR_PAGES
+        if page >= start_page
+    ]
+    return segments
+
+
 def _fetch_fda_recalls_from_page(limit: int = 5) -> List[Dict]:
     """Fetch latest recalls directly from the FDA recalls webpage table."""
     try:
-        resp = requests.get(
+        resp = cached_get(
             FDA_RECALLS_PAGE,
             headers={"User-Agent": "Mozilla/5.0 (RecallAI)"},
             timeout=(5, 12),
+            ttl=_CACHE_TTL_FDA_PAGE,
         )
         resp.raise_for_status()
     except requests.RequestException:
+        metrics.record_page("FDA-web", None)
         return []
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-    rows = soup.select("table tbody tr")
-
-    results: List[Dict] = []
-    for row in rows[:limit]:
-        cols = row.select("td")
-        if len(cols) < 6:
-            continue
-
-        # Expected FDA table columns:
-        # Date | Brand Name(s) | Product Description | Product Type |
-        # Recall Reason Description | Company Name | ...
-        date_text = cols[0].get_text(" ", strip=True)
-        brand_names = cols[1].get_text(" ", strip=True)
-        product_description = cols[2].get_text(" ", strip=True)
-        product_type = cols[3].get_text(" ", strip=True)
-        reason = cols[4].get_text(" ", strip=True)
-        company = cols[5].get_text(" ", strip=True)
-
-        results.append(
-            {
-                "source": "FDA-web",
-                "recall_number": None,
-                "brand_name": brand_names,
-                "brand_names": brand_names,
-                "product_description": product_description,
-                "product_type": product_type,
-                "reason_for_recall": reason,
-                "company_name": company,
-                "status": "ACTIVE" if not cols[6].get_text(" ", strip=True) else "TERMINATED",
-                "affected_area": None,
-                "report_date": date_text,
-                "recall_initiation_date": date_text,
-                "url": FDA_RECALLS_PAGE,
-                "raw": {
-                    "date": date_text,
-                    "brand_names": brand_names,
-                    "product_description": product_description,
-                    "product_type": product_type,
-                    "reason_for_recall": reason,
-                    "company_name": company,
-                    "status": "ACTIVE" if not cols[6].get_text(" ", strip=True) else "TERMINATED",
-                },
-            }
-        )
-
-    return results
+    records = parsers.parse_fda_table(resp.text, FDA_RECALLS_PAGE, limit)
+    metrics.record_page("FDA-web", records)
+    return records
+
+
+def normalize_enforcement_item(item: Dict, category: str) -> RecallRecord:
+    """Map one openFDA enforcement result onto the common recall record."""
+    openfda = item.get("openfda") or {}
+    brand_names = openfda.get("brand_name") or []
+    return RecallRecord(
+        source=f"FDA-{category}",
+        recall_number=item.get("recall_number"),
+        brand_name=", ".join(brand_names) if isinstance(brand_names, list) else str(brand_names or ""),
+        product_description=item.get("product_description"),
+        product_type=item.get("product_type") or category.title(),
+        reason_for_recall=item.get("reason_for_recall"),
+        company_name=item.get("company_name") or item.get("recalling_firm"),
+        status=_normalize_status(item.get("status") or item.get("recall_status")),
+        affected_area=item.get("distribution_pattern"),
+        report_date=_normalize_date(item.get("report_date")),
+        recall_initiation_date=_normalize_date(item.get("recall_initiation_date")),
+        code_info=item.get("code_info"),
+        url=None,
+        raw=item,
+    )
 
 
 def _fetch_fda_recalls_from_enforcement(
@@ -417,10 +591,25 @@ def _fetch_fda_recalls_from_enforcement(
 
     Args:
         limit: Maximum total records to return across all categories.
-               Pass None to fetch every available record (up to the openFDA
-               skip cap of 25 000 per category).
+               Pass None to fetch every available record; full pulls are
+               date-sliced so they are not truncated at openFDA's skip cap.
         sort_field: Result ordering field (descending).
     """
+    if limit is None:
+        # Full pulls page every category at once through the async engine
+        # (date-sliced shards, so nothing is cut off at the skip cap).  From
+        # inside a running loop, asyncio.run cannot nest; the crawl gets its
+        # own loop on a worker thread instead.
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            combined = asyncio.run(_collect_fda_recalls_pages(sort_field=sort_field))
+        else:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                combined = pool.submit(asyncio.run, _collect_fda_recalls_pages(sort_field=sort_field)).result()
+        combined.sort(key=lambda x: (x.get(sort_field) or ""), reverse=True)
+        return combined
+
     combined: List[Dict] = []
 
     for category, endpoint in FDA_ENFORCEMENT_ENDPOINTS.items():
@@ -441,36 +630,20 @@ def _fetch_fda_recalls_from_enforcement(
                 "sort": f"{sort_field}:desc",
             }
             try:
-                resp = requests.get(endpoint, params=params, timeout=(5, 20))
+                resp = _openfda_get(endpoint, params)
                 resp.raise_for_status()
                 data = resp.json()
             except requests.RequestException:
+                metrics.record_page(f"FDA-{category}", None)
                 break
 
             results = data.get("results", [])
+            metrics.record_page(f"FDA-{category}", results)
             if not results:
                 break
 
             for item in results:
-                openfda = item.get("openfda") or {}
-                brand_names = openfda.get("brand_name") or []
-                combined.append(
-                    {
-                        "source": f"FDA-{category}",
-                        "recall_number": item.get("recall_number"),
-                        "brand_name": ", ".join(brand_names) if isinstance(brand_names, list) else str(brand_names or ""),
-                        "product_description": item.get("product_description"),
-                        "product_type": item.get("product_type") or category.title(),
-                        "reason_for_recall": item.get("reason_for_recall"),
-                        "company_name": item.get("company_name") or item.get("recalling_firm"),
-                        "status": _normalize_status(item.get("status") or item.get("recall_status")),
-                        "affected_area": item.get("distribution_pattern"),
-                        "report_date": _normalize_date(item.get("report_date")),
-                        "recall_initiation_date": _normalize_date(item.get("recall_initiation_date")),
-                        "url": None,
-                        "raw": item,
-                    }
-                )
+                combined.append(normalize_enforcement_item(item, category))
 
             meta = data.get("meta", {}).get("results", {})
             total = meta.get("total", 0)
@@ -501,39 +674,19 @@ def iter_fda_recalls_pages(sort_field: str = "report_date"):
                 "sort": f"{sort_field}:desc",
             }
             try:
-                resp = requests.get(endpoint, params=params, timeout=(5, 20))
+                resp = _openfda_get(endpoint, params)
                 resp.raise_for_status()
                 data = resp.json()
             except requests.RequestException:
+                metrics.record_page(f"FDA-{category}", None)
                 break
 
             results = data.get("results", [])
+            metrics.record_page(f"FDA-{category}", results)
             if not results:
                 break
 
-            page_records = []
-            for item in results:
-                openfda = item.get("openfda") or {}
-                brand_names = openfda.get("brand_name") or []
-                page_records.append(
-                    {
-                        "source": f"FDA-{category}",
-                        "recall_number": item.get("recall_number"),
-                        "brand_name": ", ".join(brand_names) if isinstance(brand_names, list) else str(brand_names or ""),
-                        "product_description": item.get("product_description"),
-                        "product_type": item.get("product_type") or category.title(),
-                        "reason_for_recall": item.get("reason_for_recall"),
-                        "company_name": item.get("company_name") or item.get("recalling_firm"),
-                        "status": _normalize_status(item.get("status") or item.get("recall_status")),
-                        "affected_area": item.get("distribution_pattern"),
-                        "report_date": _normalize_date(item.get("report_date")),
-                        "recall_initiation_date": _normalize_date(item.get("recall_initiation_date")),
-                        "url": None,
-                        "raw": item,
-                    }
-                )
-
-            yield page_records
+            yield [normalize_enforcement_item(item, category) for item in results]
 
             meta = data.get("meta", {}).get("results", {})
             total = meta.get("total", 0)
@@ -543,6 +696,234 @@ def iter_fda_recalls_pages(sort_field: str = "report_date"):
                 break
 
 
+# ---------- Async fetch engine ----------
+
+async def _async_get_json(endpoint: str, params: Dict, semaphore: asyncio.Semaphore) -> Dict | None:
+    """GET a JSON document in a worker thread, bounded by the host semaphore.
+
+    Returns ``{}`` for openFDA's 404 on an empty search window and None when
+    the request fails.
+    """
+    async with semaphore:
+        try:
+            resp = await asyncio.to_thread(_openfda_get, endpoint, params)
+            if resp.status_code == 404:
+                return {}
+            resp.raise_for_status()
+            return resp.json()
+        except requests.RequestException:
+            return None
+
+
+class EnforcementPage(list):
+    """A page of normalized openFDA records plus where it sits in the crawl.
+
+    Behaves exactly like the plain list of dicts callers already consume;
+    ``shard``, ``skip`` and ``total`` let them checkpoint progress.
+    ``total`` is the number of records reachable by paging, i.e. the shard
+    total capped at openFDA's skip limit.  ``shard`` is the key of the
+    ``report_date`` slice the page came from (see :func:`plan_fda_shards`).
+    """
+
+    def __init__(self, records: List[Dict], category: str, skip: int, total: int, shard: str | None = None):
+        super().__init__(records)
+        self.category = category
+        self.skip = skip
+        self.total = total
+        self.shard = shard or category
+
+
+# ---------- Date-sliced shards ----------
+
+def _shard(category: str, start: str | None = None, end: str | None = None, total: int | None = None) -> Dict:
+    """A crawl shard: one category, optionally limited to a ``report_date`` range."""
+    key = category if start is None else f"{category}:{start}-{end}"
+    return {"key": key, "category": category, "start": start, "end": end, "total": total}
+
+
+def _shard_search(shard: Dict) -> str | None:
+    if shard.get("start") is None:
+        return None
+    return f"report_date:[{shard['start']} TO {shard['end']}]"
+
+
+async def _async_shard_total(endpoint: str, search: str | None, semaphore: asyncio.Semaphore) -> int | None:
+    params = {"limit": 1}
+    if search:
+        params["search"] = search
+    data = await _async_get_json(endpoint, params, semaphore)
+    if data is None:
+        return None
+    return data.get("meta", {}).get("results", {}).get("total", 0)
+
+
+async def _plan_category_shards(category: str, endpoint: str, semaphore: asyncio.Semaphore) -> List[Dict]:
+    """Split one category into ``report_date`` ranges that each fit under the skip cap.
+
+    A category small enough to page directly stays a single unfiltered
+    shard.  Otherwise the range from its oldest ``report_date`` to tomorrow
+    is bisected (with ``limit=1`` count probes, run concurrently) until every
+    slice holds at most ``_ENFORCEMENT_MAX_SKIP`` records.
+    """
+    oldest = await _async_get_json(endpoint, {"limit": 1, "sort": "report_date:asc"}, semaphore)
+    if not oldest:
+        return [_shard(category)]
+    total = oldest.get("meta", {}).get("results", {}).get("total", 0)
+    if total <= _ENFORCEMENT_MAX_SKIP:
+        return [_shard(category, total=total)]
+    try:
+        first_day = datetime.strptime(oldest["results"][0]["report_date"], "%Y%m%d").date()
+    except (KeyError, IndexError, TypeError, ValueError):
+        return [_shard(category, total=total)]
+
+    async def _split(lo: date, hi: date, known_total: int | None = None) -> List[Dict]:
+        start, end = lo.strftime("%Y%m%d"), hi.strftime("%Y%m%d")
+        count = known_total
+        if count is None:
+            count = await _async_shard_total(endpoint, f"report_date:[{start} TO {end}]", semaphore)
+        if count == 0:
+            return []
+        # Unknown counts (failed probe) and single days too big to split are
+        # kept as-is; paging them is still capped at the skip limit.
+        if count is None or count <= _ENFORCEMENT_MAX_SKIP or lo >= hi:
+            return [_shard(category, start, end, count)]
+        mid = lo + (hi - lo) // 2
+        halves = await asyncio.gather(_split(lo, mid), _split(mid + timedelta(days=1), hi))
+        return halves[0] + halves[1]
+
+    return await _split(first_day, date.today() + timedelta(days=1))
+
+
+async def plan_fda_shards(max_in_flight_per_host: int | None = None) -> List[Dict]:
+    """Partition every openFDA enforcement category into crawlable shards.
+
+    Each shard is ``{"key", "category", "start", "end", "total"}``, where
+    ``start``/``end`` bound ``report_date`` (YYYYMMDD, inclusive) or are
+    None for a category that fits under the skip cap unfiltered; ``total``
+    is None when its count probe failed.  Together
+    the shards cover every record, which plain skip paging cannot do past
+    25 000 records per category.
+    """
+    semaphore = asyncio.Semaphore(max_in_flight_per_host or FETCH_MAX_IN_FLIGHT_PER_HOST)
+    plans = await asyncio.gather(
+        *(_plan_category_shards(category, endpoint, semaphore) for category, endpoint in FDA_ENFORCEMENT_ENDPOINTS.items())
+    )
+    return [shard for plan in plans for shard in plan]
+
+
+async def _walk_enforcement_shard(
+    shard: Dict,
+    sort_field: str,
+    semaphore: asyncio.Semaphore,
+    queue: asyncio.Queue,
+    start_skip: int = 0,
+) -> None:
+    """Page one shard, pushing normalized page batches onto ``queue``.
+
+    The first page (at ``start_skip``) is fetched alone to learn the shard
+    total; every remaining page is then requested concurrently (bounded by
+    ``semaphore``).  A resumed shard already paged to its planned total
+    makes no request.
+    """
+    planned = shard.get("total")
+    if planned is not None and start_skip >= min(planned, _ENFORCEMENT_MAX_SKIP):
+        return
+    category = shard["category"]
+    endpoint = FDA_ENFORCEMENT_ENDPOINTS[category]
+    base_params = {"limit": _ENFORCEMENT_PAGE_SIZE, "sort": f"{sort_field}:desc"}
+    search = _shard_search(shard)
+    if search:
+        base_params["search"] = search
+
+    data = await _async_get_json(endpoint, {**base_params, "skip": start_skip}, semaphore)
+    results = (data or {}).get("results", [])
+    metrics.record_page(f"FDA-{category}", None if data is None else results)
+    if not results:
+        return
+    total = min(data.get("meta", {}).get("results", {}).get("total", 0), _ENFORCEMENT_MAX_SKIP)
+    await queue.put(
+        EnforcementPage(
+            [normalize_enforcement_item(item, category) for item in results], category, start_skip, total, shard["key"]
+        )
+    )
+
+    async def _page(skip: int) -> None:
+        page = await _async_get_json(endpoint, {**base_params, "skip": skip}, semaphore)
+        page_results = (page or {}).get("results", [])
+        metrics.record_page(f"FDA-{category}", None if page is None else page_results)
+        if page_results:
+            await queue.put(
+                EnforcementPage(
+                    [normalize_enforcement_item(item, category) for item in page_results],
+                    category, skip, total, shard["key"],
+                )
+            )
+
+    await asyncio.gather(
+        *(_page(skip) for skip in range(start_skip + len(results), total, _ENFORCEMENT_PAGE_SIZE))
+    )
+
+
+async def aiter_fda_recalls_pages(
+    sort_field: str = "report_date",
+    max_in_flight_per_host: int | None = None,
+    start_skips: Dict[str, int] | None = None,
+    shards: List[Dict] | None = None,
+) -> AsyncIterator[EnforcementPage]:
+    """Async generator yielding FDA enforcement page batches as they arrive.
+
+    Every category is split into ``report_date`` shards (``shards``, or a
+    fresh :func:`plan_fda_shards` plan) and all shards are paged concurrently,
+    with at most ``max_in_flight_per_host`` requests outstanding per source
+    host.  Pages are yielded in completion order (not sorted), in the same
+    dict shape as :func:`iter_fda_recalls_pages`.  ``start_skips`` maps
+    shard key → openFDA skip offset to resume a checkpointed crawl from.
+    """
+    in_flight = max_in_flight_per_host or FETCH_MAX_IN_FLIGHT_PER_HOST
+    if shards is None:
+        shards = await plan_fda_shards(in_flight)
+    semaphores: Dict[str, asyncio.Semaphore] = {}
+    # Bounded so producers wait for a slow consumer instead of buffering everything.
+    queue: asyncio.Queue = asyncio.Queue(maxsize=in_flight * 2)
+
+    walkers = []
+    for shard in shards:
+        host = urlparse(FDA_ENFORCEMENT_ENDPOINTS[shard["category"]]).netloc
+        semaphore = semaphores.setdefault(host, asyncio.Semaphore(in_flight))
+        walkers.append(
+            asyncio.create_task(
+                _walk_enforcement_shard(
+                    shard, sort_field, semaphore, queue,
+                    start_skip=(start_skips or {}).get(shard["key"], 0),
+                )
+            )
+        )
+
+    async def _close_when_done() -> None:
+        try:
+            await asyncio.gather(*walkers, return_exceptions=True)
+        finally:
+            await queue.put(None)
+
+    closer = asyncio.create_task(_close_when_done())
+    try:
+        while True:
+            page = await queue.get()
+            if page is None:
+                break
+            yield page
+    finally:
+        for task in (*walkers, closer):
+            task.cancel()
+
+
+async def _collect_fda_recalls_pages(sort_field: str = "report_date") -> List[Dict]:
+    combined: List[Dict] = []
+    async for page in aiter_fda_recalls_pages(sort_field=sort_field):
+        combined.extend(page)
+    return combined
+
+
 def fetch_fda_recalls(limit: int | None = None, sort_field: str = "report_date") -> List[Dict]:
     """Fetch FDA recalls with optional full pagination.
 
@@ -569,31 +950,219 @@ def fetch_fda_recalls(limit: int | None = None, sort_field: str = "report_date")
     return _fetch_fda_recalls_from_enforcement(limit=limit, sort_field=sort_field)
 
 
-def fetch_usda_recalls(limit: int | None = 5) -> List[Dict]:
+def _fetch_enforcement_items(endpoint: str, search: str | None = None, sort_field: str = "report_date") -> List[Dict] | None:
+    """Page raw openFDA items for one endpoint, optionally within a ``search`` window.
+
+    Returns None when a request fails so callers can keep their previous
+    watermark instead of advancing past records they never saw.
+    """
+    items: List[Dict] = []
+    skip = 0
+    while True:
+        params = {
+            "limit": _ENFORCEMENT_PAGE_SIZE,
+            "skip": skip,
+            "sort": f"{sort_field}:desc",
+        }
+        if search:
+            params["search"] = search
+        try:
+            resp = _openfda_get(endpoint, params)
+            # openFDA answers an empty search window with 404 NOT_FOUND.
+            if resp.status_code == 404:
+                return items
+            resp.raise_for_status()
+            data = resp.json()
+        except requests.RequestException:
+            metrics.record_page(_ENFORCEMENT_SOURCES[endpoint], None)
+            return None
+
+        results = data.get("results", [])
+        metrics.record_page(_ENFORCEMENT_SOURCES[endpoint], results)
+        items.extend(results)
+        total = data.get("meta", {}).get("results", {}).get("total", 0)
+        skip += len(results)
+        if not results or skip >= total or skip >= _ENFORCEMENT_MAX_SKIP:
+            return items
+
+
+def _fetch_enforcement_items_page(endpoint: str, sort_field: str = "report_date") -> List[Dict] | None:
+    """Fetch the most recent page of raw openFDA items for one endpoint."""
+    params = {"limit": _ENFORCEMENT_PAGE_SIZE, "sort": f"{sort_field}:desc"}
+    try:
+        resp = _openfda_get(endpoint, params)
+        resp.raise_for_status()
+        results = resp.json().get("results", [])
+    except requests.RequestException:
+        metrics.record_page(_ENFORCEMENT_SOURCES[endpoint], None)
+        return None
+    metrics.record_page(_ENFORCEMENT_SOURCES[endpoint], results)
+    return results
+
+
+def _probe_last_updated(endpoint: str) -> str | None:
+    """Return openFDA ``meta.last_updated`` for an endpoint via a ``limit=1`` request."""
+    try:
+        resp = _openfda_get(endpoint, {"limit": 1}, timeout=(5, 10))
+        resp.raise_for_status()
+        return resp.json().get("meta", {}).get("last_updated")
+    except requests.RequestException:
+        return None
+
+
+def fetch_fda_recalls_incremental(watermarks: Dict[str, Dict], sort_field: str = "report_date") -> List[Dict]:
+    """Fetch only FDA enforcement records newer than each category's high-water mark.
+
+    ``watermarks`` maps category → ``{"report_date": "YYYYMMDD",
+    "recall_numbers": [...], "last_updated": "YYYY-MM-DD"}`` and is updated
+    in place; callers persist it once the returned records are stored.  A
+    category without a mark is bootstrapped from its most recent page.
+    Records on the mark date itself are re-requested (the window is
+    inclusive) but filtered out when their recall number was already seen.
+
+    Each category is first probed with a ``limit=1`` request; when openFDA's
+    ``meta.last_updated`` matches the stored value the dataset hasn't been
+    refreshed since the last poll and the category is skipped entirely.
+    """
+
+    # Report dates are never in the future; one day of slack covers timezones.
+    window_end = (date.today() + timedelta(days=1)).strftime("%Y%m%d")
+    combined: List[Dict] = []
+
+    for category, endpoint in FDA_ENFORCEMENT_ENDPOINTS.items():
+        mark = watermarks.get(category) or {}
+        mark_date = mark.get("report_date")
+        seen = set(mark.get("recall_numbers") or [])
+
+        last_updated = _probe_last_updated(endpoint)
+        if mark_date and last_updated and last_updated == mark.get("last_updated"):
+            continue
+
+        if mark_date:
+            items = _fetch_enforcement_items(
+                endpoint, search=f"report_date:[{mark_date} TO {window_end}]", sort_field=sort_field
+            )
+        else:
+            items = _fetch_enforcement_items_page(endpoint, sort_field=sort_field)
+        if items is None:
+            continue
+
+        new_mark_date = mark_date
+        for item in items:
+            item_date = item.get("report_date") or ""
+            if item_date == mark_date and item.get("recall_number") in seen:
+                continue
+            combined.append(normalize_enforcement_item(item, category))
+            if item_date and (not new_mark_date or item_date > new_mark_date):
+                new_mark_date = item_date
+
+        if new_mark_date:
+            at_mark = {i.get("recall_number") for i in items if i.get("report_date") == new_mark_date}
+            if new_mark_date == mark_date:
+                at_mark |= seen
+            watermarks[category] = {
+                "report_date": new_mark_date,
+                "recall_numbers": sorted(rn for rn in at_mark if rn),
+                "last_updated": last_updated,
+            }
+
+    combined.sort(key=lambda x: (x.get(sort_field) or ""), reverse=True)
+    return combined
+
+
+def _usda_feed_fingerprint(feed_state: Dict) -> Dict | None:
+    """Check the USDA RSS feed for changes since ``feed_state`` was recorded.
+
+    Sends ``If-None-Match`` / ``If-Modified-Since`` from the stored validators
+    and hashes the feed entries (ids, links, dates, titles) so a rebuilt feed
+    with identical entries still counts as unchanged.
+
+    Returns None when the feed is unchanged, otherwise the new fingerprint
+    (validators + entry hash) to store once the crawl succeeds.  An empty
+    dict means the feed could not be read, so the caller should crawl anyway.
+    """
+    headers = {"User-Agent": "RecallAI/1.0"}
+    if feed_state.get("etag"):
+        headers["If-None-Match"] = feed_state["etag"]
+    if feed_state.get("last_modified"):
+        headers["If-Modified-Since"] = feed_state["last_modified"]
+
+    try:
+        resp = http_client.get(USDA_RECALLS_RSS, headers=headers, timeout=(5, 12))
+        if resp.status_code == 304:
+            return None
+        resp.raise_for_status()
+        feed = feedparser.parse(resp.content)
+    except Exception:
+        return {}
+
+    digest = hashlib.sha1()
+    for entry in feed.entries:
+        for attr in ("id", "link", "published", "updated", "title"):
+            digest.update(str(getattr(entry, attr, "") or "").encode("utf-8"))
+            digest.update(b"\x1f")
+    entries_hash = digest.hexdigest()
+    if entries_hash == feed_state.get("entries_hash"):
+        return None
+
+    return {
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "entries_hash": entries_hash,
+    }
+
+
+def fetch_usda_recalls(
+    limit: int | None = 5,
+    feed_state: Dict | None = None,
+    is_known: KnownPredicate | None = None,
+) -> List[Dict]:
+    """Fetch USDA recalls from the FSIS site and its text mirror, with RSS fallback.
+
+    When ``feed_state`` is given, the RSS feed is used as a cheap change
+    detector first: if it shows no new or changed entries the expensive HTML
+    and mirror crawl is skipped and an empty list is returned.  ``feed_state``
+    is updated in place after a successful crawl; callers persist it.
+
+    ``is_known`` (e.g. ``store.is_known_recall``) lets both crawlers stop at
+    the first page whose entries are all already stored.
+    """
+    fingerprint = None
+    if feed_state is not None:
+        fingerprint = _usda_feed_fingerprint(feed_state)
+        if fingerprint is None:
+            return []
+
+    results = _fetch_usda_recalls_crawl(limit, is_known=is_known)
+    if results and fingerprint:
+        feed_state.update(fingerprint)
+    return results
+
+
+def _fetch_usda_recalls_crawl(limit: int | None = 5, is_known: KnownPredicate | None = None) -> List[Dict]:
     # Pull from both sources (web + mirror) and merge. Either source can be
     # incomplete on a given run due FSIS bot controls or transient mirror issues.
     # Unioning both gives the best historical coverage.
-    page_results = _fetch_usda_recalls_from_page(limit=None if limit is None else max(limit, 50))
-    mirror_results = _fetch_usda_recalls_from_mirror(limit=None if limit is None else max(limit, 50))
-
-    # For full historical pulls, run an extra sweep over deep pages where the
-    # long-running ACTIVE recalls (e.g., 2014-CURRENT) tend to appear.
     if limit is None:
-        mirror_results += _fetch_usda_recalls_from_mirror(limit=None, max_pages=80, start_page=60)
-        for anchor_page in (100, 110, 115, 118, 119, 120, 121):
-            mirror_results += _fetch_usda_recalls_from_mirror(
-                limit=None,
-                max_pages=1,
-                start_page=anchor_page,
-                per_page_retries=8,
-            )
+        # Full historical pull: the crawl planner covers the direct site, the
+        # mirror, the deep sweep and the anchor pages fetching each page once.
+        combined: List[Dict] = []
+        for batch in iter_usda_recalls_pages():
+            combined.extend(batch)
+        page_results, mirror_results = [], combined
+    elif USDA_HEDGED_FETCH:
+        page_results = _fetch_usda_recalls_hedged(limit=max(limit, 50), is_known=is_known)
+        mirror_results = []
+    else:
+        page_results = _fetch_usda_recalls_from_page(limit=max(limit, 50), is_known=is_known)
+        mirror_results = _fetch_usda_recalls_from_mirror(limit=max(limit, 50), is_known=is_known)
 
     combined = page_results + mirror_results
     if combined:
         seen = set()
         deduped = []
         for r in combined:
-            key = r.get("recall_number") or r.get("url") or r.get("product_description")
+            key = _usda_dedupe_key(r)
             if key in seen:
                 continue
             seen.add(key)
@@ -604,45 +1173,122 @@ def fetch_usda_recalls(limit: int | None = 5) -> List[Dict]:
 
     # Fallback to USDA RSS if page fetch is blocked/unavailable.
     try:
-        resp = requests.get(
+        resp = cached_get(
             USDA_RECALLS_RSS,
             headers={"User-Agent": "RecallAI/1.0"},
             timeout=(5, 12),
+            ttl=_CACHE_TTL_USDA_RSS,
         )
         resp.raise_for_status()
         feed = feedparser.parse(resp.content)
-    except requests.RequestException:
-        return []
     except Exception:
+        metrics.record_page("USDA", None)
         return []
 
     results = []
     for entry in (feed.entries if limit is None else feed.entries[:limit]):
         results.append(
-            {
-                "source": "USDA",
-                "recall_number": getattr(entry, "id", None),
-                "brand_name": None,
-                "product_description": getattr(entry, "title", None),
-                "product_type": "Food",
-                "reason_for_recall": getattr(entry, "summary", None),
-                "company_name": None,
-                "status": None,
-                "affected_area": None,
-                "report_date": getattr(entry, "published", None),
-                "recall_initiation_date": getattr(entry, "published", None),
-                "url": getattr(entry, "link", None),
-                "raw": {
+            RecallRecord(
+                source="USDA",
+                recall_number=getattr(entry, "id", None),
+                brand_name=None,
+                product_description=getattr(entry, "title", None),
+                product_type="Food",
+                reason_for_recall=getattr(entry, "summary", None),
+                company_name=None,
+                status=None,
+                affected_area=None,
+                report_date=getattr(entry, "published", None),
+                recall_initiation_date=getattr(entry, "published", None),
+                url=getattr(entry, "link", None),
+                raw={
                     "title": getattr(entry, "title", None),
                     "summary": getattr(entry, "summary", None),
                     "link": getattr(entry, "link", None),
                     "published": getattr(entry, "published", None),
                 },
-            }
+            )
         )
+    metrics.record_page("USDA", results)
     return results
 
 
+def _usda_dedupe_key(record: Dict) -> str | None:
+    return record.get("recall_number") or record.get("url") or record.get("product_description")
+
+
+def iter_usda_recalls_pages(checkpoint: Dict | None = None) -> Iterator[List[Dict]]:
+    """Generator that yields one deduplicated page batch of USDA records at a time.
+
+    The USDA counterpart of :func:`iter_fda_recalls_pages`: runs the full
+    historical crawl (direct site, then the mirror's main sweep, deep sweep
+    and anchor pages through :func:`_run_crawl_plan`, so overlapping mirror
+    pages are fetched once) and yields each page's records as soon as they
+    are parsed, minus any already yielded earlier in the run.  Only the
+    dedupe keys and the crawl plan's per-page link sets are kept between
+    pages, so record memory stays at about one batch of pages.
+
+    Downloaded pages are parsed in a pool of USDA_PARSE_PROCESSES worker
+    processes.  When ``checkpoint`` is given the crawl resumes from it and
+    updates it in place *before* every yield, so the consumer can persist it
+    alongside the batch; an empty batch marks a stage transition:
+
+        {"stage": "page" | "mirror" | "done",
+         "page": next direct page, "mirror_page": next mirror page}
+    """
+    checkpoint = {} if checkpoint is None else checkpoint
+    stage = checkpoint.setdefault("stage", "page")
+    if stage == "done":
+        return
+
+    seen_keys = set()
+
+    def _new_records(records: List[Dict]) -> List[Dict]:
+        batch = []
+        for record in records:
+            key = _usda_dedupe_key(record)
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+            batch.append(record)
+        return batch
+
+    # Spawned, not forked: this runs on an executor thread of a multithreaded
+    # server, and a forked child could inherit locks (logging, connection
+    # pools) held by other threads.  The parse functions are module-level in
+    # src.parsers, so spawned workers import them by name.
+    parse_pool = (
+        ProcessPoolExecutor(max_workers=USDA_PARSE_PROCESSES, mp_context=multiprocessing.get_context("spawn"))
+        if USDA_PARSE_PROCESSES > 1
+        else None
+    )
+    try:
+        if stage == "page":
+            direct = [_CrawlSegment(checkpoint.get("page", 0), 130, retries=None, max_empty=1, max_failures=1)]
+            for _, records, low_water in _run_crawl_plan(
+                _download_usda_listing_page, parsers.parse_usda_listing, direct,
+                parse_pool=parse_pool, source="USDA-web",
+            ):
+                checkpoint["page"] = low_water
+                yield _new_records(records)
+            stage = checkpoint["stage"] = "mirror"
+            yield []
+
+        if stage == "mirror":
+            segments = _usda_mirror_plan(checkpoint.get("mirror_page", 0))
+            for _, records, low_water in _run_crawl_plan(
+                _download_usda_mirror_page, parsers.parse_usda_mirror, segments,
+                parse_pool=parse_pool, source="USDA-mirror",
+            ):
+                checkpoint["mirror_page"] = low_water
+                yield _new_records(records)
+            checkpoint["stage"] = "done"
+            yield []
+    finally:
+        if parse_pool is not None:
+            parse_pool.shutdown(cancel_futures=True)
+
+
 def fetch_all_recalls(fda_limit: int | None = None, usda_limit: int | None = None) -> List[Dict]:
     """Fetch all recalls from all sources. Pass fda_limit=N to cap FDA records."""
     return fetch_fda_recalls(limit=fda_limit, sort_field="report_date") + fetch_usda_recalls(limit=usda_limit)
\ No newline at end of file
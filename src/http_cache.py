@@ -0,0 +1,231 @@
+"""Disk-backed conditional HTTP cache for the recall fetchers.
+
+Responses are stored per URL + query params as a body file plus a small JSON
+metadata file holding the ``ETag`` / ``Last-Modified`` validators.  A cached
+entry younger than the caller's TTL is returned without touching the
+network; an older one is revalidated with ``If-None-Match`` /
+``If-Modified-Since`` and its body reused on ``304 Not Modified``.
+
+Only responses that can be reused are written: ones carrying a validator or
+requested with a TTL.  The directory is capped at HTTP_CACHE_MAX_MB; the
+least recently used entries are pruned past it, which matters on hosts
+where the cache directory lives on an in-memory filesystem.
+
+Disable with HTTP_CACHE_ENABLED=false; relocate with HTTP_CACHE_DIR.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src import http_client, metrics
+
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_DIR = Path(os.getenv("HTTP_CACHE_DIR", ".http_cache"))
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+HTTP_CACHE_MAX_BYTES = int(float(os.getenv("HTTP_CACHE_MAX_MB", "256")) * 1024 * 1024)
+
+# Only these response headers are kept alongside the cached body.
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def _cache_key(url: str, params: Optional[Dict] = None) -> str:
+    query = urlencode(sorted((params or {}).items()), doseq=True)
+    return hashlib.sha1(f"{url}?{query}".encode("utf-8")).hexdigest()
+
+
+def _entry_paths(key: str) -> tuple[Path, Path]:
+    # Two-level fan-out keeps directories small on deep historical crawls.
+    folder = HTTP_CACHE_DIR / key[:2]
+    return folder / f"{key}.body", folder / f"{key}.json"
+
+
+def _load_entry(key: str) -> tuple[Optional[Dict], Optional[bytes]]:
+    body_path, meta_path = _entry_paths(key)
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        return meta, body_path.read_bytes()
+    except (OSError, ValueError):
+        return None, None
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+# Bytes written since the last prune; starts full so the first write of a
+# process also trims whatever earlier runs left behind.
+_prune_lock = threading.Lock()
+_written_since_prune = HTTP_CACHE_MAX_BYTES // 10
+
+
+def prune(max_bytes: Optional[int] = None) -> int:
+    """Delete least recently used entries until the cache fits ``max_bytes``.
+
+    Recency is the metadata file's mtime, refreshed on every hit.  Prunes
+    down to 90% of the cap so back-to-back writes don't rescan the
+    directory.  Returns the number of entries removed.
+    """
+    max_bytes = HTTP_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    entries = []
+    total = 0
+    for meta_path in HTTP_CACHE_DIR.glob("*/*.json"):
+        body_path = meta_path.with_suffix(".body")
+        try:
+            stat = meta_path.stat()
+            size = stat.st_size + (body_path.stat().st_size if body_path.exists() else 0)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, size, meta_path, body_path))
+        total += size
+    if total <= max_bytes:
+        return 0
+
+    removed = 0
+    for _, size, meta_path, body_path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes * 0.9:
+            break
+        for path in (meta_path, body_path):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        total -= size
+        removed += 1
+    logger.info("HTTP cache pruned %d entries (%.1f MB kept)", removed, total / 1e6)
+    return removed
+
+
+def _maybe_prune(written: int) -> None:
+    global _written_since_prune
+    with _prune_lock:
+        _written_since_prune += written
+        if _written_since_prune < HTTP_CACHE_MAX_BYTES // 10:
+            return
+        _written_since_prune = 0
+        prune()
+
+
+def _mark_used(key: str) -> None:
+    _, meta_path = _entry_paths(key)
+    try:
+        os.utime(meta_path)
+    except OSError:
+        pass
+
+
+def _store_entry(key: str, url: str, resp: requests.Response) -> None:
+    body_path, meta_path = _entry_paths(key)
+    meta = {
+        "url": url,
+        "fetched_at": time.time(),
+        "encoding": resp.encoding,
+        "headers": {h: resp.headers[h] for h in _KEPT_HEADERS if h in resp.headers},
+    }
+    try:
+        _atomic_write(body_path, resp.content)
+        _atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+    except OSError as exc:
+        logger.debug("HTTP cache write failed for %s: %s", url, exc)
+        return
+    _maybe_prune(len(resp.content))
+
+
+def _touch_entry(key: str, meta: Dict) -> None:
+    _, meta_path = _entry_paths(key)
+    meta = {**meta, "fetched_at": time.time()}
+    try:
+        _atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+    except OSError as exc:
+        logger.debug("HTTP cache touch failed for %s: %s", meta.get("url"), exc)
+
+
+def _cached_response(meta: Dict, body: bytes) -> requests.Response:
+    """Rebuild a ``requests.Response`` from a cache entry."""
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = body
+    resp.headers = CaseInsensitiveDict(meta.get("headers") or {})
+    resp.url = meta.get("url") or ""
+    resp.encoding = meta.get("encoding")
+    resp.from_cache = True
+    return resp
+
+
+def cached_get(
+    url: str,
+    params: Optional[Dict] = None,
+    headers: Optional[Dict] = None,
+    timeout: tuple[float, float] | float = (5, 15),
+    ttl: float = 0,
+    retries: Optional[int] = None,
+    store: bool = True,
+) -> requests.Response:
+    """:func:`src.http_client.get` backed by the disk cache.
+
+    Args:
+        ttl: Seconds a cached body is served without revalidation.  With
+             ``ttl=0`` every call revalidates, which still saves the body
+             download whenever the server answers ``304``.
+        retries: Passed through to the shared client's retry policy.
+        store: False for one-off URLs that are never requested again (an
+               existing entry is still used).
+
+    Only ``200`` responses with an ``ETag`` / ``Last-Modified`` validator,
+    or requested with ``ttl > 0``, are cached; anything else is returned
+    as-is, and network errors propagate exactly as they would from
+    ``requests.get``.
+    """
+    if not HTTP_CACHE_ENABLED:
+        return http_client.get(url, params=params, headers=headers, timeout=timeout, retries=retries)
+
+    key = _cache_key(url, params)
+    meta, body = _load_entry(key)
+
+    if meta is not None and ttl > 0 and time.time() - meta.get("fetched_at", 0) < ttl:
+        metrics.count_cache_hit(url)
+        _mark_used(key)
+        return _cached_response(meta, body)
+
+    request_headers = dict(headers or {})
+    if meta is not None:
+        validators = meta.get("headers") or {}
+        if validators.get("ETag"):
+            request_headers["If-None-Match"] = validators["ETag"]
+        if validators.get("Last-Modified"):
+            request_headers["If-Modified-Since"] = validators["Last-Modified"]
+
+    resp = http_client.get(url, params=params, headers=request_headers, timeout=timeout, retries=retries)
+    if resp.status_code == 304 and meta is not None:
+        metrics.count_cache_hit(url)
+        _touch_entry(key, meta)
+        return _cached_response(meta, body)
+    if resp.status_code == 200 and store and (
+        ttl > 0 or "ETag" in resp.headers or "Last-Modified" in resp.headers
+    ):
+        _store_entry(key, url, resp)
+    return resp
@@ -0,0 +1,342 @@
+"""Shared HTTP client for the recall fetchers.
+
+One pooled ``requests.Session`` per source host keeps TCP/TLS connections
+alive across the hundreds of pages in a historical crawl, and every request
+goes through the same retry policy: jittered exponential backoff on
+connection errors and 429/5xx responses, honouring ``Retry-After``.
+
+A per-host circuit breaker opens after HTTP_BREAKER_FAILURES consecutive
+failed attempts and rejects requests to that host for
+HTTP_BREAKER_COOLDOWN_SECONDS, so a degraded source fails fast instead of
+tying up worker threads on timeouts every poll.  ``host_health()`` reports
+breaker state, success rate and latency per host.  Every attempt is also
+recorded in :mod:`src.metrics` (latency histogram, bytes, retries).
+
+For repeatable offline runs, HTTP_FIXTURES_MODE=record saves every response
+under HTTP_FIXTURES_DIR and HTTP_FIXTURES_MODE=replay serves them back
+without touching the network (see ``scripts/bench_fetchers.py``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlencode, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from src import metrics
+
+logger = logging.getLogger(__name__)
+
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+HTTP_BACKOFF_BASE_SECONDS = float(os.getenv("HTTP_BACKOFF_BASE_SECONDS", "0.5"))
+HTTP_BACKOFF_MAX_SECONDS = float(os.getenv("HTTP_BACKOFF_MAX_SECONDS", "30"))
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "10"))
+
+HTTP_BREAKER_FAILURES = int(os.getenv("HTTP_BREAKER_FAILURES", "5"))
+HTTP_BREAKER_COOLDOWN_SECONDS = float(os.getenv("HTTP_BREAKER_COOLDOWN_SECONDS", "300"))
+HTTP_FIXTURES_MODE = os.getenv("HTTP_FIXTURES_MODE", "").lower()  # "", "record" or "replay"
+HTTP_FIXTURES_DIR = Path(os.getenv("HTTP_FIXTURES_DIR", "fixtures/http"))
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _host_key(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def get_session(url: str) -> requests.Session:
+    """Return the pooled keep-alive session for ``url``'s host."""
+    key = _host_key(url)
+    session = _sessions.get(key)
+    if session is not None:
+        return session
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[key] = session
+        return session
+
+
+def close_sessions() -> None:
+    """Close every pooled session (called on shutdown)."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+# ---------- Circuit breaker / host health ----------
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised instead of sending a request while a host's breaker is open."""
+
+
+class _HostHealth:
+    """Breaker state and running stats for one source host.
+
+    closed → open after ``HTTP_BREAKER_FAILURES`` consecutive failures;
+    open → half-open once the cool-down has passed, letting one trial
+    request through; the trial's outcome closes or re-opens the breaker.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+        self.successes = 0
+        self.failures = 0
+        self.latency_ewma: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def acquire(self, url: str) -> bool:
+        """Admit a request or raise CircuitOpenError; True when it is the half-open trial."""
+        with self.lock:
+            if self.state == "closed":
+                return False
+            if self.state == "open" and time.monotonic() - self.opened_at >= HTTP_BREAKER_COOLDOWN_SECONDS:
+                self.state = "half_open"
+            if self.state == "half_open" and not self.trial_in_flight:
+                self.trial_in_flight = True
+                return True
+        raise CircuitOpenError(f"Circuit open for {_host_key(url)}; skipping GET {url}")
+
+    def release_trial(self) -> None:
+        """Free the trial slot even when the request ended without ``record``."""
+        with self.lock:
+            self.trial_in_flight = False
+
+    def record(self, ok: bool, seconds: float, error: Optional[str] = None) -> None:
+        with self.lock:
+            self.trial_in_flight = False
+            self.latency_ewma = seconds if self.latency_ewma is None else 0.8 * self.latency_ewma + 0.2 * seconds
+            if ok:
+                self.successes += 1
+                self.consecutive_failures = 0
+                if self.state != "closed":
+                    logger.info("Circuit closed again after successful trial request")
+                self.state = "closed"
+                return
+            self.failures += 1
+            self.consecutive_failures += 1
+            self.last_error = error
+            if self.state == "half_open" or self.consecutive_failures >= HTTP_BREAKER_FAILURES:
+                if self.state != "open":
+                    logger.warning(
+                        "Circuit opened after %d consecutive failures (%s); cooling down %.0fs",
+                        self.consecutive_failures, error, HTTP_BREAKER_COOLDOWN_SECONDS,
+                    )
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict:
+        with self.lock:
+            total = self.successes + self.failures
+            retry_in = None
+            if self.state == "open":
+                retry_in = max(0.0, HTTP_BREAKER_COOLDOWN_SECONDS - (time.monotonic() - self.opened_at))
+            return {
+                "state": self.state,
+                "success_rate": round(self.successes / total, 3) if total else None,
+                "requests": total,
+                "consecutive_failures": self.consecutive_failures,
+                "latency_ms": round(self.latency_ewma * 1000) if self.latency_ewma is not None else None,
+                "retry_in_seconds": round(retry_in, 1) if retry_in is not None else None,
+                "last_error": self.last_error,
+            }
+
+
+_health: Dict[str, _HostHealth] = {}
+
+
+def _health_for(url: str) -> _HostHealth:
+    key = _host_key(url)
+    health = _health.get(key)
+    if health is None:
+        with _sessions_lock:
+            health = _health.setdefault(key, _HostHealth())
+    return health
+
+
+def host_health() -> Dict[str, Dict]:
+    """Breaker state, success rate and latency for every host contacted so far."""
+    return {host: health.snapshot() for host, health in list(_health.items())}
+
+
+def is_available(url: str) -> bool:
+    """False while ``url``'s host has an open breaker (cool-down not over)."""
+    health = _health.get(_host_key(url))
+    if health is None:
+        return True
+    with health.lock:
+        return not (
+            health.state == "open"
+            and time.monotonic() - health.opened_at < HTTP_BREAKER_COOLDOWN_SECONDS
+        )
+
+
+# ---------- Record / replay fixtures ----------
+
+def use_fixtures(mode: str, directory: Optional[Path | str] = None) -> None:
+    """Switch fixture mode at runtime: ``"record"``, ``"replay"`` or ``""`` (off)."""
+    global HTTP_FIXTURES_MODE, HTTP_FIXTURES_DIR
+    if mode not in ("", "record", "replay"):
+        raise ValueError(f"Unknown fixture mode {mode!r}")
+    HTTP_FIXTURES_MODE = mode
+    if directory is not None:
+        HTTP_FIXTURES_DIR = Path(directory)
+
+
+def _fixture_paths(url: str, params: Optional[Dict]) -> tuple[Path, Path]:
+    query = urlencode(sorted((params or {}).items()), doseq=True)
+    key = hashlib.sha1(f"{url}?{query}".encode("utf-8")).hexdigest()
+    return HTTP_FIXTURES_DIR / f"{key}.body", HTTP_FIXTURES_DIR / f"{key}.json"
+
+
+def _record_fixture(url: str, params: Optional[Dict], resp: requests.Response) -> None:
+    if resp.status_code == 304:
+        # Conditional revalidation only makes sense with the HTTP cache's body.
+        return
+    body_path, meta_path = _fixture_paths(url, params)
+    meta = {
+        "url": url,
+        "params": params or {},
+        "status_code": resp.status_code,
+        "encoding": resp.encoding,
+        "headers": dict(resp.headers),
+    }
+    try:
+        HTTP_FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(resp.content)
+        meta_path.write_text(json.dumps(meta, indent=1), encoding="utf-8")
+    except OSError as exc:
+        logger.warning("Could not record fixture for %s: %s", url, exc)
+
+
+def _replay_fixture(url: str, params: Optional[Dict]) -> requests.Response:
+    """Rebuild a recorded response; a missing fixture fails like a dead host."""
+    body_path, meta_path = _fixture_paths(url, params)
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        body = body_path.read_bytes()
+    except (OSError, ValueError):
+        raise requests.ConnectionError(f"No recorded fixture for GET {url} {params or ''}") from None
+    resp = requests.Response()
+    resp.status_code = meta["status_code"]
+    resp._content = body
+    resp.headers = CaseInsensitiveDict(meta.get("headers") or {})
+    resp.url = url
+    resp.encoding = meta.get("encoding")
+    return resp
+
+
+def _retry_after_seconds(resp: requests.Response) -> Optional[float]:
+    """Parse a ``Retry-After`` header given as seconds or an HTTP date."""
+    value = (resp.headers.get("Retry-After") or "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _backoff_seconds(attempt: int) -> float:
+    """Full-jitter exponential backoff for the given zero-based attempt."""
+    ceiling = min(HTTP_BACKOFF_MAX_SECONDS, HTTP_BACKOFF_BASE_SECONDS * (2 ** attempt))
+    return random.uniform(0, ceiling)
+
+
+def get(
+    url: str,
+    params: Optional[Dict] = None,
+    headers: Optional[Dict] = None,
+    timeout: tuple[float, float] | float = (5, 15),
+    retries: Optional[int] = None,
+) -> requests.Response:
+    """GET through the host's pooled session with retry/backoff.
+
+    Args:
+        retries: Extra attempts after the first one (default HTTP_MAX_RETRIES).
+
+    Connection errors and timeouts are retried and re-raised once attempts
+    run out.  While the host's circuit breaker is open, ``CircuitOpenError``
+    (a ``requests.ConnectionError``) is raised without sending anything.  A retryable status (429/5xx) on the final attempt is returned
+    as-is so callers' ``raise_for_status()`` handles it as before.
+    """
+    if HTTP_FIXTURES_MODE == "replay":
+        return _replay_fixture(url, params)
+
+    session = get_session(url)
+    health = _health_for(url)
+    host = _host_key(url)
+    attempts = 1 + (HTTP_MAX_RETRIES if retries is None else max(0, retries))
+
+    attempt = 0
+    while True:
+        last_attempt = attempt >= attempts - 1
+        trial = health.acquire(url)
+        try:
+            started = time.monotonic()
+            try:
+                resp = session.get(url, params=params, headers=headers, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                elapsed = time.monotonic() - started
+                health.record(False, elapsed, type(exc).__name__)
+                metrics.observe_request(host, elapsed, ok=False)
+                if last_attempt:
+                    raise
+                delay = _backoff_seconds(attempt)
+                logger.debug("GET %s failed (%s); retrying in %.2fs", url, exc, delay)
+            except requests.RequestException as exc:
+                elapsed = time.monotonic() - started
+                health.record(False, elapsed, type(exc).__name__)
+                metrics.observe_request(host, elapsed, ok=False)
+                raise
+            else:
+                elapsed = time.monotonic() - started
+                retryable = resp.status_code in RETRY_STATUSES
+                health.record(not retryable, elapsed, f"HTTP {resp.status_code}" if retryable else None)
+                metrics.observe_request(host, elapsed, 0 if retryable else len(resp.content), ok=not retryable)
+                if not retryable or last_attempt:
+                    if HTTP_FIXTURES_MODE == "record":
+                        _record_fixture(url, params, resp)
+                    return resp
+                retry_after = _retry_after_seconds(resp)
+                delay = min(
+                    HTTP_BACKOFF_MAX_SECONDS,
+                    retry_after if retry_after is not None else _backoff_seconds(attempt),
+                )
+                logger.debug("GET %s returned %d; retrying in %.2fs", url, resp.status_code, delay)
+                resp.close()
+        finally:
+            # Errors outside the handled ones (bad URL, decode errors) never
+            # reach record(); without this the trial slot stays taken.
+            if trial:
+                health.release_trial()
+        metrics.count_retry(host)
+        time.sleep(delay)
+        attempt += 1
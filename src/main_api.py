@@ -33,11 +33,15 @@ async def lifespan(app):
 
     # Initialize databases
     from src.models import init_models_db
-    from src.store import init_db
+    from src.store import init_db, load_known_keys
 
     init_db()
     init_models_db()
 
+    # Seed the known-key index off the event loop; incremental crawls use it
+    # to stop at the first page with nothing new.
+    asyncio.get_running_loop().run_in_executor(None, load_known_keys)
+
     # Start background polling
     polling_task = asyncio.create_task(run_polling_loop())
     logger.info("✅ Polling loop started in background")
@@ -52,7 +56,9 @@ async def lifespan(app):
         pass
 
     from src.store import cleanup
+    from src.http_client import close_sessions
     cleanup()
+    close_sessions()
     logger.info("✅ Cleanup complete")
 
 
@@ -0,0 +1,214 @@
+"""In-process fetch metrics: per-host request stats and per-source crawl yield.
+
+Two views are kept, both cumulative since process start:
+
+- **hosts** (keyed like the circuit breaker, ``scheme://netloc``): requests,
+  errors, retries, cache hits, response bytes and a latency histogram.
+  Recorded by :func:`src.http_client.get` and the disk cache.
+- **sources** (keyed by the record ``source`` a fetch path produces, e.g.
+  ``FDA-food``, ``USDA-web``, ``USDA-mirror``): pages crawled, failed
+  pages, records yielded and records that turned out to be new.  Recorded
+  by the fetchers and by the polling loop after saving.
+
+:func:`snapshot` / :func:`delta` give the numbers for one poll cycle, and
+:func:`render_prometheus` the text exposition format for scrapers.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+# Upper bounds (seconds) of the request latency histogram buckets.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_HOST_COUNTERS = ("requests", "errors", "retries", "cache_hits", "bytes")
+_SOURCE_COUNTERS = ("pages", "failed_pages", "records", "new_records")
+
+_lock = threading.Lock()
+_hosts: Dict[str, Dict] = {}
+_sources: Dict[str, Dict] = {}
+
+
+def _host(host: str) -> Dict:
+    stats = _hosts.get(host)
+    if stats is None:
+        stats = _hosts[host] = {name: 0 for name in _HOST_COUNTERS}
+        stats["latency"] = {"buckets": [0] * (len(LATENCY_BUCKETS) + 1), "sum": 0.0, "count": 0}
+    return stats
+
+
+def _source(source: str) -> Dict:
+    stats = _sources.get(source)
+    if stats is None:
+        stats = _sources[source] = {name: 0 for name in _SOURCE_COUNTERS}
+    return stats
+
+
+def observe_request(host: str, seconds: float, nbytes: int = 0, ok: bool = True) -> None:
+    """Record one HTTP attempt against ``host``."""
+    bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS) if seconds <= bound), len(LATENCY_BUCKETS))
+    with _lock:
+        stats = _host(host)
+        stats["requests"] += 1
+        stats["bytes"] += nbytes
+        if not ok:
+            stats["errors"] += 1
+        latency = stats["latency"]
+        latency["buckets"][bucket] += 1
+        latency["sum"] += seconds
+        latency["count"] += 1
+
+
+def count_retry(host: str) -> None:
+    with _lock:
+        _host(host)["retries"] += 1
+
+
+def count_cache_hit(url: str) -> None:
+    """A response for ``url`` served from the disk cache (fresh entry or 304)."""
+    parsed = urlparse(url)
+    with _lock:
+        _host(f"{parsed.scheme}://{parsed.netloc}")["cache_hits"] += 1
+
+
+def record_page(source: str, records: Optional[List]) -> None:
+    """Record one crawled page for ``source``; ``records`` is None when it failed."""
+    with _lock:
+        stats = _source(source)
+        if records is None:
+            stats["failed_pages"] += 1
+        else:
+            stats["pages"] += 1
+            stats["records"] += len(records)
+
+
+def record_new(records: List) -> None:
+    """Count records that were new to the store, by their ``source``."""
+    with _lock:
+        for record in records:
+            _source(record.get("source") or "unknown")["new_records"] += 1
+
+
+def snapshot() -> Dict[str, Dict]:
+    """Deep copy of the current counters: ``{"hosts": {...}, "sources": {...}}``."""
+    with _lock:
+        hosts = {
+            host: {**stats, "latency": {**stats["latency"], "buckets": list(stats["latency"]["buckets"])}}
+            for host, stats in _hosts.items()
+        }
+        sources = {source: dict(stats) for source, stats in _sources.items()}
+    return {"hosts": hosts, "sources": sources}
+
+
+def _latency_quantile(latency: Dict, q: float) -> Optional[float]:
+    """Upper bucket bound holding the ``q`` quantile (None when empty/overflowing)."""
+    target = q * latency["count"]
+    seen = 0
+    for bound, count in zip(LATENCY_BUCKETS, latency["buckets"]):
+        seen += count
+        if count and seen >= target:
+            return bound
+    return None
+
+
+def delta(before: Dict[str, Dict], after: Optional[Dict[str, Dict]] = None) -> Dict[str, Dict]:
+    """Counters accumulated between two snapshots (``after`` defaults to now).
+
+    Hosts and sources without activity in between are left out; hosts get
+    ``mean_latency`` and ``p95_latency`` (bucket bound) added.
+    """
+    after = after or snapshot()
+    hosts = {}
+    for host, stats in after["hosts"].items():
+        prev = before["hosts"].get(host)
+        diff = {name: stats[name] - (prev[name] if prev else 0) for name in _HOST_COUNTERS}
+        if not diff["requests"] and not diff["cache_hits"]:
+            continue
+        prev_latency = prev["latency"] if prev else {"buckets": [0] * len(stats["latency"]["buckets"]), "sum": 0.0, "count": 0}
+        latency = {
+            "buckets": [a - b for a, b in zip(stats["latency"]["buckets"], prev_latency["buckets"])],
+            "sum": stats["latency"]["sum"] - prev_latency["sum"],
+            "count": stats["latency"]["count"] - prev_latency["count"],
+        }
+        diff["latency"] = latency
+        diff["mean_latency"] = round(latency["sum"] / latency["count"], 3) if latency["count"] else None
+        diff["p95_latency"] = _latency_quantile(latency, 0.95)
+        hosts[host] = diff
+    sources = {}
+    for source, stats in after["sources"].items():
+        prev = before["sources"].get(source) or {}
+        diff = {name: stats[name] - prev.get(name, 0) for name in _SOURCE_COUNTERS}
+        if any(diff.values()):
+            sources[source] = diff
+    return {"hosts": hosts, "sources": sources}
+
+
+def format_summary(summary: Dict[str, Dict]) -> List[str]:
+    """One log line per host and per source of a :func:`delta` result."""
+    lines = []
+    for host, stats in sorted(summary["hosts"].items()):
+        lines.append(
+            f"{host}: {stats['requests']} requests ({stats['errors']} errors, {stats['retries']} retries,"
+            f" {stats['cache_hits']} cached), {stats['bytes'] / 1e6:.1f} MB,"
+            f" mean {stats['mean_latency']}s, p95 <= {stats['p95_latency']}s"
+        )
+    for source, stats in sorted(summary["sources"].items()):
+        lines.append(
+            f"{source}: {stats['pages']} pages ({stats['failed_pages']} failed),"
+            f" {stats['records']} records, {stats['new_records']} new"
+        )
+    return lines
+
+
+def render_prometheus() -> str:
+    """Current counters in the Prometheus text exposition format."""
+    data = snapshot()
+    lines = []
+
+    def _family(name: str, kind: str, help_text: str) -> None:
+        lines.append(f"# HELP recall_{name} {help_text}")
+        lines.append(f"# TYPE recall_{name} {kind}")
+
+    host_help = {
+        "requests": "HTTP attempts sent.",
+        "errors": "HTTP attempts that failed or returned a retryable status.",
+        "retries": "HTTP attempts retried.",
+        "cache_hits": "Responses served from the disk cache.",
+        "bytes": "Response body bytes received.",
+    }
+    for name in _HOST_COUNTERS:
+        _family(f"http_{name}_total", "counter", host_help[name])
+        for host, stats in sorted(data["hosts"].items()):
+            lines.append(f'recall_http_{name}_total{{host="{host}"}} {stats[name]}')
+
+    _family("http_request_seconds", "histogram", "HTTP attempt latency.")
+    for host, stats in sorted(data["hosts"].items()):
+        latency = stats["latency"]
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), latency["buckets"]):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else f"{bound:g}"
+            lines.append(f'recall_http_request_seconds_bucket{{host="{host}",le="{le}"}} {cumulative}')
+        lines.append(f'recall_http_request_seconds_sum{{host="{host}"}} {latency["sum"]:.6f}')
+        lines.append(f'recall_http_request_seconds_count{{host="{host}"}} {latency["count"]}')
+
+    source_help = {
+        "pages": "Pages crawled.",
+        "failed_pages": "Pages that could not be fetched.",
+        "records": "Records yielded by crawled pages.",
+        "new_records": "Records new to the store.",
+    }
+    for name in _SOURCE_COUNTERS:
+        _family(f"fetch_{name}_total", "counter", source_help[name])
+        for source, stats in sorted(data["sources"].items()):
+            lines.append(f'recall_fetch_{name}_total{{source="{source}"}} {stats[name]}')
+    return "\n".join(lines) + "\n"
+
+
+def reset() -> None:
+    """Clear all counters (benchmarks and scripts)."""
+    with _lock:
+        _hosts.clear()
+        _sources.clear()
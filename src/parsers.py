@@ -0,0 +1,515 @@
+"""Parser backends for the scraped recall sources.
+
+Three page formats are parsed: FSIS recall listing pages (HTML), their
+r.jina.ai markdown mirror, and the FDA recalls table (HTML).  Two backends
+produce identical records:
+
+``lxml``  lxml XPath for HTML plus a precompiled single-pass tokenizer for
+          the mirror.  The default; falls back to BeautifulSoup for HTML
+          when lxml is not installed.
+``bs4``   The original BeautifulSoup/``html.parser`` implementation, kept as
+          the reference the fast path is checked against.
+
+Select with PARSER_BACKEND; ``scripts/bench_parsers.py`` compares both on
+saved pages.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from typing import Callable, Dict, List, NamedTuple
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from src.records import RecallRecord
+
+try:
+    import lxml.html as lxml_html
+except ImportError:  # optional dependency
+    lxml_html = None
+
+PARSER_BACKEND = os.getenv("PARSER_BACKEND", "lxml").lower()
+
+FSIS_BASE_URL = "https://www.fsis.usda.gov"
+
+_AFFECTED_AREA_RE = re.compile(
+    r"\b(?:NATIONWIDE|MIDWEST|NORTHEAST|SOUTHEAST|SOUTHWEST|WEST|PUERTO\s+RICO)\b", re.IGNORECASE
+)
+# Region labels in the order they are preferred when a card mentions several.
+_AREA_PRIORITY = ("NATIONWIDE", "MIDWEST", "NORTHEAST", "SOUTHEAST", "SOUTHWEST", "WEST", "PUERTO RICO")
+_RECALL_NUMBER_RE = re.compile(r"\b\d{3}-\d{4}\b")
+_STATUS_RE = re.compile(r"\b(ACTIVE|CLOSED|TERMINATED)\b", re.IGNORECASE)
+_US_DATE_RE = re.compile(r"\b\d{1,2}/\d{1,2}/\d{4}\b")
+
+
+def extract_affected_area(text: str) -> str | None:
+    """Extract a likely affected area token from card/body text."""
+    if not text:
+        return None
+    found: Dict[str, str] = {}
+    for m in _AFFECTED_AREA_RE.finditer(text):
+        found.setdefault(re.sub(r"\s+", " ", m.group(0).upper()), m.group(0).upper())
+    for area in _AREA_PRIORITY:
+        if area in found:
+            return found[area]
+    return None
+
+
+def extract_usda_recall_number(*texts: str | None) -> str | None:
+    """Extract USDA recall number, typically like '012-2026'."""
+    for text in texts:
+        if not text:
+            continue
+        m = _RECALL_NUMBER_RE.search(text)
+        if m:
+            return m.group(0)
+    return None
+
+
+def _usda_listing_record(
+    title: str,
+    link: str,
+    summary: str | None,
+    node_text: str,
+    company_name: str | None,
+    time_text: str | None,
+) -> RecallRecord:
+    status_match = _STATUS_RE.search(node_text)
+    status = status_match.group(1).upper() if status_match else None
+    affected_area = extract_affected_area(node_text)
+
+    report_date = time_text
+    if not report_date:
+        # Fallback: extract first MM/DD/YYYY-like date in card text.
+        m = _US_DATE_RE.search(node_text)
+        report_date = m.group(0) if m else None
+
+    return RecallRecord(
+        source="USDA-web",
+        recall_number=extract_usda_recall_number(title, link, node_text),
+        brand_name=None,
+        product_description=title,
+        product_type="Food",
+        reason_for_recall=summary,
+        company_name=company_name,
+        status=status,
+        affected_area=affected_area,
+        report_date=report_date,
+        recall_initiation_date=report_date,
+        url=link,
+        raw={
+            "title": title,
+            "summary": summary,
+            "link": link,
+            "report_date": report_date,
+            "status": status,
+            "affected_area": affected_area,
+        },
+    )
+
+
+def _fda_table_record(cells: List[str], source_url: str) -> RecallRecord:
+    # Expected FDA table columns:
+    # Date | Brand Name(s) | Product Description | Product Type |
+    # Recall Reason Description | Company Name | Terminated ...
+    date_text, brand_names, product_description, product_type, reason, company = cells[:6]
+    status = "ACTIVE" if not cells[6] else "TERMINATED"
+    return RecallRecord(
+        source="FDA-web",
+        recall_number=None,
+        brand_name=brand_names,
+        brand_names=brand_names,
+        product_description=product_description,
+        product_type=product_type,
+        reason_for_recall=reason,
+        company_name=company,
+        status=status,
+        affected_area=None,
+        report_date=date_text,
+        recall_initiation_date=date_text,
+        url=source_url,
+        raw={
+            "date": date_text,
+            "brand_names": brand_names,
+            "product_description": product_description,
+            "product_type": product_type,
+            "reason_for_recall": reason,
+            "company_name": company,
+            "status": status,
+        },
+    )
+
+
+def _usda_mirror_record(
+    title: str,
+    link: str,
+    company_name: str | None,
+    status: str | None,
+    report_date: str | None,
+    affected_area: str | None,
+    reason: str | None,
+) -> RecallRecord:
+    return RecallRecord(
+        source="USDA-mirror",
+        recall_number=extract_usda_recall_number(title, link),
+        brand_name=None,
+        product_description=title,
+        product_type="Food",
+        reason_for_recall=reason,
+        company_name=company_name,
+        status=status,
+        affected_area=affected_area,
+        report_date=report_date,
+        recall_initiation_date=report_date,
+        url=link,
+        raw={
+            "title": title,
+            "link": link,
+            "company_name": company_name,
+            "status": status,
+            "report_date": report_date,
+            "affected_area": affected_area,
+            "reason_for_recall": reason,
+        },
+    )
+
+
+# ---------- BeautifulSoup backend (reference) ----------
+
+_LISTING_CARDS = "article, .views-row, .usa-collection__item, .usa-card, .node--type-recall"
+
+
+def _bs4_parse_usda_listing(html: str) -> List[Dict]:
+    soup = BeautifulSoup(html, "html.parser")
+    results: List[Dict] = []
+    seen_links = set()
+    for node in soup.select(_LISTING_CARDS):
+        link_tag = node.select_one("h2 a, h3 a, a")
+        if not link_tag:
+            continue
+
+        title = link_tag.get_text(" ", strip=True)
+        if not title:
+            continue
+
+        link = urljoin(FSIS_BASE_URL, link_tag.get("href") or "")
+        if not link or link in seen_links:
+            continue
+        seen_links.add(link)
+
+        summary_tag = node.select_one("p")
+        company_tag = node.select_one(".field--name-field-establishment a, .field--name-field-company a")
+        date_tag = node.select_one("time")
+        results.append(
+            _usda_listing_record(
+                title,
+                link,
+                summary_tag.get_text(" ", strip=True) if summary_tag else None,
+                node.get_text(" ", strip=True),
+                company_tag.get_text(" ", strip=True) if company_tag else None,
+                date_tag.get_text(" ", strip=True) if date_tag else None,
+            )
+        )
+    return results
+
+
+def _bs4_parse_fda_table(html: str, source_url: str, limit: int | None = None) -> List[Dict]:
+    soup = BeautifulSoup(html, "html.parser")
+    results: List[Dict] = []
+    for row in soup.select("table tbody tr")[:limit]:
+        cols = row.select("td")
+        if len(cols) < 7:
+            continue
+        results.append(_fda_table_record([col.get_text(" ", strip=True) for col in cols], source_url))
+    return results
+
+
+def _regex_parse_usda_mirror(text: str) -> List[Dict]:
+    """Line-window mirror parser: rescans up to 24 lines after every title."""
+    results: List[Dict] = []
+    seen_links = set()
+    lines = text.splitlines()
+
+    i = 0
+    while i < len(lines):
+        line = lines[i].strip()
+
+        # Recall entry title line format:
+        # ### [Title](http://www.fsis.usda.gov/recalls-alerts/...)
+        m_title = re.match(r"^### \[(.+?)\]\((http[^)]+/recalls-alerts/[^)]+)\)", line)
+        if not m_title:
+            i += 1
+            continue
+
+        title = m_title.group(1).strip()
+        link = m_title.group(2).strip()
+        if not link or link in seen_links:
+            i += 1
+            continue
+        seen_links.add(link)
+
+        company_name = None
+        status = None
+        report_date = None
+        affected_area = None
+        reason = None
+
+        # Parse a small window after title to extract metadata.
+        j = i + 1
+        window_end = min(i + 25, len(lines))
+        while j < window_end:
+            s = lines[j].strip()
+            if not s:
+                j += 1
+                continue
+
+            # Stop at next recall title.
+            if s.startswith("### ["):
+                break
+
+            if company_name is None:
+                m_company = re.match(r"^\[(.+?)\]\(http[^)]+/inspection/[^)]+\)", s)
+                if m_company:
+                    company_name = m_company.group(1).strip()
+                    j += 1
+                    continue
+
+            if status is None and re.fullmatch(r"(?i)(active|closed|terminated)", s):
+                status = s.upper()
+                j += 1
+                continue
+
+            if report_date is None:
+                m_date = re.search(r"\b(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s*\d{2}/\d{2}/\d{4}\b", s)
+                if m_date:
+                    report_date = m_date.group(0)
+                    j += 1
+                    continue
+
+            if affected_area is None and re.fullmatch(r"(?i)(nationwide|midwest|northeast|southeast|southwest|west|puerto rico|current)\b.*", s):
+                affected_area = s.upper()
+                j += 1
+                continue
+
+            if reason is None and ("WASHINGTON," in s or "U.S. Department of Agriculture" in s):
+                reason = s
+
+            j += 1
+
+        results.append(
+            _usda_mirror_record(title, link, company_name, status, report_date, affected_area, reason)
+        )
+
+        # Resume at the line that ended the window so an adjacent title is
+        # not skipped.
+        i = j
+
+    return results
+
+
+# ---------- lxml backend + single-pass mirror tokenizer ----------
+
+def _class_test(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+_LXML_LISTING_CARDS = " | ".join(
+    ["//article"]
+    + [f"//*[{_class_test(name)}]" for name in ("views-row", "usa-collection__item", "usa-card", "node--type-recall")]
+)
+_LXML_COMPANY_LINK = (
+    f"(.//*[{_class_test('field--name-field-establishment')} or {_class_test('field--name-field-company')}]//a)[1]"
+)
+
+
+def _lxml_text(element) -> str:
+    """Equivalent of BeautifulSoup's ``get_text(" ", strip=True)``."""
+    return " ".join(s for s in (t.strip() for t in element.xpath(".//text()")) if s)
+
+
+def _lxml_document(html: str):
+    try:
+        return lxml_html.document_fromstring(html)
+    except Exception:  # lxml rejects empty documents
+        return None
+
+
+def _lxml_parse_usda_listing(html: str) -> List[Dict]:
+    doc = _lxml_document(html)
+    if doc is None:
+        return []
+    results: List[Dict] = []
+    seen_links = set()
+    for node in doc.xpath(_LXML_LISTING_CARDS):
+        link_tags = node.xpath("(.//a)[1]")
+        if not link_tags:
+            continue
+
+        title = _lxml_text(link_tags[0])
+        if not title:
+            continue
+
+        link = urljoin(FSIS_BASE_URL, link_tags[0].get("href") or "")
+        if not link or link in seen_links:
+            continue
+        seen_links.add(link)
+
+        summary_tags = node.xpath("(.//p)[1]")
+        company_tags = node.xpath(_LXML_COMPANY_LINK)
+        time_tags = node.xpath("(.//time)[1]")
+        results.append(
+            _usda_listing_record(
+                title,
+                link,
+                _lxml_text(summary_tags[0]) if summary_tags else None,
+                _lxml_text(node),
+                _lxml_text(company_tags[0]) if company_tags else None,
+                _lxml_text(time_tags[0]) if time_tags else None,
+            )
+        )
+    return results
+
+
+def _lxml_parse_fda_table(html: str, source_url: str, limit: int | None = None) -> List[Dict]:
+    doc = _lxml_document(html)
+    if doc is None:
+        return []
+    results: List[Dict] = []
+    for row in doc.xpath("//table//tbody//tr")[:limit]:
+        cols = row.xpath(".//td")
+        if len(cols) < 7:
+            continue
+        results.append(_fda_table_record([_lxml_text(col) for col in cols], source_url))
+    return results
+
+
+_MIRROR_TITLE_RE = re.compile(r"### \[(.+?)\]\((http[^)]+/recalls-alerts/[^)]+)\)")
+_MIRROR_COMPANY_RE = re.compile(r"\[(.+?)\]\(http[^)]+/inspection/[^)]+\)")
+_MIRROR_STATUS_RE = re.compile(r"(?i)(active|closed|terminated)")
+_MIRROR_DATE_RE = re.compile(r"\b(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s*\d{2}/\d{2}/\d{4}\b")
+_MIRROR_AREA_RE = re.compile(r"(?i)(nationwide|midwest|northeast|southeast|southwest|west|puerto rico|current)\b.*")
+# Metadata is only looked for this many lines below a title.
+_MIRROR_WINDOW = 24
+
+
+def _tokenize_usda_mirror(text: str) -> List[Dict]:
+    """Single pass over the mirror markdown with precompiled patterns.
+
+    Each line is classified once: a title line opens a new entry, any other
+    non-blank line within the metadata window fills the first still-empty
+    field it matches.  Cheap prefix/character checks run before each regex.
+    """
+    results: List[Dict] = []
+    seen_links = set()
+    entry = None
+    window_left = 0
+
+    for raw_line in text.splitlines():
+        s = raw_line.strip()
+        if window_left:
+            window_left -= 1
+        if not s:
+            continue
+
+        if s.startswith("### ["):
+            if entry is not None:
+                results.append(_usda_mirror_record(**entry))
+                entry = None
+            window_left = 0
+            m_title = _MIRROR_TITLE_RE.match(s)
+            if not m_title:
+                continue
+            link = m_title.group(2).strip()
+            if link in seen_links:
+                continue
+            seen_links.add(link)
+            entry = {
+                "title": m_title.group(1).strip(),
+                "link": link,
+                "company_name": None,
+                "status": None,
+                "report_date": None,
+                "affected_area": None,
+                "reason": None,
+            }
+            window_left = _MIRROR_WINDOW + 1
+            continue
+
+        if entry is None or not window_left:
+            continue
+
+        if entry["company_name"] is None and s[0] == "[":
+            m_company = _MIRROR_COMPANY_RE.match(s)
+            if m_company:
+                entry["company_name"] = m_company.group(1).strip()
+                continue
+
+        if entry["status"] is None and len(s) <= 10 and _MIRROR_STATUS_RE.fullmatch(s):
+            entry["status"] = s.upper()
+            continue
+
+        if entry["report_date"] is None and "/" in s:
+            m_date = _MIRROR_DATE_RE.search(s)
+            if m_date:
+                entry["report_date"] = m_date.group(0)
+                continue
+
+        if entry["affected_area"] is None and _MIRROR_AREA_RE.fullmatch(s):
+            entry["affected_area"] = s.upper()
+            continue
+
+        if entry["reason"] is None and ("WASHINGTON," in s or "U.S. Department of Agriculture" in s):
+            entry["reason"] = s
+
+    if entry is not None:
+        results.append(_usda_mirror_record(**entry))
+    return results
+
+
+# ---------- Backend selection ----------
+
+class ParserBackend(NamedTuple):
+    name: str
+    parse_usda_listing: Callable[[str], List[Dict]]
+    parse_usda_mirror: Callable[[str], List[Dict]]
+    parse_fda_table: Callable[..., List[Dict]]
+
+
+BACKENDS: Dict[str, ParserBackend] = {
+    "bs4": ParserBackend("bs4", _bs4_parse_usda_listing, _regex_parse_usda_mirror, _bs4_parse_fda_table),
+    "lxml": ParserBackend(
+        "lxml",
+        _lxml_parse_usda_listing if lxml_html is not None else _bs4_parse_usda_listing,
+        _tokenize_usda_mirror,
+        _lxml_parse_fda_table if lxml_html is not None else _bs4_parse_fda_table,
+    ),
+}
+
+
+def get_parser_backend(name: str | None = None) -> ParserBackend:
+    """Return the named backend (default PARSER_BACKEND); unknown names raise ValueError."""
+    name = (name or PARSER_BACKEND).lower()
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown PARSER_BACKEND {name!r}; expected one of {sorted(BACKENDS)}") from None
+
+
+def parse_usda_listing(html: str) -> List[Dict]:
+    """Parse one FSIS recalls listing page into records (deduped within the page).
+
+    Returns an empty list when the page has no recall cards (end of pagination).
+    """
+    return get_parser_backend().parse_usda_listing(html)
+
+
+def parse_usda_mirror(text: str) -> List[Dict]:
+    """Parse one r.jina.ai markdown rendering of a FSIS listing page."""
+    return get_parser_backend().parse_usda_mirror(text)
+
+
+def parse_fda_table(html: str, source_url: str, limit: int | None = None) -> List[Dict]:
+    """Parse the first ``limit`` rows of the FDA recalls table."""
+    return get_parser_backend().parse_fda_table(html, source_url, limit)
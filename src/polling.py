@@ -4,14 +4,31 @@ from __future__ import annotations
 
 import logging
 import os
+import time
 
 from pathlib import Path
 from dotenv import load_dotenv
 
 load_dotenv(Path(__file__).resolve().parent.parent / ".env")
 
-from src.fetcher import fetch_fda_recalls, fetch_usda_recalls, iter_fda_recalls_pages
-from src.store import init_db, save_if_new, get_recall_count
+from src.fetcher import (
+    fetch_fda_recalls,
+    fetch_fda_recalls_incremental,
+    fetch_usda_recalls,
+    aiter_fda_recalls_pages,
+    plan_fda_shards,
+    iter_usda_recalls_pages,
+)
+from src import metrics
+from src.http_client import host_health
+from src.store import (
+    init_db,
+    save_many,
+    get_recall_count,
+    get_fetch_state,
+    set_fetch_state,
+    is_known_recall,
+)
 from src.models import (
     init_models_db,
     get_all_users,
@@ -24,6 +41,26 @@ from src.notifier import send_email_smtp
 logger = logging.getLogger(__name__)
 
 FETCH_INTERVAL = int(os.getenv("FETCH_INTERVAL_MINUTES", "60"))
+# "incremental" asks openFDA only for records past the stored watermark;
+# "full" re-pulls the most recent 200 records every cycle.
+FDA_FETCH_MODE = os.getenv("FDA_FETCH_MODE", "incremental").lower()
+# "incremental" only crawls the USDA site/mirror when the RSS feed changed;
+# "full" crawls the first pages on every cycle.
+USDA_FETCH_MODE = os.getenv("USDA_FETCH_MODE", "incremental").lower()
+_FDA_WATERMARKS_KEY = "fda_watermarks"
+_USDA_FEED_STATE_KEY = "usda_feed"
+_HISTORICAL_FDA_KEY = "historical_fda"
+_HISTORICAL_USDA_KEY = "historical_usda"
+_POLL_METRICS_KEY = "poll_metrics"
+# Each historical checkpoint is one fetch_state document (Firestore
+# sustains about one write per second to it), so it is written every N
+# pages or T seconds and whenever a shard / crawl stage finishes.  Pages are
+# idempotent saves, so a resume at most re-fetches the pages since the last
+# write.
+_CHECKPOINT_EVERY_PAGES = 20
+_CHECKPOINT_EVERY_SECONDS = 30.0
+
+_historical_task = None  # asyncio.Task for the background historical crawl
 
 
 async def broadcast_alert(user_id: int, alert_message: dict):
@@ -40,19 +77,135 @@ async def broadcast_alert(user_id: int, alert_message: dict):
 
 
 async def _full_historical_usda_fetch() -> None:
-    """Fetch all USDA records, saving to DB. Runs concurrently with FDA fetch."""
+    """Fetch all USDA records, saving to DB. Runs concurrently with FDA fetch.
+
+    Pages stream in from ``iter_usda_recalls_pages`` and are saved as they
+    arrive.  Progress (crawl stage + page numbers) is checkpointed in the
+    store at the throttled checkpoint rate and on every stage change, so a
+    restarted worker resumes close to where the last one stopped.
+    """
     import asyncio
-    import functools
+    from concurrent.futures import ThreadPoolExecutor
 
-    loop = asyncio.get_event_loop()
-    logger.info("Historical USDA fetch started…")
+    checkpoint = get_fetch_state(_HISTORICAL_USDA_KEY) or {}
+    if checkpoint.get("stage") == "done":
+        return
+
+    # One dedicated thread drives the generator, so closing it below queues
+    # behind a next() still running when the task is cancelled instead of
+    # racing it ("generator already executing").
+    crawler = ThreadPoolExecutor(max_workers=1, thread_name_prefix="usda-history")
+    pages = iter_usda_recalls_pages(checkpoint)
+    saved = 0
+    # The crawl advances ``checkpoint`` before yielding a batch; only the
+    # state as of the last saved batch is safe to persist.
+    saved_state = dict(checkpoint)
+    unsaved_pages = 0
+    written_at = time.monotonic()
+
+    logger.info("Historical USDA fetch started (checkpoint: %s)…", checkpoint or "fresh")
     try:
-        usda_items = await loop.run_in_executor(None, functools.partial(fetch_usda_recalls, limit=None))
-        for item in usda_items:
-            save_if_new(item)
-        logger.info("Historical USDA fetch complete — %d USDA recalls saved, %d total in DB", len(usda_items), get_recall_count())
+        # Each step of the crawl (download + parse) runs in a worker thread;
+        # saves and checkpoints happen here, in page order.
+        while True:
+            batch = await asyncio.wrap_future(crawler.submit(next, pages, None))
+            if batch is None:
+                break
+            metrics.record_new([record for record, _ in save_many(batch)])
+            saved += len(batch)
+            saved_state = dict(checkpoint)
+            unsaved_pages += 1
+            # An empty batch marks a crawl stage change.
+            if (
+                not batch
+                or unsaved_pages >= _CHECKPOINT_EVERY_PAGES
+                or time.monotonic() - written_at >= _CHECKPOINT_EVERY_SECONDS
+            ):
+                set_fetch_state(_HISTORICAL_USDA_KEY, saved_state)
+                unsaved_pages = 0
+                written_at = time.monotonic()
+        logger.info("Historical USDA fetch complete — %d USDA recalls saved, %d total in DB", saved, get_recall_count())
     except Exception as exc:
         logger.warning("Historical USDA fetch failed: %s", exc)
+    finally:
+        if unsaved_pages:
+            set_fetch_state(_HISTORICAL_USDA_KEY, saved_state)
+        closing = crawler.submit(pages.close)
+        crawler.shutdown(wait=False)
+        await asyncio.wrap_future(closing)
+
+
+def _advance_fda_checkpoint(progress: dict, pending: dict, page) -> bool:
+    """Move a shard's resume offset past every contiguously completed page.
+
+    Pages arrive out of order from the async engine, so a page beyond a gap
+    is remembered in ``pending`` until the gap is filled.  Returns True when
+    the shard is now complete.
+    """
+    shard = progress.setdefault(page.shard, {"skip": 0})
+    shard["total"] = page.total
+    done = pending.setdefault(page.shard, {})
+    done[page.skip] = len(page)
+    while shard["skip"] in done:
+        shard["skip"] += done.pop(shard["skip"])
+    return shard["skip"] >= shard["total"]
+
+
+async def _full_historical_fda_fetch() -> None:
+    """Fetch all FDA enforcement records page-by-page with a resumable checkpoint."""
+    checkpoint = get_fetch_state(_HISTORICAL_FDA_KEY) or {}
+    if checkpoint.get("done"):
+        return
+    if not checkpoint.get("shards"):
+        # Plan the report_date slices once and persist them, so a resumed
+        # crawl continues the same shards its progress offsets refer to.
+        checkpoint["shards"] = await plan_fda_shards()
+        checkpoint["progress"] = {}
+        logger.info("Historical fetch: planned %d openFDA shards", len(checkpoint["shards"]))
+    progress = checkpoint.setdefault("progress", {})
+    set_fetch_state(_HISTORICAL_FDA_KEY, checkpoint)
+    pending: dict = {}
+
+    # The async engine pages every shard concurrently and yields each page as
+    # it arrives, so records are saved progressively and the website shows
+    # data after the very first page.
+    start_skips = {key: state.get("skip", 0) for key, state in progress.items()}
+    page_num = 0
+    unsaved_pages = 0
+    saved_at = time.monotonic()
+    try:
+        async for page in aiter_fda_recalls_pages(start_skips=start_skips, shards=checkpoint["shards"]):
+            metrics.record_new([record for record, _ in save_many(page)])
+            shard_done = _advance_fda_checkpoint(progress, pending, page)
+            unsaved_pages += 1
+            if (
+                shard_done
+                or unsaved_pages >= _CHECKPOINT_EVERY_PAGES
+                or time.monotonic() - saved_at >= _CHECKPOINT_EVERY_SECONDS
+            ):
+                set_fetch_state(_HISTORICAL_FDA_KEY, checkpoint)
+                unsaved_pages = 0
+                saved_at = time.monotonic()
+            page_num += 1
+            if page_num % 10 == 0:
+                logger.info("Historical fetch: %d pages processed (%d total recalls in DB)", page_num, get_recall_count())
+    except Exception as exc:
+        logger.warning("Historical fetch page error: %s", exc)
+        return
+    finally:
+        if unsaved_pages:
+            set_fetch_state(_HISTORICAL_FDA_KEY, checkpoint)
+
+    # Only finish once every non-empty shard is contiguous to its end; a
+    # failed page leaves a gap that the next resume picks up from.
+    if all(
+        shard["key"] in progress and progress[shard["key"]]["skip"] >= progress[shard["key"]].get("total", 0)
+        for shard in checkpoint["shards"]
+        if shard.get("total") != 0
+    ):
+        checkpoint["done"] = True
+        set_fetch_state(_HISTORICAL_FDA_KEY, checkpoint)
+    logger.info("Full historical FDA fetch complete — %d recalls in DB", get_recall_count())
 
 
 async def _full_historical_fetch() -> None:
@@ -61,43 +214,52 @@ async def _full_historical_fetch() -> None:
     Runs in the background after the initial seed so the website has data
     immediately while the full history loads progressively.
     FDA and USDA are fetched concurrently so USDA doesn't wait for FDA to finish.
+    Both halves resume from their stored checkpoints after a restart.
     """
     import asyncio
-    import functools
 
-    loop = asyncio.get_event_loop()
     logger.info("Full historical fetch started — FDA + USDA running concurrently…")
 
     # Launch USDA concurrently so it doesn't wait for all FDA pages to complete
     usda_task = asyncio.create_task(_full_historical_usda_fetch())
+    await _full_historical_fda_fetch()
+    await usda_task
 
-    # FDA: iterate page-by-page via the generator so records are saved
-    # progressively and the website shows data after the very first page.
-    gen = iter_fda_recalls_pages()
-    page_num = 0
 
-    def _next_page(g):
-        try:
-            return next(g)
-        except StopIteration:
-            return None
-
-    while True:
-        try:
-            page = await loop.run_in_executor(None, _next_page, gen)
-        except Exception as exc:
-            logger.warning("Historical fetch page error: %s", exc)
-            break
-        if page is None:
-            break
-        for item in page:
-            save_if_new(item)
-        page_num += 1
-        if page_num % 10 == 0:
-            logger.info("Historical fetch: %d pages processed (%d total recalls in DB)", page_num, get_recall_count())
+def _historical_fetch_pending() -> bool:
+    """True when a previous historical crawl was checkpointed but not finished."""
+    fda = get_fetch_state(_HISTORICAL_FDA_KEY)
+    usda = get_fetch_state(_HISTORICAL_USDA_KEY)
+    return bool(
+        (fda is not None and not fda.get("done"))
+        or (usda is not None and usda.get("stage") != "done")
+    )
 
-    logger.info("Full historical FDA fetch complete — %d recalls in DB", get_recall_count())
-    await usda_task
+
+def _start_historical_fetch() -> None:
+    """Launch the background historical crawl unless one is already running."""
+    import asyncio
+
+    global _historical_task
+    if _historical_task is not None and not _historical_task.done():
+        return
+    _historical_task = asyncio.create_task(_full_historical_fetch())
+
+
+def _log_poll_metrics(before: dict) -> None:
+    """Log and persist per-host / per-source fetch metrics for this cycle.
+
+    Counters are process-wide, so a historical crawl running in the
+    background during the cycle is included.  The summary is stored under
+    ``poll_metrics`` for the API's /metrics endpoint, which may run in
+    another process.
+    """
+    from datetime import datetime
+
+    summary = metrics.delta(before)
+    for line in metrics.format_summary(summary):
+        logger.info("Poll metrics — %s", line)
+    set_fetch_state(_POLL_METRICS_KEY, {"finished_at": datetime.utcnow().isoformat(), **summary})
 
 
 async def poll_and_alert() -> None:
@@ -111,40 +273,71 @@ async def poll_and_alert() -> None:
     init_models_db()
 
     loop = asyncio.get_event_loop()
+    metrics_before = metrics.snapshot()
 
     # On the very first run the store is empty: immediately seed with the most
     # recent 200 FDA records so the website has data right away, then launch
     # a background task to fetch all historical records (back to 2014) page by
-    # page.  On subsequent runs only a recent batch is fetched.
+    # page.  On subsequent runs only FDA records past the stored watermark are
+    # fetched (or the recent 200 when FDA_FETCH_MODE=full).
     # All blocking HTTP fetches run in a thread pool so the event loop stays free.
     store_count = get_recall_count()
+    fda_watermarks = None
+    usda_feed_state = None
     if store_count == 0:
         logger.info("Empty store — seeding with recent records so the website loads immediately…")
         # Fetch recent FDA and USDA concurrently for fast initial seed
         recent_fda_task = loop.run_in_executor(None, functools.partial(fetch_fda_recalls, limit=200))
         recent_usda_task = loop.run_in_executor(None, functools.partial(fetch_usda_recalls, limit=50))
         recent_fda, recent_usda = await asyncio.gather(recent_fda_task, recent_usda_task)
-        for item in recent_fda:
-            save_if_new(item)
-        for item in recent_usda:
-            save_if_new(item)
+        seeded = save_many(recent_fda + recent_usda)
+        metrics.record_new([record for record, _ in seeded])
         logger.info("Seeded %d FDA + %d USDA recalls — launching full historical fetch in background…", len(recent_fda), len(recent_usda))
         # Full historical fetch (2014→now) runs in the background — no awaiting
-        asyncio.create_task(_full_historical_fetch())
+        _start_historical_fetch()
         fda_items = recent_fda
         usda_items = recent_usda
+        # The seed is the back catalogue, not news: nothing to alert on.
+        new_recalls = []
     else:
-        fda_items = await loop.run_in_executor(None, functools.partial(fetch_fda_recalls, limit=200))
-        usda_items = await loop.run_in_executor(None, functools.partial(fetch_usda_recalls, limit=50))
+        # A deploy or restart may have interrupted the historical crawl —
+        # resume it from its checkpoint rather than starting over.
+        if _historical_fetch_pending():
+            logger.info("Resuming interrupted historical fetch from checkpoint…")
+            _start_historical_fetch()
+        if FDA_FETCH_MODE == "incremental":
+            fda_watermarks = get_fetch_state(_FDA_WATERMARKS_KEY) or {}
+            fda_items = await loop.run_in_executor(
+                None, functools.partial(fetch_fda_recalls_incremental, fda_watermarks)
+            )
+        else:
+            fda_items = await loop.run_in_executor(None, functools.partial(fetch_fda_recalls, limit=200))
+        if USDA_FETCH_MODE == "incremental":
+            usda_feed_state = get_fetch_state(_USDA_FEED_STATE_KEY) or {}
+        usda_items = await loop.run_in_executor(
+            None,
+            functools.partial(fetch_usda_recalls, limit=50, feed_state=usda_feed_state, is_known=is_known_recall),
+        )
 
-    all_items = fda_items + usda_items
     logger.info("Fetched %d FDA + %d USDA recalls", len(fda_items), len(usda_items))
+    for host, health in host_health().items():
+        if health["state"] != "closed":
+            logger.warning(
+                "Source %s circuit %s (%s); retry in %ss",
+                host, health["state"], health["last_error"], health["retry_in_seconds"],
+            )
+
+    if store_count != 0:
+        new_recalls = save_many(fda_items + usda_items)
+        metrics.record_new([record for record, _ in new_recalls])
 
-    new_recalls = []
-    for item in all_items:
-        saved = save_if_new(item)
-        if saved:
-            new_recalls.append((item, saved))
+    # Advance the FDA watermarks / USDA feed fingerprint only once everything
+    # they cover is stored.
+    if fda_watermarks is not None:
+        set_fetch_state(_FDA_WATERMARKS_KEY, fda_watermarks)
+    if usda_feed_state is not None:
+        set_fetch_state(_USDA_FEED_STATE_KEY, usda_feed_state)
+    _log_poll_metrics(metrics_before)
 
     if not new_recalls:
         logger.info("No new recalls this cycle.")
@@ -160,7 +353,7 @@ async def poll_and_alert() -> None:
 
     import time as _time
     alert_count = 0
-    for recall_record, saved_obj in new_recalls:
+    for recall_record, saved_id in new_recalls:
         parsed = parse_recall(recall_record)
         _time.sleep(4)  # 15 req/min free-tier limit → space calls 4s apart
 
@@ -182,7 +375,6 @@ async def poll_and_alert() -> None:
             alert_text = generate_alert(recall_record, matched, user.language)
 
             recall_number = recall_record.get("recall_number")
-            saved_id = getattr(saved_obj, "id", None)
             alert = create_alert(
                 user_id=user.id,
                 recall_number=recall_number,
@@ -31,6 +31,7 @@ async def main():
     """Run polling loop continuously."""
     from src.models import init_models_db
     from src.store import init_db, cleanup
+    from src.http_client import close_sessions
     from src.polling import poll_and_alert
 
     logger.info("🚀 Starting RecallAlert-AI Background Polling Worker…")
@@ -60,6 +61,7 @@ async def main():
         sys.exit(1)
     finally:
         cleanup()
+        close_sessions()
         logger.info("Polling worker shutdown complete")
 
 
@@ -0,0 +1,81 @@
+"""Compact recall record type used on the fetch → store → match hot path.
+
+Fetchers used to hand around plain dicts that also carried the full source
+payload under ``raw`` (for openFDA, the whole enforcement item including its
+nested ``openfda`` block).  :class:`RecallRecord` keeps the normalized fields
+in ``__slots__`` and is a read-only ``Mapping`` over them, so existing
+``record.get(...)``, ``record[...]`` and ``{**record}`` callers keep working.
+
+The source payload is kept on the ``raw`` attribute only when
+RECALL_KEEP_RAW=true, and is never part of the mapping view: it no longer
+travels into LLM prompts through ``{**record}``.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional
+
+RECALL_KEEP_RAW = os.getenv("RECALL_KEEP_RAW", "false").lower() in ("1", "true", "yes")
+
+RECALL_FIELDS = (
+    "source",
+    "recall_number",
+    "brand_name",
+    "brand_names",
+    "product_description",
+    "product_type",
+    "reason_for_recall",
+    "company_name",
+    "status",
+    "affected_area",
+    "report_date",
+    "recall_initiation_date",
+    "code_info",
+    "url",
+)
+_FIELD_SET = frozenset(RECALL_FIELDS)
+
+
+class RecallRecord(Mapping):
+    """One normalized recall; a read-only mapping over :data:`RECALL_FIELDS`."""
+
+    __slots__ = RECALL_FIELDS + ("raw",)
+
+    def __init__(self, raw: Optional[Dict[str, Any]] = None, **fields: Any):
+        unknown = fields.keys() - _FIELD_SET
+        if unknown:
+            raise TypeError(f"Unknown recall fields: {', '.join(sorted(unknown))}")
+        for name in RECALL_FIELDS:
+            setattr(self, name, fields.get(name))
+        self.raw = raw if RECALL_KEEP_RAW else None
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(RECALL_FIELDS)
+
+    def __len__(self) -> int:
+        return len(RECALL_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"RecallRecord({self.source!r}, {self.recall_number!r}, {self.product_description!r})"
+
+    def __reduce__(self):
+        # Records cross process boundaries (parse pool); rebuild from fields.
+        return _rebuild, (dict(self), self.raw)
+
+    def to_dict(self, include_raw: bool = False) -> Dict[str, Any]:
+        """Plain dict copy, e.g. for JSON output; ``raw`` only when asked and kept."""
+        data = dict(self)
+        if include_raw and self.raw is not None:
+            data["raw"] = self.raw
+        return data
+
+
+def _rebuild(fields: Dict[str, Any], raw: Optional[Dict[str, Any]]) -> RecallRecord:
+    return RecallRecord(raw=raw, **fields)
@@ -9,9 +9,14 @@ from __future__ import annotations
 
 import os
 import re
+import json
+import base64
+import math
 import hashlib
 import logging
-from datetime import datetime
+import calendar
+import threading
+from datetime import date, datetime
 from urllib.parse import urlparse
 from typing import Optional, Dict, Any
 
@@ -79,38 +84,74 @@ def _dedupe_records(records: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
     return deduped
 
 
-def _parse_recall_date(value: Optional[str]) -> Optional[datetime]:
+# Source date formats across FDA/USDA feeds: 20240131, 01/31/2024,
+# "Wed, 01/31/2024", "January 31, 2024" (and the ISO form stored here).
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+_COMPACT_DATE_RE = re.compile(r"(\d{4})(\d{2})(\d{2})")
+_US_DATE_RE = re.compile(r"(?:[A-Za-z]{3},\s*)?(\d{1,2})/(\d{1,2})/(\d{4})")
+_MONTH_DATE_RE = re.compile(r"([A-Za-z]{3,9})\.?\s+(\d{1,2}),?\s+(\d{4})")
+_MONTHS = {
+    name.lower(): number
+    for number in range(1, 13)
+    for name in (calendar.month_name[number], calendar.month_abbr[number])
+}
+
+
+def _canonical_date(value: Optional[str]) -> Optional[str]:
+    """Normalize a source date to ``YYYY-MM-DD``; unknown formats are kept as-is.
+
+    Runs once per record at ingest (and in the backfill migration), so the
+    request path never parses dates.
+    """
     raw = (value or "").strip()
     if not raw:
         return None
 
-    # Known source date formats across FDA/USDA feeds.
-    for fmt in (
-        "%Y-%m-%d",
-        "%Y%m%d",
-        "%m/%d/%Y",
-        "%a, %m/%d/%Y",
-        "%B %d, %Y",
-        "%b %d, %Y",
-    ):
-        try:
-            return datetime.strptime(raw, fmt)
-        except ValueError:
-            continue
-    return None
+    m = _ISO_DATE_RE.fullmatch(raw) or _COMPACT_DATE_RE.fullmatch(raw)
+    if m:
+        year, month, day = m.group(1), m.group(2), m.group(3)
+    else:
+        m = _US_DATE_RE.fullmatch(raw)
+        if m:
+            year, month, day = m.group(3), m.group(1), m.group(2)
+        else:
+            m = _MONTH_DATE_RE.fullmatch(raw)
+            month_number = _MONTHS.get(m.group(1).lower()) if m else None
+            if not month_number:
+                return raw
+            year, month, day = m.group(3), month_number, m.group(2)
+    try:
+        return date(int(year), int(month), int(day)).isoformat()
+    except ValueError:
+        return raw
 
 
-def _recall_sort_key(record: Dict[str, Any]) -> tuple[datetime, int]:
-    report_dt = _parse_recall_date(record.get("report_date"))
-    init_dt = _parse_recall_date(record.get("recall_initiation_date"))
-    best_dt = report_dt or init_dt or datetime.min
+def _recall_day(report_date: Optional[str], initiation_date: Optional[str]) -> int:
+    """Sortable day number (proleptic ordinal) of a recall's canonical dates.
 
+    Prefers ``report_date`` and falls back to ``recall_initiation_date``;
+    0 when neither is a valid ISO date, so undated recalls sort oldest.
+    """
+    for value in (report_date, initiation_date):
+        if value and _ISO_DATE_RE.fullmatch(value):
+            return date.fromisoformat(value).toordinal()
+    return 0
+
+
+def _canonical_dates(record: Dict[str, Any]) -> tuple[Optional[str], Optional[str], int]:
+    """(report_date, recall_initiation_date, report_day) to store for ``record``."""
+    report_date = _canonical_date(record.get("report_date"))
+    initiation_date = _canonical_date(record.get("recall_initiation_date"))
+    return report_date, initiation_date, _recall_day(report_date, initiation_date)
+
+
+def _recall_sort_key(record: Dict[str, Any]) -> tuple[int, int]:
     try:
         row_id = int(record.get("id") or 0)
     except (TypeError, ValueError):
         row_id = 0
 
-    return best_dt, row_id
+    return record.get("report_day") or 0, row_id
 
 
 def _sort_recalls_latest_first(records: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
@@ -151,6 +192,23 @@ def _status_matches(value: Optional[str], status_filter: Optional[str]) -> bool:
     return normalized == target
 
 
+def _status_filter_values(status_filter: str) -> list[str]:
+    """Upper-cased stored statuses a ``status`` filter matches (as _status_matches)."""
+    target = status_filter.strip().upper()
+    return {
+        "ACTIVE": ["ACTIVE", "ONGOING"],
+        "INACTIVE": ["CLOSED", "TERMINATED", "COMPLETED"],
+        "RESOLVED": ["CLOSED", "TERMINATED"],
+        "COMPLETE": ["COMPLETED"],
+    }.get(target, [target])
+
+
+def _source_family(source: Optional[str]) -> str:
+    """FDA / USDA for their source variants (FDA-food, USDA-web, ...), else the source."""
+    key = (source or "").strip().upper()
+    return next((family for family in ("FDA", "USDA") if key.startswith(family)), key)
+
+
 def _record_matches(record: Dict[str, Any], source: Optional[str], status: Optional[str], q: Optional[str]) -> bool:
     if not _source_matches(record.get("source"), source):
         return False
@@ -238,16 +296,50 @@ def _init_firestore() -> None:
     _firestore_client = firestore.client()
 
 
+def _firestore_doc(record: Dict[str, Any]) -> tuple[str, Dict[str, Any]]:
+    """(document id, document data) a recall is stored as in Firestore."""
+    recall_number = _norm_recall_number(record.get("recall_number")) or None
+    doc_id = _sanitize_doc_id(str(recall_number or _fallback_id(record)))
+    report_date, initiation_date, report_day = _canonical_dates(record)
+    return doc_id, {
+        "recall_number": recall_number,
+        "external_id": doc_id,
+        "source": record.get("source"),
+        "brand_name": record.get("brand_name"),
+        "product_description": record.get("product_description"),
+        "product_type": record.get("product_type"),
+        "reason_for_recall": record.get("reason_for_recall"),
+        "company_name": record.get("company_name") or record.get("recalling_firm"),
+        "status": record.get("status"),
+        "affected_area": record.get("affected_area") or record.get("distribution_pattern"),
+        "report_date": report_date,
+        "recall_initiation_date": initiation_date,
+        "report_day": report_day,
+        "url": record.get("url"),
+        **_firestore_query_keys(record.get("source"), record.get("status")),
+        # Documents sharing a dedupe_key are one recall; only the first
+        # stored is listed (the save paths set ``listed``).
+        "dedupe_key": _canonical_record_key(record),
+        "listed": True,
+    }
+
+
+def _firestore_query_keys(source: Optional[str], status: Optional[str]) -> Dict[str, str]:
+    """Normalized fields the list filters query with equality (see _firestore_filtered)."""
+    return {
+        "source_key": (source or "").strip().upper(),
+        "source_family": _source_family(source),
+        "status_key": (status or "").strip().upper(),
+    }
+
+
 def _firestore_save_if_new(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Save recall to Firestore if not already present (doc id = stable external id)."""
     _init_firestore()
 
-    recall_number = _norm_recall_number(record.get("recall_number")) or None
-    raw_doc_id = str(recall_number or _fallback_id(record))
-    doc_id = _sanitize_doc_id(raw_doc_id)
-    
-    logger.info(f"Saving recall with doc_id={doc_id} (raw={raw_doc_id})")
-    
+    doc_id, data = _firestore_doc(record)
+    logger.info(f"Saving recall with doc_id={doc_id}")
+
     try:
         doc_ref = _firestore_client.collection("recalls").document(doc_id)
     except ValueError as e:
@@ -257,27 +349,74 @@ def _firestore_save_if_new(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     if snap.exists:
         return None
 
-    doc_ref.set(
-        {
-            "recall_number": recall_number,
-            "external_id": doc_id,
-            "source": record.get("source"),
-            "brand_name": record.get("brand_name"),
-            "product_description": record.get("product_description"),
-            "product_type": record.get("product_type"),
-            "reason_for_recall": record.get("reason_for_recall"),
-            "company_name": record.get("company_name") or record.get("recalling_firm"),
-            "status": record.get("status"),
-            "affected_area": record.get("affected_area") or record.get("distribution_pattern"),
-            "report_date": record.get("report_date"),
-            "recall_initiation_date": record.get("recall_initiation_date"),
-            "url": record.get("url"),
-        }
-    )
+    data["listed"] = not _firestore_stored_dedupe_keys([data["dedupe_key"]])
+    doc_ref.set(data)
     return record
 
 
+# Firestore caps a write batch at 500 operations and an "in" filter at 30 values.
+_FIRESTORE_BATCH = 400
+_FIRESTORE_IN_LIMIT = 30
+
+
+def _firestore_stored_dedupe_keys(keys: list[str]) -> set[str]:
+    """The ``keys`` some stored recall document already has as its dedupe_key."""
+    collection = _firestore_client.collection("recalls")
+    found = set()
+    for start in range(0, len(keys), _FIRESTORE_IN_LIMIT):
+        query = collection.where("dedupe_key", "in", keys[start:start + _FIRESTORE_IN_LIMIT]).select(["dedupe_key"])
+        found |= {doc.to_dict().get("dedupe_key") for doc in query.stream()}
+    return found
+
+
+def _firestore_save_many(records: list[dict]) -> list[tuple[dict, None]]:
+    """Batched save: one ``get_all`` existence check and one write batch per chunk."""
+    _init_firestore()
+    collection = _firestore_client.collection("recalls")
+    docs: Dict[str, tuple] = {}
+    for record in records:
+        doc_id, data = _firestore_doc(record)
+        docs.setdefault(doc_id, (record, data))
+
+    saved = []
+    listed_keys: set = set()  # dedupe keys listed by an earlier chunk of this call
+    doc_ids = list(docs)
+    for start in range(0, len(doc_ids), _FIRESTORE_BATCH):
+        refs = [collection.document(doc_id) for doc_id in doc_ids[start:start + _FIRESTORE_BATCH]]
+        existing = {snap.id for snap in _firestore_client.get_all(refs) if snap.exists}
+        new_refs = [ref for ref in refs if ref.id not in existing]
+        stored_keys = _firestore_stored_dedupe_keys(
+            sorted({docs[ref.id][1]["dedupe_key"] for ref in new_refs} - listed_keys)
+        )
+        batch = _firestore_client.batch()
+        for ref in new_refs:
+            record, data = docs[ref.id]
+            key = data["dedupe_key"]
+            data["listed"] = key not in stored_keys and key not in listed_keys
+            listed_keys.add(key)
+            batch.set(ref, data)
+            saved.append((record, None))
+        batch.commit()
+    return saved
+
+
+def _firestore_get_fetch_state(key: str) -> Optional[Dict[str, Any]]:
+    _init_firestore()
+    snap = _firestore_client.collection("fetch_state").document(_sanitize_doc_id(key)).get()
+    if not snap.exists:
+        return None
+    return (snap.to_dict() or {}).get("value")
+
+
+def _firestore_set_fetch_state(key: str, value: Dict[str, Any]) -> None:
+    _init_firestore()
+    _firestore_client.collection("fetch_state").document(_sanitize_doc_id(key)).set(
+        {"value": value, "updated_at": datetime.utcnow().isoformat()}
+    )
+
+
 # ---------- SQLite (existing) ----------
+from sqlalchemy import Index  # noqa: E402
 from sqlmodel import SQLModel, Field, create_engine, Session, select  # noqa: E402
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///recalls.db")
@@ -287,6 +426,17 @@ if DATABASE_URL.startswith("postgres://"):
 _engine = create_engine(DATABASE_URL, echo=False)
 
 class Recall(SQLModel, table=True):
+    # recall_number holds the canonical store key (see _store_key), so it is
+    # unique.  The composites serve the source / status filters (as leading
+    # columns) and their date ordering; (report_day, id) is the list order
+    # and the keyset-pagination seek key.
+    __table_args__ = (
+        Index("ux_recall_recall_number", "recall_number", unique=True),
+        Index("ix_recall_day_id", "report_day", "id"),
+        Index("ix_recall_source_day", "source", "report_day", "id"),
+        Index("ix_recall_status_day", "status", "report_day", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     recall_number: str
     reason_for_recall: Optional[str] = None
@@ -300,9 +450,333 @@ class Recall(SQLModel, table=True):
     affected_area: Optional[str] = None
     report_date: Optional[str] = None
     url: Optional[str] = None
+    # Day number of report_date (else recall_initiation_date); 0 = undated.
+    report_day: int = 0
+    # Searched fields lowercased with non-alphanumerics removed, "|"-joined,
+    # so "Ready Meal" finds "ReadyMeal" (see _search_spaceless).
+    search_spaceless: Optional[str] = None
+
+class FetchState(SQLModel, table=True):
+    """Small key/value table for fetcher bookkeeping (watermarks, checkpoints)."""
+    key: str = Field(primary_key=True)
+    value: str = "{}"  # JSON-encoded dict
+    updated_at: Optional[str] = None
 
 def _sqlite_init_db() -> None:
     SQLModel.metadata.create_all(_engine)
+    _sqlite_add_missing_columns()
+    _sqlite_add_missing_indexes()
+    _sqlite_init_search()
+
+
+# Columns added to Recall after its first release, with their DDL type.
+_ADDED_COLUMNS = {
+    "report_day": "INTEGER NOT NULL DEFAULT 0",
+    "search_spaceless": "VARCHAR",
+}
+
+
+def _sqlite_add_missing_columns() -> None:
+    """Add columns introduced after a table was created (create_all skips them)."""
+    from sqlalchemy import inspect, text
+
+    table = Recall.__tablename__
+    columns = {column["name"] for column in inspect(_engine).get_columns(table)}
+    with _engine.begin() as conn:
+        for name, ddl in _ADDED_COLUMNS.items():
+            if name not in columns:
+                logger.info("Adding %s.%s column", table, name)
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
+
+
+def _sqlite_index_names() -> set:
+    from sqlalchemy import inspect
+
+    return {index["name"] for index in inspect(_engine).get_indexes(Recall.__tablename__)}
+
+
+def _sqlite_duplicate_recalls(conn) -> list[tuple[int, int]]:
+    """(duplicate row id, oldest row id) for every recall_number stored twice."""
+    from sqlalchemy import text
+
+    table = Recall.__tablename__
+    return [tuple(row) for row in conn.execute(text(
+        f"SELECT r.id, k.keep_id FROM {table} r JOIN ("
+        f"SELECT recall_number, MIN(id) AS keep_id FROM {table} WHERE recall_number IS NOT NULL"
+        f" GROUP BY recall_number HAVING COUNT(*) > 1"
+        f") k ON r.recall_number = k.recall_number WHERE r.id <> k.keep_id"
+    ))]
+
+
+def _sqlite_merge_duplicate_recalls() -> int:
+    """Merge duplicate recall rows, then add the unique recall_number index.
+
+    Older check-then-insert saves could store a recall twice.  Each
+    duplicate's alerts (``Alert.recall_id``) are repointed to the oldest
+    row before the duplicate is deleted, so no alert is orphaned.  Returns
+    rows deleted.
+    """
+    from sqlalchemy import inspect, text
+    from src.models import Alert
+
+    with _engine.begin() as conn:
+        duplicates = _sqlite_duplicate_recalls(conn)
+        if duplicates:
+            if inspect(conn).has_table(Alert.__tablename__):
+                conn.execute(
+                    text(f"UPDATE {Alert.__tablename__} SET recall_id = :keep_id WHERE recall_id = :dup_id"),
+                    [{"dup_id": dup_id, "keep_id": keep_id} for dup_id, keep_id in duplicates],
+                )
+            conn.execute(
+                text(f"DELETE FROM {Recall.__tablename__} WHERE id = :dup_id"),
+                [{"dup_id": dup_id} for dup_id, _ in duplicates],
+            )
+            logger.warning("Merged %d duplicate recall rows into the oldest row of each", len(duplicates))
+    _sqlite_add_missing_indexes()
+    return len(duplicates)
+
+
+# Indexes older versions created that a declared one now covers.
+_OBSOLETE_INDEXES = ("ix_recall_report_day",)
+
+
+def _sqlite_add_missing_indexes() -> None:
+    """Create the Recall indexes an existing table lacks (create_all skips them).
+
+    A unique index is not built over duplicate rows; merging those is left
+    to the ``recall_unique_numbers_v1`` migration, which runs once and then
+    adds the index.  Indexes listed in _OBSOLETE_INDEXES are dropped.
+    """
+    from sqlalchemy import text
+
+    existing = _sqlite_index_names()
+    for name in _OBSOLETE_INDEXES:
+        if name in existing:
+            logger.info("Dropping index %s", name)
+            with _engine.begin() as conn:
+                conn.execute(text(f"DROP INDEX {name}"))
+    for index in sorted(Recall.__table__.indexes, key=lambda ix: ix.name):
+        if index.name in existing:
+            continue
+        if index.unique:
+            with _engine.connect() as conn:
+                if _sqlite_duplicate_recalls(conn):
+                    logger.warning("Not creating %s: the recall table holds duplicate recall numbers", index.name)
+                    continue
+        logger.info("Creating index %s", index.name)
+        index.create(_engine)
+
+
+def missing_indexes() -> list[str]:
+    """Names of the Recall indexes absent from the database ([] on Firestore).
+
+    Firestore's composite indexes are managed outside the app and are not
+    checked here.
+    """
+    if STORE_BACKEND == "firebase":
+        return []
+    existing = _sqlite_index_names()
+    return sorted(index.name for index in Recall.__table__.indexes if index.name not in existing)
+
+
+# ---------- Full-text search ----------
+# SQLite: an external-content FTS5 table with the trigram tokenizer (SQLite
+# 3.34+), kept in sync by triggers, answers substring queries from an index.
+# Postgres: pg_trgm GIN indexes serve the same ILIKE-style predicates.
+# Elsewhere, or when neither is available, search falls back to LIKE scans.
+_SEARCH_FIELDS = ("product_description", "brand_name", "reason_for_recall", "company_name")
+_FTS_TABLE = "recall_fts"
+_FTS_COLUMNS = _SEARCH_FIELDS + ("search_spaceless",)
+# Trigram indexes only help for terms of at least this many characters.
+_MIN_INDEXED_TERM = 3
+
+_search_mode: Optional[str] = None  # "fts5", "trigram" or "like", set by init
+
+
+def _search_spaceless(record: Dict[str, Any]) -> str:
+    return "|".join(re.sub(r"[^a-z0-9]", "", (record.get(field) or "").lower()) for field in _SEARCH_FIELDS)
+
+
+def _sqlite_fts_statements() -> list[str]:
+    table = Recall.__tablename__
+    columns = ", ".join(_FTS_COLUMNS)
+    new_values = ", ".join(f"new.{column}" for column in _FTS_COLUMNS)
+    old_values = ", ".join(f"old.{column}" for column in _FTS_COLUMNS)
+    delete_old = (
+        f"INSERT INTO {_FTS_TABLE}({_FTS_TABLE}, rowid, {columns}) VALUES ('delete', old.id, {old_values});"
+    )
+    insert_new = f"INSERT INTO {_FTS_TABLE}(rowid, {columns}) VALUES (new.id, {new_values});"
+    return [
+        f"CREATE VIRTUAL TABLE {_FTS_TABLE} USING fts5({columns}, "
+        f"content='{table}', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER {_FTS_TABLE}_ai AFTER INSERT ON {table} BEGIN {insert_new} END",
+        f"CREATE TRIGGER {_FTS_TABLE}_ad AFTER DELETE ON {table} BEGIN {delete_old} END",
+        f"CREATE TRIGGER {_FTS_TABLE}_au AFTER UPDATE ON {table} BEGIN {delete_old} {insert_new} END",
+        f"INSERT INTO {_FTS_TABLE}({_FTS_TABLE}) VALUES ('rebuild')",
+    ]
+
+
+def _sqlite_init_search() -> None:
+    """Create the search index for the engine's dialect and pick the search mode."""
+    global _search_mode
+    from sqlalchemy import text
+    from sqlalchemy.exc import DBAPIError
+
+    table = Recall.__tablename__
+    dialect = _engine.dialect.name
+    try:
+        if dialect == "sqlite":
+            with _engine.begin() as conn:
+                exists = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": _FTS_TABLE}
+                ).first()
+                if not exists:
+                    logger.info("Building %s full-text index", _FTS_TABLE)
+                    for statement in _sqlite_fts_statements():
+                        conn.execute(text(statement))
+            _search_mode = "fts5"
+        elif dialect == "postgresql":
+            with _engine.begin() as conn:
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                for column in _SEARCH_FIELDS:
+                    conn.execute(text(
+                        f"CREATE INDEX IF NOT EXISTS ix_{table}_{column}_trgm "
+                        f"ON {table} USING gin (lower({column}) gin_trgm_ops)"
+                    ))
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS ix_{table}_search_spaceless_trgm "
+                    f"ON {table} USING gin (search_spaceless gin_trgm_ops)"
+                ))
+            _search_mode = "trigram"
+        else:
+            _search_mode = "like"
+    except DBAPIError as exc:
+        # e.g. SQLite built without FTS5 / trigram, or no rights to add pg_trgm.
+        logger.warning("Full-text index unavailable (%s); search scans with LIKE", exc)
+        _search_mode = "like"
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _fts_phrase(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _sql_search(q: str):
+    """SQL condition equivalent to _record_matches' text search for ``q``.
+
+    A record matches when the lowercased query is a substring of one of the
+    searched fields, or its alphanumerics are a substring of the spaceless
+    column.  Because the spaceless column can only hold alphanumeric runs,
+    matching both terms against every indexed column is the same test.
+
+    Matches need no _dedupe_records pass: every SQL row stores its store
+    key (normalized recall number or fallback id) as ``recall_number``, so
+    its canonical key is ``rn:<recall_number>``, which the unique
+    ux_recall_recall_number index already makes distinct.
+    """
+    from sqlalchemy import func, or_, text
+
+    q_lower = q.lower()
+    q_spaceless = re.sub(r"[^a-z0-9]", "", q_lower)
+    terms = [q_lower] + ([q_spaceless] if q_spaceless and q_spaceless != q_lower else [])
+
+    if _search_mode is None:
+        _sqlite_init_search()
+    if _search_mode == "fts5" and all(len(term) >= _MIN_INDEXED_TERM for term in terms):
+        match = " OR ".join(_fts_phrase(term) for term in terms)
+        return Recall.id.in_(
+            text(f"SELECT rowid FROM {_FTS_TABLE} WHERE {_FTS_TABLE} MATCH :fts_query").bindparams(fts_query=match)
+        )
+
+    conditions = [
+        func.lower(getattr(Recall, field)).like(_like_pattern(q_lower), escape="\\") for field in _SEARCH_FIELDS
+    ]
+    if q_spaceless:
+        conditions.append(Recall.search_spaceless.like(_like_pattern(q_spaceless), escape="\\"))
+    return or_(*conditions)
+
+
+def _sqlite_backfill_search() -> int:
+    """Fill search_spaceless on rows stored before it existed; returns rows changed."""
+    return _sqlite_rewrite_rows(
+        (
+            Recall.product_description, Recall.brand_name, Recall.reason_for_recall,
+            Recall.company_name, Recall.search_spaceless,
+        ),
+        lambda row: {"search_spaceless": _search_spaceless(dict(zip(_SEARCH_FIELDS, row)))},
+    )
+
+def _sqlite_recall_row(record: dict, stored_recall_number: str) -> Dict[str, Any]:
+    """Column values a recall is stored with (everything but ``id``)."""
+    report_date, initiation_date, report_day = _canonical_dates(record)
+    return {
+        "recall_number": stored_recall_number,
+        "reason_for_recall": record.get("reason_for_recall", ""),
+        "product_description": record.get("product_description", ""),
+        "recall_initiation_date": initiation_date or "",
+        "source": record.get("source"),
+        "brand_name": record.get("brand_name"),
+        "product_type": record.get("product_type"),
+        "company_name": record.get("company_name") or record.get("recalling_firm"),
+        "status": record.get("status"),
+        "affected_area": record.get("affected_area") or record.get("distribution_pattern"),
+        "report_date": report_date,
+        "url": record.get("url"),
+        "report_day": report_day,
+        "search_spaceless": _search_spaceless(record),
+    }
+
+
+def _recall_dict(recall: Recall) -> Dict[str, Any]:
+    """Row as a plain dict, without internal search columns."""
+    return recall.model_dump(exclude={"search_spaceless"})
+
+
+def _sqlite_recall_from_record(record: dict, stored_recall_number: str) -> Recall:
+    return Recall(**_sqlite_recall_row(record, stored_recall_number))
+
+
+def _sqlite_fallback_exists(sess: Session, record: dict) -> bool:
+    # Fallback dedupe path for sources without official recall numbers.
+    product, reason, initiation_date = _fallback_content(record)
+    q = select(Recall.id).where(
+        Recall.product_description == product,
+        Recall.reason_for_recall == reason,
+        Recall.recall_initiation_date == initiation_date,
+    )
+    return sess.exec(q).first() is not None
+
+
+def _fallback_content(record: dict) -> tuple[str, str, str]:
+    """The (product, reason, initiation date) _sqlite_fallback_exists compares."""
+    return (
+        record.get("product_description") or "",
+        record.get("reason_for_recall") or "",
+        _canonical_date(record.get("recall_initiation_date")) or "",
+    )
+
+
+def _sqlite_existing_fallbacks(sess: Session, records: list[dict]) -> set[tuple[str, str, str]]:
+    """Batch form of _sqlite_fallback_exists: the contents of ``records`` already stored.
+
+    One ``IN`` query per _IN_CHUNK product descriptions fetches the
+    candidate rows; the full triple is matched in memory.
+    """
+    wanted = {_fallback_content(record) for record in records}
+    products = sorted({content[0] for content in wanted})
+    found = set()
+    for start in range(0, len(products), _IN_CHUNK):
+        rows = sess.exec(
+            select(Recall.product_description, Recall.reason_for_recall, Recall.recall_initiation_date)
+            .where(Recall.product_description.in_(products[start:start + _IN_CHUNK]))
+        )
+        found.update(tuple(value or "" for value in row) for row in rows)
+    return wanted & found
+
 
 def _sqlite_save_if_new(record: dict) -> Optional[Recall]:
     with Session(_engine) as sess:
@@ -313,50 +787,427 @@ def _sqlite_save_if_new(record: dict) -> Optional[Recall]:
             existing = sess.exec(q).first()
             if existing:
                 return None
-        else:
-            # Fallback dedupe path for sources without official recall numbers.
-            q = select(Recall).where(
-                Recall.product_description == (record.get("product_description") or ""),
-                Recall.reason_for_recall == (record.get("reason_for_recall") or ""),
-                Recall.recall_initiation_date == (record.get("recall_initiation_date") or ""),
-            )
-            existing = sess.exec(q).first()
-            if existing:
-                return None
+        elif _sqlite_fallback_exists(sess, record):
+            return None
 
-        stored_recall_number = recall_number or _fallback_id(record)
-
-        r = Recall(
-            recall_number=stored_recall_number,
-            reason_for_recall=record.get("reason_for_recall", ""),
-            product_description=record.get("product_description", ""),
-            recall_initiation_date=record.get("recall_initiation_date", ""),
-            source=record.get("source"),
-            brand_name=record.get("brand_name"),
-            product_type=record.get("product_type"),
-            company_name=record.get("company_name") or record.get("recalling_firm"),
-            status=record.get("status"),
-            affected_area=record.get("affected_area") or record.get("distribution_pattern"),
-            report_date=record.get("report_date"),
-            url=record.get("url"),
-        )
+        r = _sqlite_recall_from_record(record, recall_number or _fallback_id(record))
         sess.add(r)
         sess.commit()
         sess.refresh(r)
         return r
 
 
+# Bound on the number of keys per IN (...) lookup (SQLite's default
+# SQLITE_MAX_VARIABLE_NUMBER is 999 on older builds).
+_IN_CHUNK = 500
+
+
+def _insert_ignoring_duplicates():
+    """``INSERT ... ON CONFLICT DO NOTHING`` for the engine's dialect.
+
+    Returns None on dialects without it; callers then rely on the existence
+    check alone.
+    """
+    table = Recall.__table__
+    if _engine.dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    elif _engine.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        return None
+    return insert(table).on_conflict_do_nothing().returning(table.c.id, table.c.recall_number)
+
+
+def _sqlite_save_many(records: list[dict]) -> list[tuple[dict, Optional[int]]]:
+    """Insert the records not stored yet in a single transaction.
+
+    The batch is deduped by store key, checked against the table with one
+    ``IN`` query per _IN_CHUNK keys and inserted with ``ON CONFLICT DO
+    NOTHING ... RETURNING``, so a row a concurrent writer stored in the
+    meantime is skipped rather than duplicated or failing the batch.
+    """
+    batch: Dict[str, dict] = {}
+    for record in records:
+        batch.setdefault(_store_key(record), record)
+
+    with Session(_engine) as sess:
+        keys = list(batch)
+        existing = set()
+        for start in range(0, len(keys), _IN_CHUNK):
+            chunk = keys[start:start + _IN_CHUNK]
+            existing.update(sess.exec(select(Recall.recall_number).where(Recall.recall_number.in_(chunk))))
+
+        # Records without an official number are also matched on content.
+        unnumbered = [
+            record for key, record in batch.items()
+            if key not in existing and not _norm_recall_number(record.get("recall_number"))
+        ]
+        stored_contents = _sqlite_existing_fallbacks(sess, unnumbered) if unnumbered else set()
+
+        pending = {}
+        for key, record in batch.items():
+            if key in existing:
+                continue
+            if not _norm_recall_number(record.get("recall_number")) and _fallback_content(record) in stored_contents:
+                continue
+            pending[key] = record
+        if not pending:
+            return []
+
+        rows = [_sqlite_recall_row(record, key) for key, record in pending.items()]
+        stmt = _insert_ignoring_duplicates()
+        if stmt is None:
+            recalls = [Recall(**row) for row in rows]
+            sess.add_all(recalls)
+            sess.flush()
+            inserted = {recall.recall_number: recall.id for recall in recalls}
+        else:
+            inserted = {recall_number: row_id for row_id, recall_number in sess.execute(stmt, rows)}
+        sess.commit()
+    return [(record, inserted[key]) for key, record in pending.items() if key in inserted]
+
+
+def _sqlite_get_fetch_state(key: str) -> Optional[Dict[str, Any]]:
+    with Session(_engine) as sess:
+        row = sess.get(FetchState, key)
+        return json.loads(row.value) if row else None
+
+
+def _sqlite_set_fetch_state(key: str, value: Dict[str, Any]) -> None:
+    with Session(_engine) as sess:
+        row = sess.get(FetchState, key) or FetchState(key=key)
+        row.value = json.dumps(value)
+        row.updated_at = datetime.utcnow().isoformat()
+        sess.add(row)
+        sess.commit()
+
+
+# ---------- Data migrations ----------
+# One-off rewrites of stored rows, applied by init_db and recorded in
+# fetch_state under _MIGRATIONS_KEY so each runs once per store.
+_MIGRATIONS_KEY = "schema_migrations"
+_MIGRATION_BATCH = 1000
+
+
+def _migrated_dates(report_date: Optional[str], initiation_date: Optional[str]) -> tuple:
+    new_report, new_initiation, report_day = _canonical_dates(
+        {"report_date": report_date, "recall_initiation_date": initiation_date}
+    )
+    return new_report or report_date, new_initiation or initiation_date, report_day
+
+
+def _sqlite_rewrite_rows(columns: tuple, rewrite) -> int:
+    """Rewrite Recall rows in id order, one batch per _MIGRATION_BATCH rows.
+
+    ``rewrite(values)`` gets the row's ``columns`` values and returns the
+    new values by column name (always the same names); only rows where
+    they differ are updated.  Returns rows changed.
+    """
+    from sqlalchemy import bindparam, update
+
+    table = Recall.__table__
+    names = [column.key for column in columns]
+    stmt = None
+    changed = 0
+    last_id = 0
+    with Session(_engine) as sess:
+        while True:
+            rows = sess.exec(
+                select(Recall.id, *columns).where(Recall.id > last_id).order_by(Recall.id).limit(_MIGRATION_BATCH)
+            ).all()
+            if not rows:
+                break
+            updates = []
+            for row in rows:
+                current = dict(zip(names, row[1:]))
+                new = rewrite(tuple(row[1:]))
+                if any(current.get(name) != value for name, value in new.items()):
+                    updates.append({"row_id": row[0], **{f"new_{name}": value for name, value in new.items()}})
+            if updates:
+                if stmt is None:
+                    stmt = (
+                        update(table)
+                        .where(table.c.id == bindparam("row_id"))
+                        .values({name: bindparam(f"new_{name}") for name in new})
+                    )
+                sess.connection().execute(stmt, updates)
+                changed += len(updates)
+            last_id = rows[-1][0]
+        sess.commit()
+    return changed
+
+
+def _sqlite_backfill_recall_dates() -> int:
+    """Rewrite stored dates to ISO and fill report_day; returns rows changed."""
+
+    def _rewrite(row: tuple) -> Dict[str, Any]:
+        report_date, initiation_date, report_day = _migrated_dates(row[0], row[1])
+        return {"report_date": report_date, "recall_initiation_date": initiation_date, "report_day": report_day}
+
+    return _sqlite_rewrite_rows(
+        (Recall.report_date, Recall.recall_initiation_date, Recall.report_day), _rewrite
+    )
+
+
+def _firestore_backfill_recall_dates() -> int:
+    """Firestore counterpart of _sqlite_backfill_recall_dates (batched writes)."""
+    _init_firestore()
+    docs = _firestore_client.collection("recalls").select(
+        ["report_date", "recall_initiation_date", "report_day"]
+    ).stream()
+    batch = _firestore_client.batch()
+    pending = changed = 0
+    for doc in docs:
+        data = doc.to_dict() or {}
+        report_date = data.get("report_date")
+        initiation_date = data.get("recall_initiation_date")
+        migrated = _migrated_dates(report_date, initiation_date)
+        if migrated == (report_date, initiation_date, data.get("report_day")):
+            continue
+        batch.update(doc.reference, {
+            "report_date": migrated[0],
+            "recall_initiation_date": migrated[1],
+            "report_day": migrated[2],
+        })
+        pending += 1
+        changed += 1
+        # Firestore caps a write batch at 500 operations.
+        if pending >= 400:
+            batch.commit()
+            batch = _firestore_client.batch()
+            pending = 0
+    if pending:
+        batch.commit()
+    return changed
+
+
+def _firestore_backfill_query_keys() -> int:
+    """Add the list-filter fields (and external_id) to documents that predate them."""
+    _init_firestore()
+    docs = _firestore_client.collection("recalls").select(
+        ["source", "status", "external_id", "source_key", "source_family", "status_key"]
+    ).stream()
+    batch = _firestore_client.batch()
+    pending = changed = 0
+    for doc in docs:
+        data = doc.to_dict() or {}
+        update = {
+            name: value
+            for name, value in {
+                **_firestore_query_keys(data.get("source"), data.get("status")),
+                "external_id": doc.id,
+            }.items()
+            if data.get(name) != value
+        }
+        if not update:
+            continue
+        batch.update(doc.reference, update)
+        pending += 1
+        changed += 1
+        if pending >= _FIRESTORE_BATCH:
+            batch.commit()
+            batch = _firestore_client.batch()
+            pending = 0
+    if pending:
+        batch.commit()
+    return changed
+
+
+def _firestore_backfill_dedupe_keys() -> int:
+    """Set dedupe_key on every document and list only the first of each key.
+
+    Documents stream in id order, so the document kept is the one the
+    in-memory dedupe used to keep.
+    """
+    _init_firestore()
+    docs = _firestore_client.collection("recalls").select(
+        ["recall_number", "url", "product_description", "reason_for_recall", "company_name", "dedupe_key", "listed"]
+    ).stream()
+    seen: set = set()
+    batch = _firestore_client.batch()
+    pending = changed = 0
+    for doc in docs:
+        data = doc.to_dict() or {}
+        key = _canonical_record_key(data)
+        update = {"dedupe_key": key, "listed": key not in seen}
+        seen.add(key)
+        if all(data.get(name) == value for name, value in update.items()):
+            continue
+        batch.update(doc.reference, update)
+        pending += 1
+        changed += 1
+        if pending >= _FIRESTORE_BATCH:
+            batch.commit()
+            batch = _firestore_client.batch()
+            pending = 0
+    if pending:
+        batch.commit()
+    return changed
+
+
+# name -> (sqlite migration, firestore migration), applied in order.
+_MIGRATIONS = {
+    "recall_dates_v1": (_sqlite_backfill_recall_dates, _firestore_backfill_recall_dates),
+    # Firestore has no full-text index; its search stays Python-side.
+    "recall_search_v1": (_sqlite_backfill_search, lambda: 0),
+    "recall_query_keys_v1": (lambda: 0, _firestore_backfill_query_keys),
+    # Firestore document ids are already unique per recall number.
+    "recall_unique_numbers_v1": (_sqlite_merge_duplicate_recalls, lambda: 0),
+    # SQL dedupes at write time on recall_number; Firestore lists one
+    # document per canonical recall key.
+    "recall_dedupe_keys_v1": (lambda: 0, _firestore_backfill_dedupe_keys),
+}
+
+
+def _run_migrations() -> None:
+    applied = get_fetch_state(_MIGRATIONS_KEY) or {}
+    for name, (sqlite_migration, firestore_migration) in _MIGRATIONS.items():
+        if name in applied:
+            continue
+        migration = firestore_migration if STORE_BACKEND == "firebase" else sqlite_migration
+        changed = migration()
+        logger.info("Applied store migration %s (%d records changed)", name, changed)
+        applied[name] = datetime.utcnow().isoformat()
+        set_fetch_state(_MIGRATIONS_KEY, applied)
+
+
+# ---------- Known-key index ----------
+# In-memory set of stored recall keys (the value save_if_new stores as
+# recall_number / Firestore doc id) so incremental crawls can tell whether a
+# page holds anything new without a database round trip per entry.  Seeded
+# lazily from the store and updated on every insert.  KNOWN_KEYS_BLOOM=true
+# swaps the set for a Bloom filter to bound memory on very large stores.
+KNOWN_KEYS_BLOOM = os.getenv("KNOWN_KEYS_BLOOM", "false").lower() in ("1", "true", "yes")
+KNOWN_KEYS_BLOOM_CAPACITY = int(os.getenv("KNOWN_KEYS_BLOOM_CAPACITY", "200000"))
+KNOWN_KEYS_BLOOM_ERROR_RATE = float(os.getenv("KNOWN_KEYS_BLOOM_ERROR_RATE", "0.001"))
+
+_known_keys = None  # set[str] | _BloomFilter, built on first use
+_known_keys_lock = threading.Lock()
+
+
+class _BloomFilter:
+    """Minimal Bloom filter over strings (no false negatives, rare false positives)."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: str):
+        digest = hashlib.sha256(value.encode("utf-8")).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:16], "big") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, value: str) -> None:
+        for pos in self._positions(value):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+
+def _store_key(record: Dict[str, Any]) -> str:
+    """Key a record is stored under — mirrors save_if_new's recall_number choice."""
+    return _norm_recall_number(record.get("recall_number")) or _fallback_id(record)
+
+
+def _iter_stored_keys():
+    if STORE_BACKEND == "firebase":
+        _init_firestore()
+        docs = _firestore_client.collection("recalls").select(["recall_number", "external_id"]).stream()
+        for doc in docs:
+            data = doc.to_dict() or {}
+            key = data.get("recall_number") or data.get("external_id")
+            if key:
+                yield key
+    else:
+        with Session(_engine) as sess:
+            yield from sess.exec(select(Recall.recall_number))
+
+
+def load_known_keys() -> int:
+    """(Re)build the known-key index from the store; returns the key count."""
+    global _known_keys
+    keys = _BloomFilter(KNOWN_KEYS_BLOOM_CAPACITY, KNOWN_KEYS_BLOOM_ERROR_RATE) if KNOWN_KEYS_BLOOM else set()
+    count = 0
+    for key in _iter_stored_keys():
+        keys.add(key)
+        count += 1
+    with _known_keys_lock:
+        _known_keys = keys
+    logger.info("Known-key index loaded with %d keys (%s)", count, "bloom" if KNOWN_KEYS_BLOOM else "set")
+    return count
+
+
+def _remember_key(key: str) -> None:
+    with _known_keys_lock:
+        if _known_keys is not None:
+            _known_keys.add(key)
+
+
+def is_known_recall(record: Dict[str, Any]) -> bool:
+    """True if ``record`` is (very likely, with the Bloom filter) already stored."""
+    if _known_keys is None:
+        load_known_keys()
+    return _store_key(record) in _known_keys
+
+
 # ---------- Public API ----------
 def init_db() -> None:
     if STORE_BACKEND == "firebase":
         _init_firestore()
     else:
         _sqlite_init_db()
+    _run_migrations()
+    missing = missing_indexes()
+    if missing:
+        logger.warning("Recall table is missing indexes: %s", ", ".join(missing))
 
 def save_if_new(record: dict):
     if STORE_BACKEND == "firebase":
-        return _firestore_save_if_new(record)
-    return _sqlite_save_if_new(record)
+        saved = _firestore_save_if_new(record)
+    else:
+        saved = _sqlite_save_if_new(record)
+    if saved:
+        _remember_key(_store_key(record))
+    return saved
+
+
+def save_many(records: list[dict]) -> list[tuple[dict, Optional[int]]]:
+    """Save a batch of records, skipping ones already stored.
+
+    Returns ``(record, row id)`` for every record that was new, in batch
+    order; the id is None on Firestore.  The batch is deduped in memory,
+    checked against the store in bulk and written in one transaction (one
+    write batch per 400 documents on Firestore), which is far faster than
+    ``save_if_new`` per record.
+    """
+    if not records:
+        return []
+    if STORE_BACKEND == "firebase":
+        saved = _firestore_save_many(records)
+    else:
+        saved = _sqlite_save_many(records)
+    for record, _ in saved:
+        _remember_key(_store_key(record))
+    return saved
+
+
+def get_fetch_state(key: str) -> Optional[Dict[str, Any]]:
+    """Load persisted fetcher state (e.g. per-category watermarks) by key."""
+    if STORE_BACKEND == "firebase":
+        return _firestore_get_fetch_state(key)
+    return _sqlite_get_fetch_state(key)
+
+
+def set_fetch_state(key: str, value: Dict[str, Any]) -> None:
+    """Persist fetcher state under ``key``, replacing any previous value."""
+    if STORE_BACKEND == "firebase":
+        _firestore_set_fetch_state(key, value)
+    else:
+        _sqlite_set_fetch_state(key, value)
 
 
 def cleanup() -> None:
@@ -368,15 +1219,104 @@ def cleanup() -> None:
     # SQLite engine doesn't require explicit cleanup
 
 
-def get_all_recalls(
-    skip: int = 0,
+def _sql_filters(source: Optional[str], status: Optional[str]) -> list:
+    """SQL conditions for the ``source`` / ``status`` list filters.
+
+    Mirrors _source_matches / _status_matches.  Canonical source filters
+    (FDA/USDA) match every variant by prefix, written as a range so the
+    source indexes apply.
+    """
+    conditions = []
+    if source:
+        src_upper = source.strip().upper()
+        if src_upper in {"FDA", "USDA"}:
+            conditions += [Recall.source >= src_upper, Recall.source < src_upper[:-1] + chr(ord(src_upper[-1]) + 1)]
+        else:
+            conditions.append(Recall.source == src_upper)
+    if status:
+        conditions.append(Recall.status.in_(_status_filter_values(status)))
+    return conditions
+
+
+def _firestore_filtered(source: Optional[str], status: Optional[str]):
+    """Firestore query for the ``source`` / ``status`` list filters.
+
+    Firestore cannot order by report_day after a range filter on another
+    field, so the filters compare the normalized equality fields written by
+    _firestore_query_keys; firestore.indexes.json has the composite indexes.
+    Duplicates of a listed recall (same dedupe_key) are left out.
+    """
+    query = _firestore_client.collection("recalls").where("listed", "==", True)
+    if source:
+        src_upper = source.strip().upper()
+        if src_upper in {"FDA", "USDA"}:
+            query = query.where("source_family", "==", src_upper)
+        else:
+            query = query.where("source_key", "==", src_upper)
+    if status:
+        values = _status_filter_values(status)
+        query = query.where("status_key", "in", values) if len(values) > 1 else query.where("status_key", "==", values[0])
+    return query
+
+
+def _firestore_search(source: Optional[str], status: Optional[str], q: str) -> list[Dict[str, Any]]:
+    """Filtered recalls matching ``q``; Firestore has no text index, so this streams."""
+    records = [doc.to_dict() for doc in _firestore_filtered(source, status).stream()]
+    return [r for r in records if _record_matches(r, None, None, q)]
+
+
+def _encode_cursor(day: int, key: Any, sort: str) -> str:
+    raw = json.dumps([day, key, sort], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort: str, key_type: type) -> tuple[int, Any]:
+    """(report_day, key) a cursor points after; ValueError if it is not valid here."""
+    try:
+        day, key, cursor_sort = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if cursor_sort != sort or not isinstance(day, int) or not isinstance(key, key_type):
+        raise ValueError("Cursor does not belong to this listing")
+    return day, key
+
+
+def _firestore_sort_key(record: Dict[str, Any]) -> tuple[int, str]:
+    return record.get("report_day") or 0, record.get("external_id") or ""
+
+
+def _firestore_page_in_memory(
+    records: list[Dict[str, Any]], limit: int, sort: str, cursor: Optional[str], skip: int
+) -> tuple[list, Optional[str]]:
+    """Page already-fetched Firestore records the way the pushed-down query does."""
+    reverse = sort != "oldest"
+    ordered = sorted(records, key=_firestore_sort_key, reverse=reverse)
+    if cursor:
+        after = _decode_cursor(cursor, sort, str)
+        ordered = [r for r in ordered if (_firestore_sort_key(r) < after if reverse else _firestore_sort_key(r) > after)]
+        skip = 0
+    page = ordered[skip: skip + limit + 1]
+    more = len(page) > limit
+    page = page[:limit]
+    return page, _encode_cursor(*_firestore_sort_key(page[-1]), sort) if more else None
+
+
+def get_recalls_page(
     limit: int = 20,
     source: Optional[str] = None,
     status: Optional[str] = None,
     q: Optional[str] = None,
     sort: str = "latest",
-) -> list:
-    """Get paginated list of recalls from storage.
+    cursor: Optional[str] = None,
+    skip: int = 0,
+) -> tuple[list, Optional[str]]:
+    """One page of recalls and the cursor of the next page (None on the last).
+
+    Pages are ordered by (report_day, id).  With ``cursor`` — the value a
+    previous call returned for the same filters and sort — the page starts
+    right after the previous page's last record with an indexed keyset seek,
+    so deep pages cost the same as the first; ``skip`` is then ignored.
+    Raises ValueError for a malformed or mismatched cursor.
 
     Args:
         sort: ``"latest"`` (default) — newest date first;
@@ -385,74 +1325,97 @@ def get_all_recalls(
     reverse = sort != "oldest"
 
     if STORE_BACKEND == "firebase":
-        query = _firestore_client.collection("recalls")
-        docs = query.stream()
-        all_records = [doc.to_dict() for doc in docs]
-        filtered = [
-            r for r in all_records
-            if _record_matches(r, source=source, status=status, q=q)
-        ]
-        deduped = _dedupe_records(filtered)
-        ordered = sorted(deduped, key=_recall_sort_key, reverse=reverse)
-        return ordered[skip: skip + limit]
+        from firebase_admin import firestore
+
+        if q:
+            return _firestore_page_in_memory(_firestore_search(source, status, q), limit, sort, cursor, skip)
+        # Filters, order, cursor and limit run in Firestore, so a page reads
+        # limit + 1 documents (external_id equals the document id;
+        # duplicates are excluded by the ``listed`` flag).
+        direction = firestore.Query.DESCENDING if reverse else firestore.Query.ASCENDING
+        query = (
+            _firestore_filtered(source, status)
+            .order_by("report_day", direction=direction)
+            .order_by("external_id", direction=direction)
+        )
+        if cursor:
+            day, key = _decode_cursor(cursor, sort, str)
+            query = query.start_after({"report_day": day, "external_id": key})
+        elif skip:
+            query = query.offset(skip)
+        page = [doc.to_dict() for doc in query.limit(limit + 1).stream()]
+        more = len(page) > limit
+        page = page[:limit]
+        last = page[-1] if more else None
+        return page, _encode_cursor(*_firestore_sort_key(last), sort) if last else None
     else:
+        from sqlalchemy import tuple_
+
+        # Dates are canonical at ingest and text search runs on the search
+        # index, so filtering, ordering (indexed report_day) and paging all
+        # happen in SQL over the whole table.
         with Session(_engine) as sess:
+            stmt = select(Recall).where(*_sql_filters(source, status))
             if q:
-                # Text search requires Python-side spaceless/CamelCase matching.
-                # Load only the most recent 5 000 records to bound memory usage.
-                base_stmt = select(Recall).order_by(Recall.id.desc()).limit(5000)
-                recalls = sess.exec(base_stmt).all()
-                all_records = [r.model_dump() for r in recalls]
-                filtered = [
-                    r for r in all_records
-                    if _record_matches(r, source=source, status=status, q=q)
-                ]
-                deduped = _dedupe_records(filtered)
-                ordered = sorted(deduped, key=_recall_sort_key, reverse=reverse)
-                return ordered[skip: skip + limit]
+                stmt = stmt.where(_sql_search(q))
+            if cursor:
+                after = tuple_(*_decode_cursor(cursor, sort, int))
+                position = tuple_(Recall.report_day, Recall.id)
+                stmt = stmt.where(position < after if reverse else position > after)
+            elif skip:
+                stmt = stmt.offset(skip)
+            if reverse:
+                stmt = stmt.order_by(Recall.report_day.desc(), Recall.id.desc())
             else:
-                # No text search — use two-phase query so we can sort by actual
-                # recall date (mixed string formats) in Python without loading
-                # full rows, then fetch only the page's records from SQL.
-                # Phase 1: load lightweight sort/filter columns only.
-                sort_stmt = select(
-                    Recall.id,
-                    Recall.report_date,
-                    Recall.recall_initiation_date,
-                )
-                if source:
-                    src_upper = source.strip().upper()
-                    if src_upper in {"FDA", "USDA"}:
-                        sort_stmt = sort_stmt.where(Recall.source.like(f"{src_upper}%"))
-                    else:
-                        sort_stmt = sort_stmt.where(Recall.source == src_upper)
-                if status:
-                    status_upper = status.strip().upper()
-                    if status_upper == "ACTIVE":
-                        sort_stmt = sort_stmt.where(Recall.status.in_(["ACTIVE", "ONGOING"]))
-                    elif status_upper == "INACTIVE":
-                        sort_stmt = sort_stmt.where(Recall.status.in_(["CLOSED", "TERMINATED", "COMPLETED"]))
-                    else:
-                        sort_stmt = sort_stmt.where(Recall.status == status_upper)
-                rows = sess.exec(sort_stmt).all()
-                # Sort by parsed recall date in Python (handles all mixed formats).
-                rows_sorted = sorted(
-                    rows,
-                    key=lambda r: (
-                        _parse_recall_date(r[1]) or _parse_recall_date(r[2]) or datetime.min,
-                        r[0],
-                    ),
-                    reverse=reverse,
-                )
-                page_ids = [r[0] for r in rows_sorted[skip: skip + limit]]
-                if not page_ids:
-                    return []
-                # Phase 2: fetch full records for this page only.
-                full_recalls = sess.exec(
-                    select(Recall).where(Recall.id.in_(page_ids))
-                ).all()
-                id_to_record = {r.id: r.model_dump() for r in full_recalls}
-                return [id_to_record[pid] for pid in page_ids if pid in id_to_record]
+                stmt = stmt.order_by(Recall.report_day, Recall.id)
+            # One extra row tells whether another page follows.
+            recalls = sess.exec(stmt.limit(limit + 1)).all()
+            more = len(recalls) > limit
+            recalls = recalls[:limit]
+            next_cursor = _encode_cursor(recalls[-1].report_day, recalls[-1].id, sort) if more else None
+            return [_recall_dict(r) for r in recalls], next_cursor
+
+
+def get_recalls_page_with_total(
+    limit: int = 20,
+    source: Optional[str] = None,
+    status: Optional[str] = None,
+    q: Optional[str] = None,
+    sort: str = "latest",
+    cursor: Optional[str] = None,
+    skip: int = 0,
+) -> tuple[list, Optional[str], int]:
+    """:func:`get_recalls_page` plus :func:`get_recall_count` for the same filters.
+
+    A Firestore text search has to stream the filtered collection (there is
+    no text index), so the page and the total come from a single pass
+    instead of two; everywhere else this is the two indexed queries.
+    """
+    if STORE_BACKEND == "firebase" and q:
+        matches = _firestore_search(source, status, q)
+        page, next_cursor = _firestore_page_in_memory(matches, limit, sort, cursor, skip)
+        return page, next_cursor, len(matches)
+    page, next_cursor = get_recalls_page(
+        limit=limit, source=source, status=status, q=q, sort=sort, cursor=cursor, skip=skip
+    )
+    return page, next_cursor, get_recall_count(source=source, status=status, q=q)
+
+
+def get_all_recalls(
+    skip: int = 0,
+    limit: int = 20,
+    source: Optional[str] = None,
+    status: Optional[str] = None,
+    q: Optional[str] = None,
+    sort: str = "latest",
+) -> list:
+    """Get paginated list of recalls from storage (see :func:`get_recalls_page`).
+
+    Args:
+        sort: ``"latest"`` (default) — newest date first;
+              ``"oldest"`` — oldest date first.
+    """
+    return get_recalls_page(limit=limit, source=source, status=status, q=q, sort=sort, skip=skip)[0]
 
 
 def get_recall_by_id(recall_id: int) -> Optional[dict]:
@@ -463,7 +1426,7 @@ def get_recall_by_id(recall_id: int) -> Optional[dict]:
 
     with Session(_engine) as sess:
         recall = sess.get(Recall, recall_id)
-        return recall.model_dump() if recall else None
+        return _recall_dict(recall) if recall else None
 
 
 def get_recall_by_number(recall_number: str) -> Optional[dict]:
@@ -480,7 +1443,7 @@ def get_recall_by_number(recall_number: str) -> Optional[dict]:
 
     with Session(_engine) as sess:
         recall = sess.exec(select(Recall).where(Recall.recall_number == recall_number)).first()
-        return recall.model_dump() if recall else None
+        return _recall_dict(recall) if recall else None
 
 
 def get_recall_count(
@@ -491,45 +1454,18 @@ def get_recall_count(
     """Get total number of recalls in storage."""
     # Use identical filtering semantics for both backends.
     if STORE_BACKEND == "firebase":
-        query = _firestore_client.collection("recalls")
-        docs = query.stream()
-        all_records = [doc.to_dict() for doc in docs]
-        filtered = [
-            r for r in all_records
-            if _record_matches(r, source=source, status=status, q=q)
-        ]
-        return len(_dedupe_records(filtered))
-    else:
         if q:
-            # Text search still needs Python-side matching.
-            with Session(_engine) as sess:
-                recalls = sess.exec(select(Recall).order_by(Recall.id.desc()).limit(5000)).all()
-                all_records = [r.model_dump() for r in recalls]
-                filtered = [
-                    r for r in all_records
-                    if _record_matches(r, source=source, status=status, q=q)
-                ]
-                return len(_dedupe_records(filtered))
-        else:
-            # No text search — use SQL COUNT.
-            from sqlalchemy import func as sqla_func
-            with Session(_engine) as sess:
-                count_stmt = select(sqla_func.count()).select_from(Recall)
-                if source:
-                    src_upper = source.strip().upper()
-                    if src_upper in {"FDA", "USDA"}:
-                        count_stmt = count_stmt.where(Recall.source.like(f"{src_upper}%"))
-                    else:
-                        count_stmt = count_stmt.where(Recall.source == src_upper)
-                if status:
-                    status_upper = status.strip().upper()
-                    if status_upper == "ACTIVE":
-                        count_stmt = count_stmt.where(Recall.status.in_(["ACTIVE", "ONGOING"]))
-                    elif status_upper == "INACTIVE":
-                        count_stmt = count_stmt.where(Recall.status.in_(["CLOSED", "TERMINATED", "COMPLETED"]))
-                    else:
-                        count_stmt = count_stmt.where(Recall.status == status_upper)
-                return sess.exec(count_stmt).one()
+            return len(_firestore_search(source, status, q))
+        # Server-side count() aggregation: no documents are read back.
+        result = _firestore_filtered(source, status).count().get()
+        return int(result[0][0].value)
+    else:
+        from sqlalchemy import func as sqla_func
+        with Session(_engine) as sess:
+            count_stmt = select(sqla_func.count()).select_from(Recall).where(*_sql_filters(source, status))
+            if q:
+                count_stmt = count_stmt.where(_sql_search(q))
+            return sess.exec(count_stmt).one()
 
 
 def get_cache_updated_at() -> Optional[str]:
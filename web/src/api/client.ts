@@ -92,14 +92,16 @@ export interface MatchResult {
 export async function fetchRecalls(params?: {
   limit?: number;
   offset?: number;
+  cursor?: string;
   source?: string;
   status?: string;
   q?: string;
   sort?: "latest" | "oldest";
-}): Promise<{ total: number; recalls: Recall[]; updated_at: string | null }> {
+}): Promise<{ total: number; recalls: Recall[]; updated_at: string | null; next_cursor: string | null }> {
   const sp = new URLSearchParams();
   if (params?.limit) sp.set("limit", String(params.limit));
   if (params?.offset) sp.set("offset", String(params.offset));
+  if (params?.cursor) sp.set("cursor", params.cursor);
   if (params?.source) sp.set("source", params.source);
   if (params?.status) sp.set("status", params.status);
   if (params?.q) sp.set("q", params.q);
@@ -15,21 +15,23 @@ export default function Dashboard() {
   const [source, setSource] = useState("All");
   const [status, setStatus] = useState("All");
   const [sort, setSort] = useState<"latest" | "oldest">("latest");
-  const [offset, setOffset] = useState(0);
+  // Cursor of every page after the first, so Prev can step back.
+  const [cursors, setCursors] = useState<string[]>([]);
   const [searchInput, setSearchInput] = useState("");
   const [q, setQ] = useState("");
   const LIMIT = 20;
+  const offset = cursors.length * LIMIT;
 
   const handleSearch = useCallback((e: React.FormEvent) => {
     e.preventDefault();
     setQ(searchInput.trim());
-    setOffset(0);
+    setCursors([]);
   }, [searchInput]);
 
   const handleSearchClear = useCallback(() => {
     setSearchInput("");
     setQ("");
-    setOffset(0);
+    setCursors([]);
   }, []);
 
   const STATUSES = [
@@ -44,7 +46,7 @@ export default function Dashboard() {
 
   const params = {
     limit: LIMIT,
-    offset,
+    cursor: cursors[cursors.length - 1],
     source: source !== "All" ? source : undefined,
     status: status !== "All" ? status : undefined,
     sort,
@@ -136,7 +138,7 @@ export default function Dashboard() {
           {SOURCES.map((s) => (
             <button
               key={s}
-              onClick={() => { setSource(s); setOffset(0); }}
+              onClick={() => { setSource(s); setCursors([]); }}
               className={`px-3 py-1.5 rounded-full text-xs font-medium transition-colors
                 ${source === s ? "bg-primary text-white" : "bg-navy-800 text-slate-400 border border-navy-700 hover:border-navy-600 hover:text-white"}`}
             >
@@ -148,7 +150,7 @@ export default function Dashboard() {
           {STATUSES.map((s) => (
             <button
               key={s.value}
-              onClick={() => { setStatus(s.value); setOffset(0); }}
+              onClick={() => { setStatus(s.value); setCursors([]); }}
               className={`px-3 py-1.5 rounded-full text-xs font-medium transition-colors
                 ${status === s.value ? "bg-navy-600 text-white" : "bg-navy-800 text-slate-400 border border-navy-700 hover:border-navy-600 hover:text-white"}`}
             >
@@ -159,7 +161,7 @@ export default function Dashboard() {
         <div className="ml-auto">
           <select
             value={sort}
-            onChange={(e) => { setSort(e.target.value as "latest" | "oldest"); setOffset(0); }}
+            onChange={(e) => { setSort(e.target.value as "latest" | "oldest"); setCursors([]); }}
             className="text-xs border border-navy-700 rounded-full px-3 py-1.5 bg-navy-800 text-slate-400 cursor-pointer hover:border-navy-600 focus:outline-none"
             aria-label="Sort order"
           >
@@ -202,8 +204,8 @@ export default function Dashboard() {
           {/* Pagination */}
           <div className="flex items-center justify-between mt-6 text-sm text-slate-500">
             <button
-              onClick={() => setOffset(Math.max(0, offset - LIMIT))}
-              disabled={offset === 0}
+              onClick={() => setCursors(cursors.slice(0, -1))}
+              disabled={cursors.length === 0}
               className="px-3 py-1.5 border border-navy-700 rounded-lg hover:bg-navy-800 hover:text-white transition-colors disabled:opacity-40"
             >
               {t("dash.prev")}
@@ -212,8 +214,8 @@ export default function Dashboard() {
               {offset + 1}–{Math.min(offset + recalls.length, total)} of {total}
             </span>
             <button
-              onClick={() => setOffset(offset + LIMIT)}
-              disabled={offset + LIMIT >= total}
+              onClick={() => data?.next_cursor && setCursors([...cursors, data.next_cursor])}
+              disabled={!data?.next_cursor}
               className="px-3 py-1.5 border border-navy-700 rounded-lg hover:bg-navy-800 hover:text-white transition-colors disabled:opacity-40"
             >
               {t("dash.next")}